@@ -0,0 +1,26 @@
+# Importing the fixture server, the client modules and the libraries 'os', 'pytest'
+import os
+import pytest
+import sdg_cache
+import sdg_client
+import sdg_fixture_server
+import sdg_ratelimit
+
+
+# Fixture pointing every test at the local fixture server instead of unstats.un.org
+@pytest.fixture(scope="session", autouse=True)
+def fixture_server(tmp_path_factory):
+    # The disk cache and the rate limiter of the tests are kept apart from the ones of the user
+    sdg_cache.configure(directory=str(tmp_path_factory.mktemp("cache")))
+    sdg_ratelimit.configure(directory=str(tmp_path_factory.mktemp("ratelimit")))
+
+    # ODD_LIVE_TESTS=1 runs the tests against the real UN API
+    if os.environ.get("ODD_LIVE_TESTS") == "1":
+        yield None
+        return
+
+    base_url = sdg_client.config["base_url"]
+    with sdg_fixture_server.FixtureServer() as server:
+        sdg_client.configure(base_url=server.url)
+        yield server
+        sdg_client.configure(base_url=base_url)
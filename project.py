@@ -1,9 +1,15 @@
 # Import necessary libraries
-import requests
-import re
+import sdg_catalog
+import sdg_cli
+import sdg_client
+import sdg_geo
+import sdg_export
+import sdg_prefetch
+import sdg_render
+import sys
+from sdg_tables import (get_sdg_goals_and_targets, get_geographic_areas, get_geographic_area_code,
+                        get_indicator_data, get_sdg_series, remove_unnecessary_columns)
 from tabulate import tabulate
-import csv
-import textwrap
 
 
 # Main function to display the main menu and prompt user input
@@ -22,215 +28,80 @@ def main():
     4- Find the Value of an Indicator for a Country or a GeA
         """
     )
+    sdg_prefetch.start()  # The catalogs are downloaded while the user reads the menu
     handle_user_choice()
 
 
-# Data retrieval functions section
-
-# Function to retrieve and display SDG goals and targets
-def get_sdg_goals_and_targets():
-    """
-    Retrieves and returns the list of SDG goals and targets via the UN API.
-    Formats the data by adding line breaks for long titles.
-    """
-    base_url = "https://unstats.un.org/sdgs/UNSDGAPIV5/v1/sdg/Goal/List?includechildren=true"
-    response = requests.get(base_url)
-    goals_targets_list = []
-
-    if response.status_code == 200:
-        data = response.json()
-        number = 0
-
-        if data:
-            for goal in data:
-                for target in goal["targets"]:
-                    goal_target = {}
-                    number += 1
-                    goal_target["No."] = number
-                    goal_target["Goal Code"] = goal["code"]
-                    goal_target["Goal Title"] = '\n'.join(
-                        textwrap.wrap(goal["title"], width=20))  # Line break every 20 characters
-                    goal_target["Target Code"] = target["code"]
-                    goal_target["Target Title"] = '\n'.join(textwrap.wrap(target["title"], width=20))
-                    goals_targets_list.append(goal_target)
-            return tuple(goals_targets_list)
-
-    else:
-        print(f"Error {response.status_code}: {response.text}")
-        return None
-
-
-# Function to retrieve the list of geographic areas
-def get_geographic_areas():
-    """
-    Retrieves the list of geographic areas via the UN API and formats the area names with line breaks.
-    """
-    base_url = "https://unstats.un.org/sdgs/UNSDGAPIV5/v1/sdg/GeoArea/List"
-    response = requests.get(base_url)
-
-    if response.status_code == 200:
-        geo_area_list = response.json()
-        for area_dict in geo_area_list:
-            area_dict['geoAreaName'] = '\n'.join(textwrap.wrap(area_dict['geoAreaName'], width=30))
-        return geo_area_list
-    else:
-        print(f"Error {response.status_code} : {response.text}")
-        return None
-
-
-# Function to retrieve the geographic area code based on the country name
-def get_geographic_area_code(country_name: str):
-    """
-    Retrieves the geographic area code for a given country name via the UN API.
-    """
-    base_url = "https://unstats.un.org/sdgs/UNSDGAPIV5/v1/sdg/GeoArea/List"
-    response = requests.get(base_url)
-
-    if response.status_code == 200:
-        geo_area_list = response.json()
-        country_name = country_name.strip()
-
-        for geo_area in geo_area_list:
-            if country_name == geo_area["geoAreaName"]:
-                return str(geo_area["geoAreaCode"])
-
-        print("Invalid country name")
-    else:
-        print(f"Error {response.status_code} : {response.text}")
-        return str(1)
-
-
-# Function to retrieve indicator data for a given geographic area
-def get_indicator_data(indicator_code: str, area_code: str):
-    """
-    Retrieves specific indicator data for a given geographic area via the UN API.
-    """
-    base_url = "https://unstats.un.org/sdgs/UNSDGAPIV5/v1/sdg/Indicator/Data"
-    params = {
-        "indicator": indicator_code,
-        "areaCode": area_code,
-    }
-
-    response = requests.get(base_url, params=params)
-
-    if response.status_code == 200:
-        data = response.json()
-        return data
-    else:
-        print(f"Error {response.status_code} : {response.text}")
-        return None
-
-
-# Function to retrieve the list of SDG series
-def get_sdg_series():
-    """
-    Retrieves and returns the list of SDG indicator series via the UN API.
-    """
-    base_url = "https://unstats.un.org/sdgs/UNSDGAPIV5/v1/sdg/Indicator/List"
-    response = requests.get(base_url)
-    sdg_series_list = []
-    global number
-    number = 0
-
-    if response.status_code == 200:
-        indicators_list = response.json()
-
-        for indicator in indicators_list:
-            for series in indicator["series"]:
-                number += 1
-                serie = {}
-                serie["Number"] = number
-                serie["Series Code"] = series["code"]
-                serie["Description"] = '\n'.join(textwrap.wrap(series["description"], 50))
-                serie["Goal"] = ", ".join(series["goal"])
-                serie["Targets"] = ", ".join(series["target"])
-                serie["Indicators"] = ", ".join(series["indicator"])
-                serie["Version"] = series["release"]
-                sdg_series_list.append(serie)
-        return sdg_series_list
-    else:
-        print(f"Error {response.status_code} : {response.text}")
-        return None
-
-
 # Display functions section
 
 # Function to display the list of SDG goals and targets
-def display_goals_and_targets():
+def display_goals_and_targets(goal: str = None, target: str = None, limit: int = None, offset: int = 0,
+                              page_size: int = None):
     """
-    Displays the list of SDG goals and targets in a table format.
+    Displays the list of SDG goals and targets in a table format, with a line break every 20 characters in titles.
+    The rows can be filtered by goal or target code, limited, and shown page by page.
     """
     print("\nList of SDG Goals and Targets")
-    print(tabulate(get_sdg_goals_and_targets(), headers="keys", tablefmt="grid"))
+    sdg_render.print_table(get_sdg_goals_and_targets(), {"Goal Title": 20, "Target Title": 20},
+                           {"Goal Code": goal, "Target Code": target}, limit, offset, page_size)
 
 
 # Function to display the list of SDG series
-def display_sdg_series():
+def display_sdg_series(goal: str = None, target: str = None, limit: int = None, offset: int = 0,
+                       page_size: int = None):
     """
-    Displays the list of SDG series in a table format.
+    Displays the list of SDG series in a table format, with a line break every 50 characters in descriptions.
+    The rows can be filtered by goal or target code, limited, and shown page by page.
     """
     print("\nList of SDG Series")
-    print(tabulate(get_sdg_series(), headers="keys", tablefmt="grid"))
+    sdg_render.print_table(get_sdg_series(), {"Description": 50}, {"Goal": goal, "Targets": target},
+                           limit, offset, page_size)
 
 
 # Function to display the list of geographic area codes
-def display_geographic_areas():
+def display_geographic_areas(limit: int = None, offset: int = 0, page_size: int = None):
     """
-    Displays the list of geographic areas and their codes in a table format.
+    Displays the list of geographic areas and their codes in a table format, with a line break every 30 characters.
+    The rows can be limited and shown page by page.
     """
     print("\nList of SDG Geographic Areas")
-    print(tabulate(get_geographic_areas(), headers="keys", tablefmt="grid"))
+    sdg_render.print_table(get_geographic_areas(), {"geoAreaName": 30}, None, limit, offset, page_size)
 
 
 # User interaction functions section
 
-# Function to remove unnecessary columns
-def remove_unnecessary_columns(dict_list: list):
-    """
-    Removes unnecessary items (column in tabulate) from a list of dictionaries.
-    """
-    new_list = []
-    keys_to_remove = ['goal', 'target', 'geoAreaCode', 'geoAreaName', 'valueType', 'time_detail', 'upperBound',
-                      'lowerBound', 'geoInfoUrl']
-    for element_dict in dict_list:
-        new_dict = {k: v for k, v in element_dict.items() if k not in keys_to_remove}
-        new_list.append(new_dict)
-    return new_list
-
-
 # Function to find an SDG indicator value for a country
 def find_country_indicator_value():
     """
     Allows finding an SDG indicator value for a given geographic area by interacting with the user.
     """
-    areas = [geo_area["geoAreaName"] for geo_area in get_geographic_areas()]
-    area_codes = [geo_area["geoAreaCode"] for geo_area in get_geographic_areas()]
+    geo_area_index = sdg_geo.get_geo_area_index()
+    if geo_area_index is None:
+        raise sdg_client.SDGAPIError("GeoArea/List", None, "the list of geographic areas could not be retrieved")
+    indicator_catalog = sdg_catalog.get_indicator_catalog()  # Preloaded by the menu, or downloaded once
 
     while True:
         try:
-            pattern = r"^([1-9]{1,2}|10)\.([1-9]{1,2}|[a-d]{1}|10)\.([1-9]{1,2})$"
-            area = input("Name of geographic area / Area code: ").strip().title()
-            indicator = input("Indicator code (#.#.#): ").strip()
-            match = re.fullmatch(pattern, indicator, re.IGNORECASE)
-
-            if (match is not None) and (area in areas or area in area_codes):
-                area_code = area if area.isnumeric() else get_geographic_area_code(area)
+            area = input("Name of geographic area / Area code: ").strip()
+            indicator_entry = input("Indicator code (#.#.#): ").strip()
+            indicator = indicator_catalog.get_code(indicator_entry)  # Checked against the real Indicator list
+            while indicator is None:  # Only the indicator is asked again, the area is kept
+                suggestions = indicator_catalog.complete(indicator_entry, limit=10) if indicator_entry else []
+                print(f"Unknown indicator code, did you mean: {', '.join(suggestions)}?" if suggestions
+                      else "Unknown indicator code")
+                indicator_entry = input("Indicator code (#.#.#): ").strip()
+                indicator = indicator_catalog.get_code(indicator_entry)
+            area_code = geo_area_index.get_code(area)  # Name, alias or code, resolved without downloading
+
+            if area_code is not None:
+                series_codes = [series["code"] for series in indicator_catalog.get_series(indicator)]
+                print(f"Series of indicator {indicator}: {', '.join(series_codes)}")
                 data = get_indicator_data(indicator, area_code)
 
                 if len(data["data"]) > 0:
                     print(f"\nIndicator No. {indicator} for {data['data'][0]['geoAreaName']} ({data['data'][0]['geoAreaCode']})")
-                    for d in data['data']:
-                        d['seriesDescription'] = '\n'.join(textwrap.wrap(d['seriesDescription'], width=22))  # Formats and limits to 15 characters per line for better readability
-                        d['source'] = '\n'.join(textwrap.wrap(d['source'], width=15))
-                        d['footnotes'] = '\n'.join(textwrap.wrap(' '.join(d['footnotes']), width=20))
-
-                        # Formats and limits dimensions to 15 characters per line for better readability
-                        tab_of_dimensions = []
-                        for element in d['dimensions']:
-                            tab_of_dimensions.append(f'{element}: {d["dimensions"][element]}')
-                        d['dimensions'] = '\n'.join(textwrap.wrap(' '.join(tab_of_dimensions), width=15))
-
-                    filtered_data = remove_unnecessary_columns(data['data'])
+                    display_data = sdg_render.wrap_indicator_data(data['data'])  # Copies, the export keeps raw values
+                    filtered_data = remove_unnecessary_columns(display_data)
                     print(tabulate(filtered_data, headers="keys", tablefmt="grid"))
                     export = input("Do you want to export to CSV? (y/n): ").strip().lower()[:1]
                     if export == "y":
@@ -253,13 +124,9 @@ def find_country_indicator_value():
 def export_to_csv(dict_list: list, area_name: str, indicator: str):
     """
     Exports a list of dictionaries to a CSV file.
+    The columns are the union of the keys of every dictionary.
     """
-    fieldnames = dict_list[0].keys()
-    with open(f'{area_name}_{indicator}.csv', 'w') as file:
-        writer = csv.DictWriter(file, fieldnames=fieldnames, delimiter=';', lineterminator='\n')
-        writer.writeheader()
-        for dic in dict_list:
-            writer.writerow(dic)
+    sdg_export.export_records_to_csv(dict_list, f'{area_name}_{indicator}.csv')
 
 
 # Function that handles user choices from the menu
@@ -271,13 +138,13 @@ def handle_user_choice():
         try:
             menu_choice = int(input("Choose an option (1-4): "))
             if menu_choice == 1:
-                display_goals_and_targets()
+                display_goals_and_targets(page_size=sdg_render.terminal_page_size())
                 break
             elif menu_choice == 2:
-                display_geographic_areas()
+                display_geographic_areas(page_size=sdg_render.terminal_page_size())
                 break
             elif menu_choice == 3:
-                display_sdg_series()
+                display_sdg_series(page_size=sdg_render.terminal_page_size())
                 break
             elif menu_choice == 4:
                 find_country_indicator_value()
@@ -286,7 +153,13 @@ def handle_user_choice():
                 print("Invalid choice. Please choose between 1 and 4.")
         except ValueError:
             print("Invalid entry. Please enter a number.")
+        except sdg_client.SDGAPIError as e:
+            print(f"The UN API is unavailable, please try again later ({e})")
+            break
 
 
 if __name__ == "__main__":
+    # With arguments, runs a command of the non-interactive interface (python project.py data --indicator ...)
+    if len(sys.argv) > 1:
+        sys.exit(sdg_cli.main())
     main()
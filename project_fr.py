@@ -1,9 +1,14 @@
 # Importation des bibliothèques nécessaires
-import requests
-import re
+import sdg_catalog
+import sdg_cli
+import sdg_client
+import sdg_data
+import sdg_geo
+import sdg_export
+import sdg_prefetch
+import sdg_render
+import sys
 from tabulate import tabulate
-import csv
-import textwrap
 
 
 # Fonction principale pour afficher le menu principal et demander l'entrée utilisateur
@@ -22,6 +27,7 @@ def main():
     4- Trouver la valeur d'un indicateur pour un pays
         """
     )
+    sdg_prefetch.start()  # Les catalogues sont téléchargés pendant que l'utilisateur lit le menu
     gestion_choix_utilisateur()
 
 
@@ -31,10 +37,9 @@ def main():
 def recuperer_objectifs_et_cibles():
     """
     Récupère et renvoie la liste des objectifs et des cibles ODD via l'API de l'ONU.
-    Formate les données en ajoutant des sauts de lignes dans les titres longs.
+    Les titres sont renvoyés tels quels, les sauts de ligne sont ajoutés par les fonctions d'affichage.
     """
-    base_url = "https://unstats.un.org/sdgs/UNSDGAPIV5/v1/sdg/Goal/List?includechildren=true"
-    response = requests.get(base_url)
+    response = sdg_client.get("Goal/List", params={"includechildren": "true"})
     list_goals_targets = []
 
     if response.status_code == 200:
@@ -48,10 +53,9 @@ def recuperer_objectifs_et_cibles():
                     numero += 1
                     dict["N°"] = numero
                     dict["Code objectif"] = goal["code"]
-                    dict["Titre objectif"] = '\n'.join(
-                        textwrap.wrap(goal["title"], width=20))  # Retour à la ligne tous les 20 caractères
+                    dict["Titre objectif"] = goal["title"]
                     dict["Code cible"] = target["code"]
-                    dict["Titre cible"] = '\n'.join(textwrap.wrap(target["title"], width=20))
+                    dict["Titre cible"] = target["title"]
                     list_goals_targets.append(dict)
             return tuple(list_goals_targets)
 
@@ -63,16 +67,12 @@ def recuperer_objectifs_et_cibles():
 # Fonction pour récupérer la liste des zones géographiques
 def recuperer_zones_geographiques():
     """
-    Récupère la liste des zones géographiques via l'API de l'ONU et formate les noms des zones avec des sauts de ligne.
+    Récupère la liste des zones géographiques via l'API de l'ONU, avec leurs noms tels quels.
     """
-    base_url = "https://unstats.un.org/sdgs/UNSDGAPIV5/v1/sdg/GeoArea/List"
-    reponse = requests.get(base_url)
+    reponse = sdg_client.get("GeoArea/List")
 
     if reponse.status_code == 200:
-        list_geo_area = reponse.json()
-        for dico_area in list_geo_area:
-            dico_area['geoAreaName'] = '\n'.join(textwrap.wrap(dico_area['geoAreaName'], width=30))
-        return list_geo_area
+        return reponse.json()
     else:
         print(f"Erreur {reponse.status_code} : {reponse.text}")
         return None
@@ -81,40 +81,38 @@ def recuperer_zones_geographiques():
 # Fonction pour récupérer le code de la zone géographique à partir du nom du pays
 def get_geographic_area_code(nom_pays: str):
     """
-    Récupère le code de la zone géographique correspondant au nom d'un pays donné via l'API de l'ONU.
+    Récupère le code de la zone géographique correspondant au nom d'un pays, à un alias ou à un code
+    grâce à l'index des zones géographiques, qui télécharge la liste GeoArea une seule fois par processus.
+    Lève SDGAPIError si la liste GeoArea ne peut pas être récupérée.
     """
-    base_url = "https://unstats.un.org/sdgs/UNSDGAPIV5/v1/sdg/GeoArea/List"
-    reponse = requests.get(base_url)
+    index_zones = sdg_geo.get_geo_area_index()
 
-    if reponse.status_code == 200:
-        list_geo_area = reponse.json()
-        nom_pays = nom_pays.strip()
-
-        for geo_area in list_geo_area:
-            if nom_pays == geo_area["geoAreaName"]:
-                return str(geo_area["geoAreaCode"])
+    if index_zones is not None:
+        code_zone = index_zones.get_code(nom_pays)
+        if code_zone is not None:
+            return code_zone
 
         print("Nom du pays renseigné est incorrect")
     else:
-        print(f"Erreur {reponse.status_code} : {reponse.text}")
-        return str(1)
+        raise sdg_client.SDGAPIError("GeoArea/List", None, "la liste des zones géographiques est indisponible")
 
 
 # Fonction pour récupérer les données d'un indicateur pour une zone géographique donnée
 def get_indicator_data(code_indicateur: str, code_zone: str):
     """
     Récupère les données d'un indicateur spécifique pour une zone géographique donnée via l'API de l'ONU.
+    Toutes les pages de la réponse sont récupérées, 'data' contient donc tous les enregistrements et pas seulement
+    la première page.
     """
-    base_url = "https://unstats.un.org/sdgs/UNSDGAPIV5/v1/sdg/Indicator/Data"
     params = {
         "indicator": code_indicateur,
         "areaCode": code_zone,
     }
 
-    response = requests.get(base_url, params=params)
+    response = sdg_client.get("Indicator/Data", params=params)
 
     if response.status_code == 200:
-        return response.json()
+        return sdg_data.collect_pages("Indicator/Data", params, response.json())
 
     else:
         print(f"Erreur {response.status_code} : {response.text}")
@@ -126,8 +124,7 @@ def recuperer_series_odd():
     """
     Récupère et renvoie la liste des séries d'indicateurs ODD via l'API de l'ONU.
     """
-    base_url = "https://unstats.un.org/sdgs/UNSDGAPIV5/v1/sdg/Indicator/List"
-    response = requests.get(base_url)
+    response = sdg_client.get("Indicator/List")
     list_indi_series = []
     global numero
     numero = 0
@@ -156,30 +153,38 @@ def recuperer_series_odd():
 # Section des fonctions d'affichage
 
 # Fonction pour afficher la liste des objectifs et cibles ODD
-def afficher_objectifs_et_cibles():
+def afficher_objectifs_et_cibles(objectif: str = None, cible: str = None, limite: int = None, decalage: int = 0,
+                                 taille_page: int = None):
     """
-    Affiche la liste des objectifs et cibles ODD sous forme de tableau.
+    Affiche la liste des objectifs et cibles ODD sous forme de tableau, avec un retour à la ligne tous les 20
+    caractères dans les titres. Les lignes peuvent être filtrées par code d'objectif ou de cible, limitées,
+    et affichées page par page.
     """
     print("\nListe des objectifs et cibles ODD")
-    print(tabulate(recuperer_objectifs_et_cibles(), headers="keys", tablefmt="grid"))
+    sdg_render.print_table(recuperer_objectifs_et_cibles(), {"Titre objectif": 20, "Titre cible": 20},
+                           {"Code objectif": objectif, "Code cible": cible}, limite, decalage, taille_page)
 
 
 # Fonction pour afficher la liste des séries ODD
-def afficher_series_odd():
+def afficher_series_odd(objectif: str = None, cible: str = None, limite: int = None, decalage: int = 0,
+                        taille_page: int = None):
     """
-    Affiche la liste des séries ODD sous forme de tableau.
+    Affiche la liste des séries ODD sous forme de tableau. Les lignes peuvent être filtrées par code d'objectif
+    ou de cible, limitées, et affichées page par page.
     """
     print("\nListe des séries ODD")
-    print(tabulate(recuperer_series_odd(), headers="keys", tablefmt="grid"))
+    sdg_render.print_table(recuperer_series_odd(), None, {"Objectif": objectif, "Cibles": cible},
+                           limite, decalage, taille_page)
 
 
 # Fonction pour afficher la liste des codes des zones géographiques ODD
-def afficher_zones_geographiques():
+def afficher_zones_geographiques(limite: int = None, decalage: int = 0, taille_page: int = None):
     """
-    Affiche la liste des zones géographiques et leurs codes sous forme de tableau.
+    Affiche la liste des zones géographiques et leurs codes sous forme de tableau, avec un retour à la ligne tous les
+    30 caractères. Les lignes peuvent être limitées et affichées page par page.
     """
     print("\nListe des zones géographiques ODD")
-    print(tabulate(recuperer_zones_geographiques(), headers="keys", tablefmt="grid"))
+    sdg_render.print_table(recuperer_zones_geographiques(), {"geoAreaName": 30}, None, limite, decalage, taille_page)
 
 
 # Section des fonctions d'interaction utilisateur
@@ -203,41 +208,38 @@ def trouver_valeur_indicateur_pays():
     """
     Permet de trouver la valeur d'un indicateur ODD pour une zone géographique donnée en interagissant avec l'utilisateur.
     """
-    areas = [geo_area["geoAreaName"] for geo_area in recuperer_zones_geographiques()]
-    areas_codes = [geo_area["geoAreaCode"] for geo_area in recuperer_zones_geographiques()]
+    index_zones = sdg_geo.get_geo_area_index()
+    if index_zones is None:
+        raise sdg_client.SDGAPIError("GeoArea/List", None, "la liste des zones géographiques est indisponible")
+    catalogue_indicateurs = sdg_catalog.get_indicator_catalog()  # Préchargé par le menu, ou téléchargé une fois
 
     while True:
         try:
-            pattern = r"^([1-9]{1,2}|10)\.([1-9]{1,2}|[a-d]{1}|10)\.([1-9]{1,2})$" # Pattern pour valider l'entree des indicateurs
-            area = input("Nom de la zone géographique / Code de la zone : ").strip().title()
-            indicator = input("Code de l'indicateur (#.#.#) : ").strip()
-            match = re.fullmatch(pattern, indicator, re.IGNORECASE)
-
-            if (match is not None) and (area in areas or area in areas_codes):
-                code_zone = area if area.isnumeric() else get_geographic_area_code(area)
+            area = input("Nom de la zone géographique / Code de la zone : ").strip()
+            saisie_indicateur = input("Code de l'indicateur (#.#.#) : ").strip()
+            indicator = catalogue_indicateurs.get_code(saisie_indicateur)  # Vérifié dans la vraie liste des indicateurs
+            while indicator is None:  # Seul l'indicateur est redemandé, la zone est conservée
+                suggestions = catalogue_indicateurs.complete(saisie_indicateur, limit=10) if saisie_indicateur else []
+                print(f"Code d'indicateur inconnu, vouliez-vous dire : {', '.join(suggestions)} ?" if suggestions
+                      else "Code d'indicateur inconnu")
+                saisie_indicateur = input("Code de l'indicateur (#.#.#) : ").strip()
+                indicator = catalogue_indicateurs.get_code(saisie_indicateur)
+            code_zone = index_zones.get_code(area)  # Nom, alias ou code, résolu sans téléchargement
+
+            if code_zone is not None:
+                codes_series = [serie["code"] for serie in catalogue_indicateurs.get_series(indicator)]
+                print(f"Séries de l'indicateur {indicator} : {', '.join(codes_series)}")
                 data = get_indicator_data(indicator, code_zone)
-                data_complet = {k: v for k, v in data.items()}  # Copie de data, afin de l'utiliser lors de l'exportation en CSV sans appliquer la supression des collonnes
 
                 if len(data["data"]) > 0:
                     print(
                         f"\nIndicateur N° {indicator} pour {data['data'][0]['geoAreaName']} ({data['data'][0]['geoAreaCode']})")
-                    for d in data['data']:
-                        d['seriesDescription'] = '\n'.join(textwrap.wrap(d['seriesDescription'], width=22)) #Formatte et limite les dimensions à 15 caractères par ligne pour une meilleure lisibilité d'une chaine
-                        d['source'] = '\n'.join(textwrap.wrap(d['source'], width=15))
-                        d['footnotes'] = '\n'.join(textwrap.wrap(' '.join(d['footnotes']), width=20)) # Formatte et limite les dimensions à 15 caractères par ligne pour une meilleure lisibilité d'une liste de chaines
-
-                        # Formatte et limite les dimensions à 15 caractères par ligne pour une meilleure lisibilité,
-                        # d'une liste de dictionnaires
-                        tab_of_dimensions = []
-                        for element in d['dimensions']:
-                            tab_of_dimensions.append(f'{element}: {d["dimensions"][element]}')
-                        d['dimensions'] = '\n'.join(textwrap.wrap(' '.join(tab_of_dimensions), width=15))
-
-                    data_sans_colonnes = supprimer_colonnes_inutiles(data['data'])  # suprimer les collones encombrants
+                    data_affichage = sdg_render.wrap_indicator_data(data['data'])  # Copies, l'export garde les valeurs brutes
+                    data_sans_colonnes = supprimer_colonnes_inutiles(data_affichage)  # suprimer les collones encombrants
                     print(tabulate(data_sans_colonnes, headers="keys", tablefmt="grid"))
                     export = input("Voulez-vous exporter en fichier CSV ? (y/n): ").strip().lower()[:1]
                     if export == "y":
-                        exporter_en_csv(data_complet['data'], data['data'][0]['geoAreaName'], indicator)
+                        exporter_en_csv(data['data'], data['data'][0]['geoAreaName'], indicator)
                         print("Exporté avec succès")
 
                     accept = input("Voulez-vous essayer à nouveau ? (y/n): ").strip().lower()[:1]
@@ -256,13 +258,9 @@ def trouver_valeur_indicateur_pays():
 def exporter_en_csv(tableau_dicts: list, nom_zone: str, indicateur: str):
     """
     Exporte une liste de dictionnaires en fichier CSV.
+    Les colonnes sont l'union des clés de tous les dictionnaires.
     """
-    fieldnames = tableau_dicts[0].keys()
-    with open(f'{nom_zone}_{indicateur}.csv', 'w') as file:
-        writer = csv.DictWriter(file, fieldnames=fieldnames, delimiter=';', lineterminator='\n')
-        writer.writeheader()
-        for dic in tableau_dicts:
-            writer.writerow(dic)
+    sdg_export.export_records_to_csv(tableau_dicts, f'{nom_zone}_{indicateur}.csv')
 
 
 # Fonction qui gère les choix de l'utilisateur dans le menu
@@ -274,13 +272,13 @@ def gestion_choix_utilisateur():
         try:
             choix_menu = int(input("Choisissez une option (1-4) : "))
             if choix_menu == 1:
-                afficher_objectifs_et_cibles()
+                afficher_objectifs_et_cibles(taille_page=sdg_render.terminal_page_size())
                 break
             elif choix_menu == 2:
-                afficher_zones_geographiques()
+                afficher_zones_geographiques(taille_page=sdg_render.terminal_page_size())
                 break
             elif choix_menu == 3:
-                afficher_series_odd()
+                afficher_series_odd(taille_page=sdg_render.terminal_page_size())
                 break
             elif choix_menu == 4:
                 trouver_valeur_indicateur_pays()
@@ -289,7 +287,13 @@ def gestion_choix_utilisateur():
                 print("Choix invalide. Veuillez choisir entre 1 et 4.")
         except ValueError:
             print("Entrée invalide. Veuillez entrer un nombre.")
+        except sdg_client.SDGAPIError as e:
+            print(f"L'API des Nations Unies est indisponible, veuillez réessayer plus tard ({e})")
+            break
 
 
 if __name__ == "__main__":
+    # Avec des arguments, lance une commande de l'interface non interactive (python project_fr.py data --indicator ...)
+    if len(sys.argv) > 1:
+        sys.exit(sdg_cli.main())
     main()
@@ -0,0 +1,445 @@
+# Import necessary libraries
+import argparse
+import ast
+import concurrent.futures
+import csv
+import functools
+import io
+import itertools
+import json
+import os
+import re
+import sqlite3
+import sys
+import sdg_records
+from sdg_export import open_csv_input, to_float
+from tabulate import tabulate
+
+
+# Name of the index file kept in an export directory
+INDEX_NAME = ".odd_index.sqlite"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    delimiter TEXT NOT NULL,
+    header TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS rows (
+    series TEXT,
+    geoAreaCode TEXT,
+    year INTEGER,
+    file_id INTEGER NOT NULL REFERENCES files (id),
+    offset INTEGER NOT NULL,
+    length INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS rows_series_area_year ON rows (series, geoAreaCode, year);
+CREATE INDEX IF NOT EXISTS rows_file ON rows (file_id);
+"""
+
+# Columns written as Python lists and dictionaries by the CSV exports
+LIST_COLUMNS = ["goal", "target", "indicator", "footnotes"]
+DICT_COLUMNS = ["attributes", "dimensions"]
+
+# Dimension and attribute names of the UN API holding spaces, so that the exports written as they were displayed
+# ('Reporting Type: G Age: 15 to 24') are split on the names and not on the spaces
+DIMENSION_NAMES = ["Reporting Type", "Education level", "Type of skill", "Type of occupation", "Disability status",
+                   "Type of speed", "Type of product", "Type of renewable technology", "Type of facilities",
+                   "Type of support", "Mode of transportation", "Migratory status", "Name of non-communicable disease",
+                   "Name of international institution", "Name of international agreement", "Policy Domains",
+                   "Population Group", "Hazard type", "IHR Capacity", "Land cover", "Mountain Elevation",
+                   "Substance use disorders", "Grounds of discrimination", "Food Waste Sector", "Deviation Level",
+                   "Fiscal intervention stage", "Parliamentary committees", "Observation Status", "Report Ordinal"]
+
+# A name is one of the names above, or a single word, written before ': ' at the start or after a space
+NAME_PATTERN = re.compile(r"(?:^|(?<= ))({}|[^\s:]+): ".format(
+    "|".join(re.escape(name) for name in sorted(DIMENSION_NAMES, key=len, reverse=True))))
+
+# Extensions of the CSV exports, compressed or not
+CSV_EXTENSIONS = (".csv", ".csv.gz", ".csv.zst")
+
+
+# Reading section
+
+# Function to split a CSV file into records with their byte offsets
+def iter_raw_records(file):
+    """
+    Yields (offset, length, text) for each record of a CSV file opened in binary mode.
+    A record ends at the first line break outside quotes, so cells with line breaks
+    (the wrapped texts of the first exports) stay in one record.
+    """
+    offset = file.tell()
+    lines = []
+    quotes = 0
+    for line in iter(file.readline, b""):
+        lines.append(line)
+        quotes += line.count(b'"')
+        if quotes % 2 == 0:
+            raw = b"".join(lines)
+            yield offset, len(raw), raw.decode("utf-8")
+            offset += len(raw)
+            lines = []
+            quotes = 0
+    if lines:
+        raw = b"".join(lines)
+        yield offset, len(raw), raw.decode("utf-8")
+
+
+# Function to parse one record of a CSV file
+def parse_record(text: str, delimiter: str):
+    """
+    Returns the cells of a CSV record.
+    """
+    return next(csv.reader(io.StringIO(text), delimiter=delimiter), [])
+
+
+# Function to convert the period of a row into a year
+def to_year(value: str):
+    """
+    Returns the year of a period such as '2015' or '2015.0', or None.
+    """
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+# Function to find the CSV files of a directory
+def iter_csv_paths(directory: str, extensions: tuple = (".csv",)):
+    """
+    Yields the absolute paths of the files of a directory and its subdirectories ending with one of the extensions.
+    """
+    for root, _, names in os.walk(directory):
+        for name in sorted(names):
+            if name.endswith(extensions):
+                yield os.path.abspath(os.path.join(root, name))
+
+
+# Index section
+
+# Function to open the index of an export directory
+def connect(directory: str, path: str = None):
+    """
+    Opens the index of a directory (.odd_index.sqlite inside it by default) and creates its tables if needed.
+    """
+    connection = sqlite3.connect(path or os.path.join(directory, INDEX_NAME))
+    connection.executescript(SCHEMA)
+    return connection
+
+
+# Function to index one CSV file
+def index_file(connection: sqlite3.Connection, path: str, stat: os.stat_result):
+    """
+    Replaces the rows of a file in the index with the series, area code, year and byte range of each record.
+    Returns the number of records indexed.
+    """
+    remove_file(connection, path)
+    with open(path, "rb") as file:
+        records = iter_raw_records(file)
+        first = next(records, None)
+        header_text = first[2] if first is not None else ""
+        delimiter = ";" if header_text.count(";") >= header_text.count(",") else ","
+        header = parse_record(header_text, delimiter)
+
+        file_id = connection.execute(
+            "INSERT INTO files (path, mtime_ns, size, delimiter, header) VALUES (?, ?, ?, ?, ?)",
+            (path, stat.st_mtime_ns, stat.st_size, delimiter, json.dumps(header))).lastrowid
+        if not {"series", "geoAreaCode"} <= set(header):
+            return 0  # Not an export of indicator data: the file is remembered but has no rows
+
+        series_column = header.index("series")
+        area_column = header.index("geoAreaCode")
+        year_column = header.index("timePeriodStart") if "timePeriodStart" in header else None
+        rows = []
+        for offset, length, text in records:
+            cells = parse_record(text, delimiter)
+            if len(cells) < len(header):
+                continue
+            year = to_year(cells[year_column]) if year_column is not None else None
+            rows.append((cells[series_column], cells[area_column], year, file_id, offset, length))
+        connection.executemany(
+            "INSERT INTO rows (series, geoAreaCode, year, file_id, offset, length) VALUES (?, ?, ?, ?, ?, ?)", rows)
+    return len(rows)
+
+
+# Function to remove a file from the index
+def remove_file(connection: sqlite3.Connection, path: str):
+    """
+    Deletes a file and its rows from the index.
+    """
+    for file_id, in connection.execute("SELECT id FROM files WHERE path = ?", (path,)).fetchall():
+        connection.execute("DELETE FROM rows WHERE file_id = ?", (file_id,))
+        connection.execute("DELETE FROM files WHERE id = ?", (file_id,))
+
+
+# Function to bring the index of a directory up to date
+def update_index(directory: str, index_path: str = None):
+    """
+    Scans the CSV files of a directory (and its subdirectories) and indexes only the new or modified ones,
+    recognized by their modification time and size. Files that disappeared are dropped from the index.
+    Returns a dictionary with the number of files indexed, unchanged and removed.
+    """
+    connection = connect(directory, index_path)
+    known = {path: (mtime_ns, size) for path, mtime_ns, size in connection.execute(
+        "SELECT path, mtime_ns, size FROM files")}
+    summary = {"indexed": 0, "unchanged": 0, "removed": 0, "rows": 0}
+
+    with connection:
+        seen = set()
+        for path in iter_csv_paths(directory):
+            stat = os.stat(path)
+            seen.add(path)
+            if known.get(path) == (stat.st_mtime_ns, stat.st_size):
+                summary["unchanged"] += 1
+                continue
+            summary["rows"] += index_file(connection, path, stat)
+            summary["indexed"] += 1
+
+        for path in set(known) - seen:
+            remove_file(connection, path)
+            summary["removed"] += 1
+    connection.close()
+    return summary
+
+
+# Query section
+
+# Function to find the indexed rows matching a query
+def find_rows(connection: sqlite3.Connection, series: str = None, area_codes: list = None, years: tuple = None):
+    """
+    Returns the (path, mtime_ns, size, delimiter, header, offset, length) of the rows matching the series,
+    the area codes and the inclusive year bounds, ordered by file and position.
+    """
+    conditions = []
+    values = []
+    if series is not None:
+        conditions.append("rows.series = ?")
+        values.append(series)
+    if area_codes:
+        conditions.append(f"rows.geoAreaCode IN ({', '.join('?' * len(area_codes))})")
+        values.extend(str(area_code) for area_code in area_codes)
+    if years is not None:
+        conditions.append("rows.year BETWEEN ? AND ?")
+        values.extend(years)
+
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    return connection.execute(
+        f"""SELECT files.path, files.mtime_ns, files.size, files.delimiter, files.header, rows.offset, rows.length
+            FROM rows JOIN files ON files.id = rows.file_id {where}
+            ORDER BY files.path, rows.offset""", values).fetchall()
+
+
+# Function to check that a file is still the one indexed
+def is_unchanged(stat: os.stat_result, mtime_ns: int, size: int):
+    """
+    Returns True if the modification time and size of a file are the ones recorded by the index.
+    """
+    return (stat.st_mtime_ns, stat.st_size) == (mtime_ns, size)
+
+
+# Function to find the matching rows, with an index brought up to date if a file changed
+def find_current_rows(directory: str, series: str = None, area_codes: list = None, years: tuple = None,
+                      index_path: str = None):
+    """
+    Returns the rows matching the query like find_rows. If a file holding matches was modified or removed
+    since it was indexed, the offsets are no longer valid: the directory is indexed again first.
+    """
+    connection = connect(directory, index_path)
+    matches = find_rows(connection, series, area_codes, years)
+    connection.close()
+
+    for path, mtime_ns, size in {match[:3] for match in matches}:
+        try:
+            unchanged = is_unchanged(os.stat(path), mtime_ns, size)
+        except OSError:
+            unchanged = False
+        if not unchanged:
+            update_index(directory, index_path)
+            connection = connect(directory, index_path)
+            matches = find_rows(connection, series, area_codes, years)
+            connection.close()
+            break
+    return matches
+
+
+# Function to read the rows matching a query
+def query(directory: str, series: str = None, area_codes: list = None, years: tuple = None, index_path: str = None):
+    """
+    Yields the rows of the archive matching the query as dictionaries of the CSV columns. Only the files
+    holding matching rows are opened, and only the matching byte ranges are read. Files modified since
+    they were indexed are indexed again first; a file modified while it is read raises a RuntimeError.
+    """
+    matches = find_current_rows(directory, series, area_codes, years, index_path)
+
+    file = None
+    current_path = None
+    try:
+        for path, mtime_ns, size, delimiter, header, offset, length in matches:
+            if path != current_path:
+                if file is not None:
+                    file.close()
+                file = open(path, "rb")
+                current_path = path
+                columns = json.loads(header)
+                if not is_unchanged(os.fstat(file.fileno()), mtime_ns, size):
+                    raise RuntimeError(f"{path} was modified during the query, run it again")
+            file.seek(offset)
+            yield dict(zip(columns, parse_record(file.read(length).decode("utf-8"), delimiter)))
+    finally:
+        if file is not None:
+            file.close()
+
+
+# Loading section
+
+# Function to parse a list or a dictionary written by an export
+@functools.lru_cache(maxsize=65536)
+def parse_literal(text: str):
+    """
+    Returns the list or dictionary written as text in a CSV export (e.g. "['1.1']" or "{'Sex': 'FEMALE'}"),
+    or None if the text is not one. Python reprs and JSON are accepted. Only literals are read, nothing is
+    evaluated, and the result is cached since the same goals, targets and dimensions come back on every row.
+    """
+    if not text.startswith(("[", "{")):
+        return None
+    try:
+        value = ast.literal_eval(text)
+    except (ValueError, SyntaxError, MemoryError, RecursionError):
+        try:
+            value = json.loads(text)  # e.g. values written as true, false or null
+        except ValueError:
+            return None
+    return value if isinstance(value, (list, dict)) else None
+
+
+# Function to parse dimensions written as they were displayed
+def parse_displayed_dict(text: str):
+    """
+    Returns the dictionary of a cell written as 'Name: value Name: value', the values running up to the next name,
+    so names and values holding spaces are kept whole.
+    """
+    matches = list(NAME_PATTERN.finditer(text))
+    names = [match.group(1) for match in matches]
+    if matches and matches[0].start() > 0:
+        names[0] = text[:matches[0].end() - 2]  # Words before the first name belong to it
+    return {name: text[match.end():following.start() if following else len(text)].strip()
+            for name, match, following in zip(names, matches, matches[1:] + [None])}
+
+
+# Function to parse a cell holding a list or a dictionary
+def parse_collection(column: str, text: str):
+    """
+    Returns the list or dictionary of a cell. The first exports wrote the footnotes and dimensions as they
+    were displayed ('Age: ALLAGE Location: ALLAREA' on several lines): they are read back as well.
+    Returned values are copies, so the cached ones are never modified.
+    """
+    value = parse_literal(text)
+    if isinstance(value, list):
+        return list(value)
+    if isinstance(value, dict):
+        return dict(value)
+    text = " ".join(text.split())
+    if column in DICT_COLUMNS:
+        return parse_displayed_dict(text)
+    return [text]
+
+
+# Function to convert a row of a CSV export into an Indicator/Data record
+def parse_row(row: dict):
+    """
+    Returns the row as a record of the Indicator/Data endpoint: lists and dictionaries are parsed,
+    the year is a number as in the UN API, and empty cells are None, or an empty list or dictionary
+    in the list and dictionary columns as the UN API returns them.
+    """
+    record = {}
+    for column, text in row.items():
+        if column in LIST_COLUMNS or column in DICT_COLUMNS:
+            record[column] = parse_collection(column, text) if text else [] if column in LIST_COLUMNS else {}
+        elif text is None or text == "":
+            record[column] = None
+        elif column == "timePeriodStart":
+            record[column] = to_float(text)
+        else:
+            record[column] = text
+    return record
+
+
+# Function to read the records of a CSV export
+def read_export(path: str):
+    """
+    Yields the records of a CSV export written by export_to_csv (compressed with gzip or zstd or not),
+    in the shape returned by get_indicator_data.
+    """
+    with open_csv_input(path) as file:
+        header = file.readline()
+        reader = csv.DictReader(itertools.chain([header], file),
+                                delimiter=";" if header.count(";") >= header.count(",") else ",")
+        for row in reader:
+            yield parse_row(row)
+
+
+# Function to read a CSV export into typed observations
+def load_export(path: str):
+    """
+    Returns the records of a CSV export as sdg_records.Observation objects, with numbers converted.
+    """
+    return sdg_records.from_records(read_export(path))
+
+
+# Function to read many CSV exports in parallel
+def load_exports(paths: list, processes: int = None):
+    """
+    Returns the observations of many CSV exports, read in parallel by 'processes' processes
+    (one per core by default). Directories are searched for their CSV files. The observations
+    are returned in the order of the files.
+    """
+    files = []
+    for path in paths:
+        files.extend(iter_csv_paths(path, CSV_EXTENSIONS) if os.path.isdir(path) else [path])
+    if processes == 1 or len(files) <= 1:
+        return [observation for path in files for observation in load_export(path)]
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=processes) as executor:
+        return [observation for observations in executor.map(load_export, files) for observation in observations]
+
+
+# Main function of the archive index
+def main(argv: list = None):
+    """
+    Runs the index command: python sdg_archive.py index DIRECTORY
+    or the query command: python sdg_archive.py query DIRECTORY --series SI_POV_DAY1 --years 2015 2020
+    """
+    parser = argparse.ArgumentParser(description="Index of a directory of CSV exports")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    index_parser = subparsers.add_parser("index", help="index the new or modified CSV files")
+    index_parser.add_argument("directory", help="directory of the CSV exports")
+    index_parser.add_argument("--db", help="path of the index (DIRECTORY/.odd_index.sqlite by default)")
+    query_parser = subparsers.add_parser("query", help="print the rows of a series, areas and years")
+    query_parser.add_argument("directory", help="directory of the CSV exports")
+    query_parser.add_argument("--series", help="series code, e.g. SI_POV_DAY1")
+    query_parser.add_argument("--areas", nargs="+", help="area codes, e.g. 100 442")
+    query_parser.add_argument("--years", nargs=2, type=int, metavar=("FIRST", "LAST"), help="inclusive years")
+    query_parser.add_argument("--format", choices=["table", "jsonl"], default="table", help="output format")
+    query_parser.add_argument("--db", help="path of the index (DIRECTORY/.odd_index.sqlite by default)")
+    arguments = parser.parse_args(argv)
+
+    if arguments.command == "index":
+        summary = update_index(arguments.directory, arguments.db)
+        print(f"{summary['indexed']} files indexed ({summary['rows']} rows), {summary['unchanged']} unchanged, "
+              f"{summary['removed']} removed")
+    elif arguments.command == "query":
+        rows = query(arguments.directory, arguments.series, arguments.areas,
+                     tuple(arguments.years) if arguments.years else None, arguments.db)
+        if arguments.format == "jsonl":
+            for row in rows:
+                sys.stdout.write(json.dumps(row, ensure_ascii=False) + "\n")
+        else:
+            print(tabulate(list(rows), headers="keys", tablefmt="grid"))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,265 @@
+# Import necessary libraries
+import asyncio
+import sdg_cache
+import sdg_client
+import sdg_geo
+import sdg_ratelimit
+import sdg_store
+import sdg_tables
+
+try:
+    import httpx
+except ImportError:  # httpx is only needed by the asynchronous client
+    httpx = None
+
+
+# Asynchronous client of the UN API
+class AsyncSDGClient:
+    """
+    Asynchronous twin of the fetchers of project.py, built on httpx and the table builders of sdg_tables.
+    Every method returns the same data as the synchronous function of the same name.
+    """
+
+    def __init__(self, max_connections: int = 16, max_concurrency: int = 8, base_url: str = None, transport=None):
+        if httpx is None:
+            raise ImportError("The asynchronous client requires httpx: pip install httpx")
+
+        self.base_url = base_url
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.geo_area_index = None
+        self.geo_area_lock = asyncio.Lock()
+        self.client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            headers={"Accept": "application/json", "Accept-Encoding": "gzip, deflate"},
+            transport=transport,
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    # Method to close the pooled connections
+    async def aclose(self):
+        """
+        Closes the connections kept alive by the client.
+        """
+        await self.client.aclose()
+
+    # Method to build the full URL of an endpoint
+    def build_url(self, endpoint: str):
+        """
+        Joins the base URL of the client (or the one of sdg_client) and an endpoint path.
+        """
+        if self.base_url is None:
+            return sdg_client.build_url(endpoint)
+        return f"{self.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
+
+    # Method to send a GET request to the UN API
+    async def get(self, endpoint: str, params: dict = None):
+        """
+        Sends a GET request to an endpoint of the UN API, sharing the disk cache of the synchronous client.
+        At most 'max_concurrency' requests are in flight; cancelling the calling task cancels the request.
+        Failures are retried and counted by the circuit breakers as in sdg_client.send.
+        In offline mode, the request is answered from the local SQLite snapshot instead, as in sdg_client.get.
+        The disk and SQLite reads and writes run in worker threads, so they never block the event loop.
+        """
+        if sdg_store.config["offline"]:
+            return await asyncio.to_thread(sdg_store.get, endpoint, params)
+
+        url = self.build_url(endpoint)
+        connect_timeout, read_timeout = sdg_client.get_timeout(endpoint)
+        timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+
+        key = entry = None
+        if sdg_cache.config["enabled"]:
+            key = sdg_cache.make_key(url, params)
+            entry = await asyncio.to_thread(sdg_cache.load, key)
+            if entry is not None and sdg_cache.is_fresh(entry):
+                return sdg_cache.build_response(entry)
+
+        headers = sdg_cache.conditional_headers(entry) if entry is not None else None
+        try:
+            response = await self.send(endpoint, url, params, headers, timeout)
+        except sdg_client.SDGAPIError:
+            if entry is None:
+                raise
+            return sdg_cache.build_response(entry)
+
+        if key is not None:
+            if response.status_code == 304 and entry is not None:
+                await asyncio.to_thread(sdg_cache.refresh, key, entry)
+                return sdg_cache.build_response(entry)
+            if response.status_code == 200:
+                await asyncio.to_thread(sdg_cache.store, key, response)
+        return response
+
+    # Method to send a request with retries
+    async def send(self, endpoint: str, url: str, params: dict, headers: dict, timeout):
+        """
+        Sends a GET request, retrying network errors and 429/5xx responses with backoff.
+        Each attempt waits for a token of the rate limiter shared with the synchronous client.
+        Raises SDGAPIError if every attempt fails, CircuitOpenError if the endpoint is down.
+        A cancelled request counts as a failure, as any other exception does in sdg_client.send.
+        """
+        breaker = sdg_client.get_breaker(endpoint)
+        breaker.before_request()
+
+        try:
+            for attempt in range(sdg_client.config["retries"] + 1):
+                retry_after = None
+                bucket = sdg_ratelimit.get_bucket(url)
+                if bucket is not None:
+                    delay = await asyncio.to_thread(bucket.reserve)  # The state file lock must not block the loop
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                try:
+                    async with self.semaphore:
+                        response = await self.client.get(url, params=params, headers=headers, timeout=timeout)
+                except httpx.TransportError as e:
+                    error = sdg_client.SDGAPIError(endpoint, None, str(e))
+                else:
+                    if response.status_code not in sdg_client.config["retry_statuses"]:
+                        breaker.record_success()
+                        return response
+                    error = sdg_client.SDGAPIError(endpoint, response.status_code, response.text)
+                    retry_after = response.headers.get("Retry-After")
+
+                if attempt < sdg_client.config["retries"]:
+                    await asyncio.sleep(sdg_client.get_retry_delay(attempt, retry_after))
+        except BaseException:
+            breaker.record_failure()  # A cancelled or failed trial request must not leave the circuit half-open
+            raise
+
+        breaker.record_failure()
+        raise error
+
+    # Method to retrieve the SDG goals and targets
+    async def get_sdg_goals_and_targets(self):
+        """
+        Retrieves and returns the list of SDG goals and targets via the UN API.
+        """
+        response = await self.get("Goal/List", params={"includechildren": "true"})
+
+        if response.status_code == 200:
+            data = response.json()
+
+            if data:
+                return sdg_tables.build_goals_and_targets(data)
+
+        else:
+            print(f"Error {response.status_code}: {response.text}")
+            return None
+
+    # Method to retrieve the list of geographic areas
+    async def get_geographic_areas(self):
+        """
+        Retrieves the list of geographic areas via the UN API, with their names as they are.
+        """
+        response = await self.get("GeoArea/List")
+
+        if response.status_code == 200:
+            return response.json()
+        else:
+            print(f"Error {response.status_code} : {response.text}")
+            return None
+
+    # Method to retrieve the geographic area code based on the country name
+    async def get_geographic_area_code(self, country_name: str):
+        """
+        Retrieves the geographic area code for a given country name, an alias or a code.
+        The GeoArea list is downloaded once per client. Raises SDGAPIError if it cannot be retrieved.
+        """
+        async with self.geo_area_lock:
+            if self.geo_area_index is None:
+                response = await self.get("GeoArea/List")
+                if response.status_code != 200:
+                    raise sdg_client.SDGAPIError("GeoArea/List", response.status_code, response.text)
+                self.geo_area_index = sdg_geo.GeoAreaIndex(response.json())
+
+        area_code = self.geo_area_index.get_code(country_name)
+        if area_code is None:
+            print("Invalid country name")
+        return area_code
+
+    # Method to retrieve indicator data for a given geographic area
+    async def get_indicator_data(self, indicator_code: str, area_code: str):
+        """
+        Retrieves specific indicator data for a given geographic area via the UN API.
+        Every page of the answer is retrieved, so 'data' holds all the records and not only the first page.
+        """
+        params = {
+            "indicator": indicator_code,
+            "areaCode": area_code,
+        }
+        response = await self.get("Indicator/Data", params=params)
+
+        if response.status_code == 200:
+            return await self.collect_pages("Indicator/Data", params, response.json())
+        else:
+            print(f"Error {response.status_code} : {response.text}")
+            return None
+
+    # Method to add the records of the following pages to a first page
+    async def collect_pages(self, endpoint: str, params: dict, first_page: dict):
+        """
+        Asynchronous twin of sdg_data.collect_pages: the following pages are requested concurrently,
+        with the size of the first, and their records added to its 'data' in order.
+        Raises SDGAPIError if one of them cannot be retrieved, so the caller never gets a truncated result.
+        """
+        total_pages = first_page.get("totalPages") or 1
+        if total_pages <= 1:
+            return first_page
+
+        page_size = first_page.get("size") or len(first_page["data"])
+
+        async def get_page(number):
+            response = await self.get(endpoint, params=dict(params, page=number, pageSize=page_size))
+            if response.status_code != 200:
+                raise sdg_client.SDGAPIError(endpoint, response.status_code,
+                                             f"page {number} of {total_pages} could not be retrieved")
+            return response.json()
+
+        pages = await gather_or_cancel([get_page(number) for number in range(2, total_pages + 1)])
+        records = list(first_page["data"])
+        for page in pages:
+            records.extend(page["data"])
+        return dict(first_page, data=records, size=len(records), pageNumber=1, totalPages=1)
+
+    # Method to retrieve the list of SDG series
+    async def get_sdg_series(self):
+        """
+        Retrieves and returns the list of SDG indicator series via the UN API.
+        """
+        response = await self.get("Indicator/List")
+
+        if response.status_code == 200:
+            return sdg_tables.build_sdg_series(response.json())
+        else:
+            print(f"Error {response.status_code} : {response.text}")
+            return None
+
+    # Method to retrieve indicator data for many (indicator, area) pairs at once
+    async def get_many_indicator_data(self, pairs: list):
+        """
+        Retrieves the data of every (indicator code, area code) pair concurrently and returns them in order.
+        If one request fails or the caller is cancelled, the other requests are cancelled too.
+        """
+        return await gather_or_cancel([self.get_indicator_data(indicator_code, area_code)
+                                       for indicator_code, area_code in pairs])
+
+
+# Function to run coroutines concurrently, all or none
+async def gather_or_cancel(coroutines: list):
+    """
+    Runs the coroutines concurrently and returns their results in order.
+    If one of them fails or the caller is cancelled, the others are cancelled too.
+    """
+    tasks = [asyncio.ensure_future(coroutine) for coroutine in coroutines]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
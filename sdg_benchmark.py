@@ -0,0 +1,240 @@
+# Import necessary libraries
+import argparse
+import datetime
+import itertools
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import sdg_archive
+import sdg_cache
+import sdg_client
+import sdg_export
+import sdg_fixture_server
+import sdg_records
+import sdg_render
+import sdg_tables
+from tabulate import tabulate
+
+
+# File in which the results of every run are appended, to follow them over time
+RESULTS_PATH = "benchmark_results.jsonl"
+
+# Stages of the path from the UN API to the screen and the CSV file
+STAGES = ["fetch", "parse", "ingest", "remove_columns", "format", "render", "export", "load"]
+
+
+# Payload section
+
+# Function to load the recorded Indicator/Data records
+def load_fixture_records():
+    """
+    Returns the recorded Indicator/Data records (the Bulgaria 1.1.1 and Luxembourg 3.1.1 samples).
+    """
+    return sdg_fixture_server.load_fixture("Indicator/Data")
+
+
+# Function to build a synthetic payload of any size
+def make_records(size: int):
+    """
+    Returns 'size' records shaped like the recorded ones, with distinct areas and years,
+    so payloads of millions of rows can be measured.
+    """
+    templates = load_fixture_records()
+    records = []
+    for number, template in zip(range(size), itertools.cycle(templates)):
+        record = dict(template)
+        record["geoAreaCode"] = str(number // 50)
+        record["timePeriodStart"] = float(1970 + number % 50)
+        record["value"] = str(round(number * 0.37 % 100, 2))
+        records.append(record)
+    return records
+
+
+# Measurement section
+
+# Function to measure a stage
+def measure(function, rows: int, repeat: int = 3):
+    """
+    Runs a function 'repeat' times and returns its best time, its throughput in rows per second
+    and its peak of memory, measured with tracemalloc on a separate run so it does not slow the timing.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        function()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    best = min(timings)
+    return {"seconds": best, "rows_per_second": rows / best if best else None, "peak_bytes": peak}
+
+
+# Function to measure the download and parsing of the recorded records through the fixture server
+def measure_fetch(repeat: int):
+    """
+    Measures sdg_tables.get_indicator_data against the local fixture server, without the disk cache.
+    """
+    base_url = sdg_client.config["base_url"]
+    cache_enabled = sdg_cache.config["enabled"]
+    with sdg_fixture_server.FixtureServer() as server:
+        sdg_client.configure(base_url=server.url)
+        sdg_cache.configure(enabled=False)
+        try:
+            rows = len(sdg_tables.get_indicator_data("1.1.1", "100")["data"])
+            return measure(lambda: sdg_tables.get_indicator_data("1.1.1", "100"), rows, repeat)
+        finally:
+            sdg_client.configure(base_url=base_url)
+            sdg_cache.configure(enabled=cache_enabled)
+
+
+# Function to measure every stage for a payload
+def run_stages(records: list, stages: list = None, repeat: int = 3):
+    """
+    Measures the stages for the records and returns a dictionary of results by stage.
+    The stages are the ones of find_country_indicator_value: JSON parsing of the response, removal of the columns,
+    formatting of the cells, rendering with tabulate and export to CSV, plus the parsing into typed observations
+    and the loading of the CSV export back into observations.
+    """
+    stages = stages or STAGES
+    rows = len(records)
+    payload = json.dumps({"data": records})
+    display_data = sdg_render.wrap_indicator_data(records)
+    filtered_data = sdg_tables.remove_unnecessary_columns(display_data)
+    results = {}
+
+    if "parse" in stages:
+        results["parse"] = measure(lambda: json.loads(payload), rows, repeat)
+    if "ingest" in stages:
+        results["ingest"] = measure(lambda: sdg_records.from_records(records), rows, repeat)
+    if "remove_columns" in stages:
+        results["remove_columns"] = measure(lambda: sdg_tables.remove_unnecessary_columns(display_data), rows, repeat)
+    if "format" in stages:
+        def format_records():
+            sdg_render.wrap_text.cache_clear()  # Each run formats the texts as a first display would
+            sdg_render.wrap_indicator_data(records)
+        results["format"] = measure(format_records, rows, repeat)
+    if "render" in stages:
+        results["render"] = measure(lambda: tabulate(filtered_data, headers="keys", tablefmt="grid"), rows, repeat)
+    if "export" in stages or "load" in stages:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "export.csv")
+            if "export" in stages:
+                results["export"] = measure(lambda: sdg_export.export_records_to_csv(records, path), rows, repeat)
+            if "load" in stages:
+                sdg_export.export_records_to_csv(records, path)
+                results["load"] = measure(lambda: sdg_archive.load_export(path), rows, repeat)
+    return results
+
+
+# Results section
+
+# Function to retrieve the current commit
+def get_commit():
+    """
+    Returns the short hash of the current git commit, or None outside a git repository.
+    """
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# Function to read the previous results
+def load_results(path: str = RESULTS_PATH):
+    """
+    Returns the runs recorded in the results file, oldest first.
+    """
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as file:
+        return [json.loads(line) for line in file if line.strip()]
+
+
+# Function to append the results of a run
+def save_results(run: dict, path: str = RESULTS_PATH):
+    """
+    Appends a run to the results file, one JSON object per line.
+    """
+    with open(path, "a", encoding="utf-8") as file:
+        file.write(json.dumps(run) + "\n")
+
+
+# Function to find the last result of a stage
+def previous_result(runs: list, payload: str, stage: str):
+    """
+    Returns the result of the stage for the payload in the most recent run that measured it, or None.
+    """
+    for run in reversed(runs):
+        result = run["results"].get(payload, {}).get(stage)
+        if result is not None:
+            return result
+    return None
+
+
+# Function to build the report of a run
+def build_report(run: dict, previous_runs: list):
+    """
+    Returns one row per payload and stage, with the change of time since the previous run.
+    """
+    report = []
+    for payload, results in run["results"].items():
+        for stage, result in results.items():
+            previous = previous_result(previous_runs, payload, stage)
+            change = None
+            if previous is not None and previous["seconds"]:
+                change = f"{(result['seconds'] / previous['seconds'] - 1) * 100:+.1f}%"
+            report.append({
+                "Payload": payload,
+                "Stage": stage,
+                "Seconds": round(result["seconds"], 6),
+                "Rows/s": round(result["rows_per_second"]) if result["rows_per_second"] else None,
+                "Peak MB": round(result["peak_bytes"] / 1024 / 1024, 2),
+                "Change": change,
+            })
+    return report
+
+
+# Main function of the benchmark
+def main(argv: list = None):
+    """
+    Runs the benchmark: python sdg_benchmark.py --rows 10000 1000000 --stages parse export
+    The recorded fixtures are always measured, then synthetic payloads of the given sizes.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark of the fetch, transform, render and export stages")
+    parser.add_argument("--rows", type=int, nargs="*", default=[1000, 100000], help="sizes of the synthetic payloads")
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=STAGES, help="stages to measure")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per stage, the best time is kept")
+    parser.add_argument("--results", default=RESULTS_PATH, help="file in which the results are appended")
+    arguments = parser.parse_args(argv)
+
+    results = {"fixtures": run_stages(load_fixture_records(), arguments.stages, arguments.repeat)}
+    if "fetch" in arguments.stages:
+        results["fixtures"]["fetch"] = measure_fetch(arguments.repeat)
+    for size in arguments.rows:
+        results[f"synthetic-{size}"] = run_stages(make_records(size), arguments.stages, arguments.repeat)
+
+    run = {
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "commit": get_commit(),
+        "python": platform.python_version(),
+        "results": results,
+    }
+    print(tabulate(build_report(run, load_results(arguments.results)), headers="keys", tablefmt="grid"))
+    save_results(run, arguments.results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
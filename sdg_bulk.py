@@ -0,0 +1,56 @@
+# Import necessary libraries
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+import sdg_data
+
+
+# Function to split a list into chunks
+def split_in_chunks(items: list, size: int):
+    """
+    Splits a list into consecutive chunks of at most 'size' items.
+    """
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+# Function to retrieve indicator data for several geographic areas in one request
+def get_indicator_data_for_areas(indicator_code: str, area_codes: list):
+    """
+    Retrieves every page of the data of an indicator for several geographic areas with a single query,
+    by repeating the 'areaCode' parameter of the query.
+    """
+    area_codes = [str(area_code) for area_code in area_codes]
+    return list(sdg_data.iter_indicator_data(indicator_code, area_codes, prefetch=False))
+
+
+# Function to retrieve the data of many indicators for many geographic areas
+def iter_indicator_data(indicator_codes: list, area_codes: list, max_workers: int = 8, areas_per_request: int = 25):
+    """
+    Retrieves the data of every indicator for every geographic area and yields the records as one stream.
+    The requests group several areas each and run on a bounded thread pool, while the client limits
+    the number of requests sent at the same time to the UN API.
+    """
+    tasks = iter([(indicator_code, chunk)
+                  for indicator_code in indicator_codes
+                  for chunk in split_in_chunks(list(area_codes), areas_per_request)])
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = set()
+        while True:
+            # Keeps a bounded number of requests in flight, so results never pile up in memory
+            for indicator_code, chunk in tasks:
+                pending.add(executor.submit(get_indicator_data_for_areas, indicator_code, chunk))
+                if len(pending) >= max_workers * 2:
+                    break
+            if not pending:
+                break
+
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+
+
+# Function to retrieve the data of many indicators for many geographic areas as a list
+def get_indicator_panel(indicator_codes: list, area_codes: list, max_workers: int = 8, areas_per_request: int = 25):
+    """
+    Returns every record of every indicator for every geographic area in a single list.
+    """
+    return list(iter_indicator_data(indicator_codes, area_codes, max_workers, areas_per_request))
@@ -0,0 +1,238 @@
+# Import necessary libraries
+import hashlib
+import json
+import os
+import threading
+import time
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+# Cache configuration section
+
+config = {
+    "enabled": os.environ.get("ODD_CACHE", "1") != "0",
+    "directory": os.environ.get("ODD_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "odd")),
+    "ttl": int(os.environ.get("ODD_CACHE_TTL", 24 * 3600)),  # Seconds before an entry must be revalidated
+    "max_size": int(os.environ.get("ODD_CACHE_MAX_SIZE", 256 * 1024 * 1024)),  # Bytes kept on disk
+}
+
+# Seconds after which the running size is counted on disk again, to see the writes of the other processes
+RECOUNT_INTERVAL = 60
+
+_write_lock = threading.Lock()
+_size = None  # Bytes of the entries on disk, counted by evict and kept up to date by each write
+_counted_at = 0.0  # Time of the last count of the cache on disk
+
+
+# Function to change the cache settings
+def configure(enabled: bool = None, directory: str = None, ttl: int = None, max_size: int = None):
+    """
+    Updates the cache settings.
+    """
+    if enabled is not None:
+        config["enabled"] = enabled
+    if directory is not None:
+        config["directory"] = directory
+        reset_size()
+    if ttl is not None:
+        config["ttl"] = ttl
+    if max_size is not None:
+        config["max_size"] = max_size
+
+
+# Cache entry section
+
+# Function to build the cache key of a request
+def make_key(url: str, params: dict = None):
+    """
+    Returns a stable key for a URL and its query parameters, whatever the order of the parameters.
+    """
+    items = []
+    for name, value in sorted((params or {}).items()):
+        values = value if isinstance(value, (list, tuple)) else [value]
+        items.extend((str(name), str(v)) for v in values)
+    return hashlib.sha256(json.dumps([url, items]).encode("utf-8")).hexdigest()
+
+
+# Function to retrieve the path of a cache entry
+def entry_path(key: str):
+    """
+    Returns the path of the file holding a cache entry.
+    """
+    return os.path.join(config["directory"], f"{key}.cache")
+
+
+# Function to read a cache entry from disk
+def load(key: str):
+    """
+    Reads a cache entry and marks it as recently used. Returns None if the entry does not exist.
+    """
+    path = entry_path(key)
+    try:
+        with open(path, "rb") as file:
+            entry = json.loads(file.readline())
+            entry["body"] = file.read()
+        os.utime(path)  # The modification time orders the entries for the LRU eviction
+    except (OSError, ValueError):
+        return None
+    return entry
+
+
+# Function to write a response to the cache
+def store(key: str, response: requests.Response):
+    """
+    Writes the body and the validators (ETag, Last-Modified) of a response to the cache.
+    """
+    entry = {
+        "url": str(response.url),
+        "stored_at": time.time(),
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "content_type": response.headers.get("Content-Type"),
+        "encoding": response.encoding,
+    }
+    write_entry(key, entry, response.content)
+
+
+# Function to write a cache entry atomically
+def write_entry(key: str, entry: dict, body: bytes):
+    """
+    Writes a cache entry to a temporary file then renames it, so readers never see a partial entry.
+    """
+    os.makedirs(config["directory"], exist_ok=True)
+    path = entry_path(key)
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    metadata = {k: v for k, v in entry.items() if k != "body"}
+    with open(temp_path, "wb") as file:
+        file.write(json.dumps(metadata).encode("utf-8") + b"\n")
+        file.write(body)
+        size = file.tell()
+    try:
+        replaced_size = os.path.getsize(path)
+    except OSError:
+        replaced_size = 0
+    os.replace(temp_path, path)
+    add_size(size - replaced_size)
+
+
+# Function to mark a cache entry as fresh again after a revalidation
+def refresh(key: str, entry: dict):
+    """
+    Resets the age of an entry that the server confirmed as unchanged (304 Not Modified).
+    """
+    entry["stored_at"] = time.time()
+    write_entry(key, entry, entry["body"])
+
+
+# Function to check whether a cache entry can be used without contacting the server
+def is_fresh(entry: dict):
+    """
+    Returns True if the entry is younger than the configured TTL.
+    """
+    return time.time() - entry["stored_at"] < config["ttl"]
+
+
+# Function to build the headers of a conditional GET request
+def conditional_headers(entry: dict):
+    """
+    Returns the If-None-Match / If-Modified-Since headers used to revalidate a stale entry.
+    """
+    headers = {}
+    if entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+
+# Function to rebuild a response from a cache entry
+def build_response(entry: dict):
+    """
+    Returns a requests Response holding the cached body, so callers cannot tell it from a network response.
+    """
+    response = requests.Response()
+    response.status_code = 200
+    response.url = entry["url"]
+    response._content = entry["body"]
+    response.encoding = entry.get("encoding")
+    response.headers = CaseInsensitiveDict({"Content-Type": entry.get("content_type") or "application/json"})
+    if entry.get("etag"):
+        response.headers["ETag"] = entry["etag"]
+    if entry.get("last_modified"):
+        response.headers["Last-Modified"] = entry["last_modified"]
+    return response
+
+
+# Cache maintenance section
+
+# Function to count the bytes written to the cache
+def add_size(delta: int):
+    """
+    Adds the bytes of a write to the running size of the cache, and evicts entries only once the size goes over
+    the limit (or is not known yet), so a write does not list the whole cache directory.
+    The running size only counts the writes of this process, so it is counted on disk again every
+    RECOUNT_INTERVAL seconds: processes sharing the cache go over the limit by at most what they write meanwhile.
+    """
+    global _size
+    with _write_lock:
+        if _size is not None:
+            _size += delta
+        recount = _size is None or _size > config["max_size"] or time.time() - _counted_at > RECOUNT_INTERVAL
+    if recount:
+        evict()
+
+
+# Function to forget the running size of the cache
+def reset_size():
+    """
+    Makes the next write count the size of the cache on disk again.
+    """
+    global _size
+    with _write_lock:
+        _size = None
+
+
+# Function to remove the least recently used entries
+def evict():
+    """
+    Deletes the least recently used entries until the cache fits in the configured size,
+    and sets the running size of the cache to what is left on disk.
+    """
+    global _size, _counted_at
+    with _write_lock:
+        entries = []
+        total_size = 0
+        for name in os.listdir(config["directory"]):
+            if not name.endswith(".cache"):
+                continue
+            try:
+                stat = os.stat(os.path.join(config["directory"], name))
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, name))
+            total_size += stat.st_size
+
+        for _, size, name in sorted(entries):
+            if total_size <= config["max_size"]:
+                break
+            try:
+                os.remove(os.path.join(config["directory"], name))
+            except OSError:
+                continue
+            total_size -= size
+        _size = total_size
+        _counted_at = time.time()
+
+
+# Function to empty the cache
+def clear():
+    """
+    Deletes every entry of the cache.
+    """
+    reset_size()
+    if not os.path.isdir(config["directory"]):
+        return
+    for name in os.listdir(config["directory"]):
+        if name.endswith(".cache"):
+            os.remove(os.path.join(config["directory"], name))
@@ -0,0 +1,185 @@
+# Import necessary libraries
+import threading
+import sdg_client
+
+
+_catalog = None
+_catalog_lock = threading.Lock()
+
+
+# Function to normalize an indicator or series code
+def normalize_code(code: str):
+    """
+    Returns a code without spaces and in lower case, so that ' 1.A.1' and '1.a.1' match.
+    """
+    return "".join(str(code).split()).lower()
+
+
+# Function to sort codes in the order of the SDG framework
+def code_sort_key(code: str):
+    """
+    Returns a key sorting '1.2.1' before '1.10.1' and the numbered targets before the lettered ones.
+    """
+    return [(0, int(part), "") if part.isdigit() else (1, 0, part) for part in code.split(".")]
+
+
+# Prefix tree of codes
+class CodeTrie:
+    """
+    Prefix tree of codes, one node per character: a lookup costs the length of the code whatever the number
+    of codes, and the codes starting with a prefix are found by walking only the branch of the prefix.
+    """
+
+    def __init__(self):
+        self.root = {}
+
+    # Method to add a code and its value
+    def insert(self, code: str, value):
+        """
+        Adds a code to the tree, with the value returned by its lookups.
+        """
+        node = self.root
+        for char in normalize_code(code):
+            node = node.setdefault(char, {})
+        node[None] = value  # The None key marks the end of a code
+
+    # Method to find the node of a prefix
+    def find_node(self, prefix: str):
+        """
+        Returns the node reached by the prefix, or None if no code starts with it.
+        """
+        node = self.root
+        for char in normalize_code(prefix):
+            node = node.get(char)
+            if node is None:
+                return None
+        return node
+
+    # Method to find the value of a code
+    def get(self, code: str):
+        """
+        Returns the value of a code, or None if the code is unknown.
+        """
+        node = self.find_node(code)
+        return node.get(None) if node is not None else None
+
+    # Method to list the values of the codes starting with a prefix
+    def complete(self, prefix: str):
+        """
+        Returns the values of every code starting with the prefix.
+        """
+        node = self.find_node(prefix)
+        values = []
+        stack = [node] if node is not None else []
+        while stack:
+            node = stack.pop()
+            for char, child in node.items():
+                if char is None:
+                    values.append(child)
+                else:
+                    stack.append(child)
+        return values
+
+
+# Catalog of the indicators and series
+class IndicatorCatalog:
+    """
+    Indicators of the Indicator/List endpoint and the series they expand to, with their codes in prefix trees
+    so that indicator and series codes are checked and completed locally, without a request.
+    """
+
+    def __init__(self, indicators_list: list):
+        self.indicators = {}
+        self.series = {}
+        self.indicator_trie = CodeTrie()
+        self.series_trie = CodeTrie()
+
+        for indicator in indicators_list:
+            self.indicators[indicator["code"]] = indicator
+            self.indicator_trie.insert(indicator["code"], indicator["code"])
+            for series in indicator.get("series") or []:
+                self.series.setdefault(series["code"], series)
+                self.series_trie.insert(series["code"], series["code"])
+
+    def __len__(self):
+        return len(self.indicators)
+
+    def __contains__(self, code: str):
+        return self.get_code(code) is not None
+
+    # Method to find the official code of an indicator
+    def get_code(self, code: str):
+        """
+        Returns the code of an indicator as written by the UN API (e.g. '1.a.1' for '1.A.1'),
+        or None if the indicator does not exist.
+        """
+        return self.indicator_trie.get(code)
+
+    # Method to find the series of an indicator
+    def get_series(self, code: str):
+        """
+        Returns the series of an indicator (each with its code and description), or None if the indicator
+        does not exist.
+        """
+        code = self.get_code(code)
+        return self.indicators[code].get("series") or [] if code is not None else None
+
+    # Method to find the official code of a series
+    def get_series_code(self, code: str):
+        """
+        Returns the code of a series as written by the UN API (e.g. 'SI_POV_DAY1' for 'si_pov_day1'),
+        or None if the series does not exist.
+        """
+        return self.series_trie.get(code)
+
+    # Method to complete the beginning of an indicator code
+    def complete(self, prefix: str, limit: int = None):
+        """
+        Returns the codes of the indicators starting with the prefix (e.g. '17.1' gives '17.1.1', '17.1.2',
+        '17.10.1', ...), in the order of the SDG framework.
+        """
+        return sorted(self.indicator_trie.complete(prefix), key=code_sort_key)[:limit]
+
+    # Method to complete the beginning of a series code
+    def complete_series(self, prefix: str, limit: int = None):
+        """
+        Returns the codes of the series starting with the prefix, sorted.
+        """
+        return sorted(self.series_trie.complete(prefix))[:limit]
+
+
+# Function to retrieve the indicator catalog, loaded once per process
+def get_indicator_catalog():
+    """
+    Downloads the Indicator list on first use and returns the catalog built from it.
+    Raises SDGAPIError if the list cannot be retrieved.
+    """
+    global _catalog
+    with _catalog_lock:
+        if _catalog is None:
+            response = sdg_client.get("Indicator/List")
+            if response.status_code != 200:
+                raise sdg_client.SDGAPIError("Indicator/List", response.status_code, response.text)
+            _catalog = IndicatorCatalog(response.json())
+        return _catalog
+
+
+# Function to build the catalog from an Indicator list already retrieved
+def load_indicator_catalog(indicators_list: list):
+    """
+    Replaces the loaded catalog with the one of an Indicator list, e.g. the one preloaded by sdg_prefetch.
+    """
+    global _catalog
+    catalog = IndicatorCatalog(indicators_list)
+    with _catalog_lock:
+        _catalog = catalog
+
+
+# Function to forget the loaded catalog
+def reset_indicator_catalog():
+    """
+    Drops the loaded catalog, so the next lookup downloads the Indicator list again.
+    """
+    global _catalog
+    with _catalog_lock:
+        _catalog = None
@@ -0,0 +1,261 @@
+# Import necessary libraries
+import argparse
+import json
+import sys
+import sdg_bulk
+import sdg_catalog
+import sdg_client
+import sdg_data
+import sdg_export
+import sdg_geo
+import sdg_render
+import sdg_store
+import sdg_tables
+
+
+# Column widths of the tables of each command
+TABLE_WIDTHS = {
+    "goals": {"Goal Title": 20, "Target Title": 20},
+    "areas": {"geoAreaName": 30},
+    "series": {"Description": 50},
+}
+
+
+# Argument parsing section
+
+# Function to split comma-separated command-line values
+def split_values(values: list):
+    """
+    Returns the values of an option given as '1.1.1,3.1.1', '1.1.1 3.1.1' or repeated options, in order.
+    """
+    return [value.strip() for item in values or [] for value in item.split(",") if value.strip()]
+
+
+# Function to build the command-line parser
+def build_parser():
+    """
+    Builds the parser of the commands goals, areas, series, data and export.
+    """
+    output_parser = argparse.ArgumentParser(add_help=False)
+    output_parser.add_argument("--format", choices=["table", "jsonl", "csv"], default="table",
+                               help="output format (default: table)")
+    output_parser.add_argument("--limit", type=int, help="maximum number of rows")
+    output_parser.add_argument("--offset", type=int, default=0, help="number of rows to skip")
+    output_parser.add_argument("--page-size", type=int, help="rows per page of a table shown in a terminal")
+
+    filter_parser = argparse.ArgumentParser(add_help=False)
+    filter_parser.add_argument("--goal", help="keep the rows of a goal, e.g. 1")
+    filter_parser.add_argument("--target", help="keep the rows of a target, e.g. 1.1")
+
+    data_parser = argparse.ArgumentParser(add_help=False)
+    code_group = data_parser.add_mutually_exclusive_group(required=True)
+    code_group.add_argument("--indicator", nargs="+", help="indicator codes, e.g. 1.1.1,3.1.1")
+    code_group.add_argument("--series", nargs="+",
+                            help="series codes, e.g. SI_POV_DAY1 (only these series are downloaded)")
+    data_parser.add_argument("--area", nargs="+", required=True, help="area codes or names, e.g. 100,442")
+    data_parser.add_argument("--years", nargs=2, type=int, metavar=("FIRST", "LAST"), help="inclusive years")
+    data_parser.add_argument("--dimension", nargs="+", help="dimension values, e.g. Sex=FEMALE Age=15-24")
+
+    parser = argparse.ArgumentParser(prog="odd", description="Command-line access to the UN SDG API")
+    parser.add_argument("--offline", action="store_true", help="answer from the SQLite snapshot")
+    parser.add_argument("--db", help="path of the SQLite snapshot")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("goals", parents=[output_parser, filter_parser], help="list the SDG goals and targets")
+    subparsers.add_parser("areas", parents=[output_parser], help="list the geographic areas and their codes")
+    subparsers.add_parser("series", parents=[output_parser, filter_parser], help="list the SDG series")
+    subparsers.add_parser("data", parents=[output_parser, data_parser], help="print the data of indicators")
+    export_parser = subparsers.add_parser("export", parents=[data_parser], help="export the data of indicators")
+    export_parser.add_argument("--output", required=True, help="path of the file (or directory for a dataset)")
+    export_parser.add_argument("--format", choices=["csv", "parquet", "feather", "dataset"], default="csv",
+                               help="file format (default: csv)")
+    export_parser.add_argument("--compression", choices=["gzip", "zstd"], help="compression of a CSV file")
+    return parser
+
+
+# Function to check indicator codes against the Indicator list
+def resolve_indicator_codes(indicators: list):
+    """
+    Returns the indicator codes as written by the UN API, or raises a ValueError naming the unknown ones
+    with the codes they may have been meant as.
+    """
+    indicator_catalog = sdg_catalog.get_indicator_catalog()
+    indicator_codes = [indicator_catalog.get_code(indicator) for indicator in indicators]
+    unknown = [indicator for indicator, code in zip(indicators, indicator_codes) if code is None]
+    if unknown:
+        suggestions = [code for indicator in unknown for code in indicator_catalog.complete(indicator, limit=5)]
+        hint = f" (did you mean: {', '.join(suggestions)}?)" if suggestions else ""
+        raise ValueError(f"Unknown indicators: {', '.join(unknown)}{hint}")
+    return indicator_codes
+
+
+# Function to check series codes against the Indicator list
+def resolve_series_codes(series: list):
+    """
+    Returns the series codes as written by the UN API, or raises a ValueError naming the unknown ones.
+    """
+    indicator_catalog = sdg_catalog.get_indicator_catalog()
+    series_codes = [indicator_catalog.get_series_code(code) for code in series]
+    unknown = [code for code, series_code in zip(series, series_codes) if series_code is None]
+    if unknown:
+        raise ValueError(f"Unknown series: {', '.join(unknown)}")
+    return series_codes
+
+
+# Function to read the dimension filters of the command line
+def parse_dimensions(dimensions: list):
+    """
+    Returns the dimension filters given as 'Sex=FEMALE' as a dictionary of the accepted values of each dimension,
+    e.g. {"Sex": ["FEMALE", "MALE"]} for 'Sex=FEMALE Sex=MALE'.
+    """
+    filters = {}
+    for dimension in split_values(dimensions):
+        name, separator, value = dimension.partition("=")
+        if not separator or not name.strip() or not value.strip():
+            raise ValueError(f"Invalid dimension filter: {dimension} (expected NAME=VALUE, e.g. Sex=FEMALE)")
+        filters.setdefault(name.strip(), []).append(value.strip())
+    return filters or None
+
+
+# Function to resolve area names, aliases and codes to area codes
+def resolve_area_codes(areas: list):
+    """
+    Returns the area codes of names, aliases or codes, or raises a ValueError naming the unknown ones.
+    Raises SDGAPIError if the GeoArea list cannot be retrieved.
+    """
+    geo_area_index = sdg_geo.get_geo_area_index()
+    if geo_area_index is None:
+        raise sdg_client.SDGAPIError("GeoArea/List", None, "the list of geographic areas could not be retrieved")
+
+    area_codes = [geo_area_index.get_code(area) for area in areas]
+    unknown = [area for area, area_code in zip(areas, area_codes) if area_code is None]
+    if unknown:
+        raise ValueError(f"Unknown geographic areas: {', '.join(unknown)}")
+    return area_codes
+
+
+# Output section
+
+# Function to write rows as JSON Lines
+def write_jsonl(rows, output):
+    """
+    Writes one JSON object per row, as soon as each row is available. Returns the number of rows written.
+    """
+    count = 0
+    for row in rows:
+        output.write(json.dumps(row, ensure_ascii=False) + "\n")
+        count += 1
+    return count
+
+
+# Function to write rows as CSV
+def write_csv(rows, output, delimiter: str = ";"):
+    """
+    Writes rows as CSV in the format of the exports; the columns are the union of the keys of every row.
+    The rows are spooled to a temporary file by sdg_export, not held in memory. Returns the number of rows written.
+    """
+    return sdg_export.write_records_csv(rows, output, delimiter)
+
+
+# Function to write rows in the format asked on the command line
+def write_rows(rows, arguments, widths: dict = None, filters: dict = None):
+    """
+    Writes the selected rows as a table, JSON Lines or CSV on the standard output.
+    """
+    if arguments.format == "table":
+        sdg_render.print_table(rows, widths, filters, arguments.limit, arguments.offset, arguments.page_size)
+        return
+    selected_rows = sdg_render.select_rows(rows, filters, arguments.limit, arguments.offset)
+    if arguments.format == "jsonl":
+        write_jsonl(selected_rows, sys.stdout)
+    else:
+        write_csv(selected_rows, sys.stdout)
+    sys.stdout.flush()
+
+
+# Command section
+
+# Function to run a command
+def run_command(arguments):
+    """
+    Runs the command of the parsed arguments and returns the exit status (0 on success).
+    """
+    if arguments.command == "goals":
+        rows = sdg_tables.get_sdg_goals_and_targets()
+        filters = {"Goal Code": arguments.goal, "Target Code": arguments.target}
+    elif arguments.command == "areas":
+        rows = sdg_tables.get_geographic_areas()
+        filters = None
+    elif arguments.command == "series":
+        rows = sdg_tables.get_sdg_series()
+        filters = {"Goal": arguments.goal, "Targets": arguments.target}
+    else:
+        area_codes = resolve_area_codes(split_values(arguments.area))
+        years = tuple(arguments.years) if arguments.years else None
+        dimensions = parse_dimensions(arguments.dimension)
+        if arguments.series:
+            series_codes = resolve_series_codes(split_values(arguments.series))
+            records = sdg_data.iter_series_data(series_codes, area_codes, years, dimensions)
+        else:
+            indicator_codes = resolve_indicator_codes(split_values(arguments.indicator))
+            records = sdg_bulk.iter_indicator_data(indicator_codes, area_codes)
+            if years is not None or dimensions is not None:
+                records = sdg_data.filter_records(records, years=years, dimensions=dimensions)
+        if arguments.command == "export":
+            return export_records(records, arguments)
+        if arguments.format == "table":
+            records = sdg_tables.remove_unnecessary_columns(sdg_render.wrap_indicator_data(list(records)))
+        write_rows(records, arguments)
+        return 0
+
+    if rows is None:
+        return 1
+    write_rows(rows, arguments, TABLE_WIDTHS[arguments.command], filters)
+    return 0
+
+
+# Function to export records to a file
+def export_records(records, arguments):
+    """
+    Writes the records to the file of the export command and prints the number of records exported.
+    """
+    if arguments.format == "csv":
+        count = sdg_export.export_records_to_csv(records, arguments.output, arguments.compression)
+        print(f"{count} records exported to {arguments.output}", file=sys.stderr)
+        return 0
+
+    records = list(records)
+    if arguments.format == "parquet":
+        sdg_export.export_to_parquet(records, arguments.output)
+    elif arguments.format == "feather":
+        sdg_export.export_to_feather(records, arguments.output)
+    else:
+        sdg_export.export_to_dataset(records, arguments.output)
+    print(f"{len(records)} records exported to {arguments.output}", file=sys.stderr)
+    return 0
+
+
+# Main function of the command-line interface
+def main(argv: list = None):
+    """
+    Runs a command without any prompt, e.g.: python sdg_cli.py data --indicator 1.1.1 --area 100,442 --format jsonl
+    Returns the exit status, so many invocations can be scripted or run in parallel.
+    """
+    parser = build_parser()
+    arguments = parser.parse_args(argv)
+    sdg_store.configure(offline=True if arguments.offline else None, path=arguments.db)
+
+    try:
+        return run_command(arguments)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    except sdg_client.SDGAPIError as e:
+        print(e, file=sys.stderr)
+        return 1
+    except BrokenPipeError:  # The output was closed early, e.g. piped to 'head'
+        sys.stderr.close()
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,336 @@
+# Import necessary libraries
+import email.utils
+import os
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+import sdg_cache
+import sdg_ratelimit
+import sdg_singleflight
+import sdg_store
+
+
+# Client configuration section
+
+# Default (connect, read) timeouts in seconds, per endpoint of the UN API
+DEFAULT_TIMEOUTS = {
+    "Goal/List": (5, 30),
+    "GeoArea/List": (5, 30),
+    "Indicator/List": (5, 60),
+    "Indicator/Data": (5, 120),
+}
+
+config = {
+    "base_url": os.environ.get("ODD_BASE_URL", "https://unstats.un.org/sdgs/UNSDGAPIV5/v1/sdg"),
+    "pool_connections": 4,
+    "pool_maxsize": 16,
+    "max_per_host": 8,  # Requests sent at the same time to one host
+    "timeouts": dict(DEFAULT_TIMEOUTS),
+    "default_timeout": (5, 60),
+    "retries": 3,  # Retries of a request after a 429/5xx response or a network error
+    "backoff_factor": 0.5,  # Base delay of the retries in seconds, doubled after each attempt
+    "backoff_max": 30,  # Longest delay between two attempts, Retry-After included
+    "retry_statuses": (429, 500, 502, 503, 504),
+    "breaker_threshold": 5,  # Failed requests in a row after which an endpoint is no longer called
+    "breaker_reset": 30,  # Seconds before a new request is let through to an endpoint whose circuit is open
+}
+
+_session = None
+_session_lock = threading.Lock()
+_host_semaphores = {}
+_breakers = {}
+_flights = sdg_singleflight.SingleFlight()
+
+
+# Error section
+
+# Error raised when the UN API cannot answer a request
+class SDGAPIError(Exception):
+    """
+    Raised when a request fails after its retries: network error, timeout or 429/5xx response.
+    """
+
+    def __init__(self, endpoint: str, status_code: int = None, message: str = ""):
+        self.endpoint = endpoint
+        self.status_code = status_code
+        self.message = message
+        status = f"Error {status_code}" if status_code is not None else "Error"
+        super().__init__(f"{status} on {endpoint} : {message}")
+
+
+# Error raised when the circuit of an endpoint is open
+class CircuitOpenError(SDGAPIError):
+    """
+    Raised without sending the request while an endpoint is considered down.
+    """
+
+
+# Function to change the client settings
+def configure(base_url: str = None, pool_connections: int = None, pool_maxsize: int = None, timeouts: dict = None,
+              default_timeout: tuple = None, max_per_host: int = None, retries: int = None,
+              backoff_factor: float = None, backoff_max: float = None, breaker_threshold: int = None,
+              breaker_reset: float = None):
+    """
+    Updates the client settings. The shared session is rebuilt on the next request,
+    and the circuit breakers start again closed.
+    """
+    global _session
+    with _session_lock:
+        for name, value in [("retries", retries), ("backoff_factor", backoff_factor), ("backoff_max", backoff_max),
+                            ("breaker_threshold", breaker_threshold), ("breaker_reset", breaker_reset)]:
+            if value is not None:
+                config[name] = value
+        _breakers.clear()
+        if base_url is not None:
+            config["base_url"] = base_url
+        if pool_connections is not None:
+            config["pool_connections"] = pool_connections
+        if pool_maxsize is not None:
+            config["pool_maxsize"] = pool_maxsize
+        if timeouts is not None:
+            config["timeouts"].update(timeouts)
+        if default_timeout is not None:
+            config["default_timeout"] = default_timeout
+        if max_per_host is not None:
+            config["max_per_host"] = max_per_host
+            _host_semaphores.clear()
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+# HTTP session section
+
+# Function to build a keep-alive session with a sized connection pool
+def build_session():
+    """
+    Creates a requests session that keeps connections alive and negotiates gzip compression.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=config["pool_connections"], pool_maxsize=config["pool_maxsize"])
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        "Accept": "application/json",
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive",
+    })
+    return session
+
+
+# Function to retrieve the session shared by every call to the UN API
+def get_session():
+    """
+    Returns the shared session, creating it on first use.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = build_session()
+        return _session
+
+
+# Function to close the shared session
+def close():
+    """
+    Closes the shared session and its pooled connections.
+    """
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+# Function to build the full URL of an endpoint
+def build_url(endpoint: str):
+    """
+    Joins the configured base URL and an endpoint path such as 'GeoArea/List'.
+    """
+    return f"{config['base_url'].rstrip('/')}/{endpoint.lstrip('/')}"
+
+
+# Function to retrieve the timeout of an endpoint
+def get_timeout(endpoint: str):
+    """
+    Returns the (connect, read) timeout configured for an endpoint.
+    """
+    return config["timeouts"].get(endpoint, config["default_timeout"])
+
+
+# Function to retrieve the semaphore limiting the concurrent requests to a host
+def get_host_semaphore(url: str):
+    """
+    Returns the semaphore shared by every request sent to the host of a URL.
+    """
+    host = urlsplit(url).netloc
+    with _session_lock:
+        if host not in _host_semaphores:
+            _host_semaphores[host] = threading.BoundedSemaphore(config["max_per_host"])
+        return _host_semaphores[host]
+
+
+# Resilience section
+
+# Circuit breaker of an endpoint
+class CircuitBreaker:
+    """
+    Counts the failed requests in a row to an endpoint. Once 'threshold' is reached the circuit opens:
+    requests fail at once with CircuitOpenError, until 'reset' seconds have passed and one trial request
+    is let through. A success closes the circuit again.
+    """
+
+    def __init__(self, endpoint: str, threshold: int, reset: float):
+        self.endpoint = endpoint
+        self.threshold = threshold
+        self.reset = reset
+        self.failures = 0
+        self.opened_at = None
+        self.trial = False
+        self.lock = threading.Lock()
+
+    # Method to check that a request can be sent
+    def before_request(self):
+        """
+        Raises CircuitOpenError if the circuit is open and no trial request is due.
+        """
+        with self.lock:
+            if self.opened_at is None:
+                return
+            if self.trial or time.monotonic() - self.opened_at < self.reset:
+                raise CircuitOpenError(self.endpoint, None, f"too many failures, retry in {self.reset} s")
+            self.trial = True  # Half-open: this request decides whether the circuit closes
+
+    # Method to record a request answered by the server
+    def record_success(self):
+        with self.lock:
+            self.failures = 0
+            self.opened_at = None
+            self.trial = False
+
+    # Method to record a failed request
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            self.trial = False
+            if self.failures >= self.threshold:
+                self.opened_at = time.monotonic()
+
+
+# Function to retrieve the circuit breaker of an endpoint
+def get_breaker(endpoint: str):
+    """
+    Returns the circuit breaker shared by every request to an endpoint.
+    """
+    with _session_lock:
+        if endpoint not in _breakers:
+            _breakers[endpoint] = CircuitBreaker(endpoint, config["breaker_threshold"], config["breaker_reset"])
+        return _breakers[endpoint]
+
+
+# Function to compute the delay before a retry
+def get_retry_delay(attempt: int, retry_after: str = None):
+    """
+    Returns the delay before retrying: the Retry-After of the server (seconds or HTTP date) if given,
+    otherwise an exponential backoff with full jitter. The delay never exceeds 'backoff_max'.
+    """
+    if retry_after:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            try:
+                delay = email.utils.parsedate_to_datetime(retry_after).timestamp() - time.time()
+            except (TypeError, ValueError):
+                delay = None
+        if delay is not None:
+            return min(max(delay, 0), config["backoff_max"])
+    return random.uniform(0, min(config["backoff_max"], config["backoff_factor"] * 2 ** attempt))
+
+
+# Function to send a GET request through the shared session
+def send(endpoint: str, url: str, params: dict = None, headers: dict = None):
+    """
+    Sends a GET request, waiting while too many requests to the same host are in flight
+    and, before each attempt, for a token of the rate limiter shared by the processes of the host.
+    Request errors and 429/5xx responses are retried with backoff; if every attempt fails, SDGAPIError is raised.
+    Other responses (200, 304, 404...) are returned as they are.
+    """
+    breaker = get_breaker(endpoint)
+    breaker.before_request()
+
+    try:
+        for attempt in range(config["retries"] + 1):
+            retry_after = None
+            sdg_ratelimit.acquire(url)
+            try:
+                with get_host_semaphore(url):
+                    response = get_session().get(url, params=params, headers=headers, timeout=get_timeout(endpoint))
+            except requests.RequestException as e:
+                error = SDGAPIError(endpoint, None, str(e))
+            else:
+                if response.status_code not in config["retry_statuses"]:
+                    breaker.record_success()
+                    return response
+                error = SDGAPIError(endpoint, response.status_code, response.text)
+                retry_after = response.headers.get("Retry-After")
+
+            if attempt < config["retries"]:
+                time.sleep(get_retry_delay(attempt, retry_after))
+    except BaseException:
+        breaker.record_failure()  # Any other error (or an interruption) must not leave a trial request pending
+        raise
+
+    breaker.record_failure()
+    raise error
+
+
+# Function to send a GET request to the UN API
+def get(endpoint: str, params: dict = None, use_cache: bool = True, offline: bool = None):
+    """
+    Sends a GET request to an endpoint of the UN API through the shared session.
+    Identical requests made at the same time by several threads share a single HTTP call and its response.
+    In offline mode, the request is answered from the local SQLite snapshot instead. 'offline' chooses
+    the source of this request only; by default it follows the offline setting of sdg_store.
+    """
+    if sdg_store.config["offline"] if offline is None else offline:
+        return sdg_store.get(endpoint, params)
+
+    key = (sdg_cache.make_key(build_url(endpoint), params), use_cache)
+    return _flights.do(key, fetch, endpoint, params, use_cache)
+
+
+# Function to fetch the answer of a GET request, from the cache or the UN API
+def fetch(endpoint: str, params: dict = None, use_cache: bool = True):
+    """
+    Answers a GET request to an endpoint of the UN API. Responses are served from the disk cache while fresh,
+    and revalidated with a conditional GET once stale; with use_cache=False the server is always asked,
+    and the cache is updated with its answer.
+    Raises SDGAPIError if the server cannot answer after the retries (unless a stale cached answer exists),
+    CircuitOpenError if the endpoint is down.
+    """
+    url = build_url(endpoint)
+    if not sdg_cache.config["enabled"]:
+        return send(endpoint, url, params)
+
+    key = sdg_cache.make_key(url, params)
+    entry = sdg_cache.load(key)
+    if entry is not None and use_cache and sdg_cache.is_fresh(entry):
+        return sdg_cache.build_response(entry)
+
+    headers = sdg_cache.conditional_headers(entry) if entry is not None else None
+    try:
+        response = send(endpoint, url, params, headers)
+    except SDGAPIError:
+        if entry is None:
+            raise
+        return sdg_cache.build_response(entry)  # A stale answer is better than none when the API is down
+
+    if response.status_code == 304 and entry is not None:
+        sdg_cache.refresh(key, entry)
+        return sdg_cache.build_response(entry)
+    if response.status_code == 200:
+        sdg_cache.store(key, response)
+    return response
@@ -0,0 +1,191 @@
+# Import necessary libraries
+from concurrent.futures import ThreadPoolExecutor
+import json
+import sdg_client
+import sdg_records
+
+
+# Number of records requested per page of the UN API
+DEFAULT_PAGE_SIZE = 1000
+
+
+# Function to retrieve one page of a paginated endpoint
+def get_page(endpoint: str, params: dict, page: int, page_size: int = DEFAULT_PAGE_SIZE, offline: bool = None,
+             use_cache: bool = True):
+    """
+    Retrieves one page of a paginated endpoint of the UN API, such as Indicator/Data.
+    'offline' and 'use_cache' choose the source as in sdg_client.get. Raises SDGAPIError if the page
+    cannot be retrieved.
+    """
+    page_params = dict(params, page=page, pageSize=page_size)
+    response = sdg_client.get(endpoint, params=page_params, use_cache=use_cache, offline=offline)
+
+    if response.status_code != 200:
+        raise sdg_client.SDGAPIError(endpoint, response.status_code, f"page {page}: {response.text}")
+    return response.json()
+
+
+# Function to add the records of the following pages to a first page
+def collect_pages(endpoint: str, params: dict, first_page: dict):
+    """
+    Returns the first page of a paginated response with the records of every following page added to its 'data',
+    as if the UN API had answered with a single page. The following pages are requested with the size of the first.
+    Raises SDGAPIError if one of them cannot be retrieved, so the caller never gets a truncated result.
+    """
+    total_pages = first_page.get("totalPages") or 1
+    if total_pages <= 1:
+        return first_page
+
+    page_size = first_page.get("size") or len(first_page["data"])
+    records = list(first_page["data"])
+    for number in range(2, total_pages + 1):
+        records.extend(get_page(endpoint, params, number, page_size)["data"])
+    return dict(first_page, data=records, size=len(records), pageNumber=1, totalPages=1)
+
+
+# Function to walk through every page of a paginated endpoint
+def iter_pages(endpoint: str, params: dict, page_size: int = DEFAULT_PAGE_SIZE, prefetch: bool = True,
+               offline: bool = None, use_cache: bool = True):
+    """
+    Yields the pages of a paginated endpoint one after the other, following 'totalPages'.
+    With prefetch, the next page is downloaded in the background while the caller handles the current one.
+    Raises SDGAPIError if a page cannot be retrieved, so a partial result is never taken for a complete one.
+    """
+    page = get_page(endpoint, params, 1, page_size, offline, use_cache)
+    total_pages = page.get("totalPages") or 1
+    if not prefetch or total_pages == 1:
+        yield page
+        for number in range(2, total_pages + 1):
+            yield get_page(endpoint, params, number, page_size, offline, use_cache)
+        return
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        for number in range(2, total_pages + 1):
+            next_page = executor.submit(get_page, endpoint, params, number, page_size, offline, use_cache)
+            yield page
+            page = next_page.result()
+        yield page
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Function to walk through every record of a paginated endpoint
+def iter_records(endpoint: str, params: dict, page_size: int = DEFAULT_PAGE_SIZE, prefetch: bool = True,
+                 offline: bool = None, use_cache: bool = True):
+    """
+    Yields the records of every page of a paginated endpoint, one page in memory at a time.
+    """
+    for page in iter_pages(endpoint, params, page_size, prefetch, offline, use_cache):
+        yield from page["data"]
+
+
+# Function to walk through the data of an indicator for a given geographic area
+def iter_indicator_data(indicator_code: str, area_code, page_size: int = DEFAULT_PAGE_SIZE, prefetch: bool = True):
+    """
+    Yields every record of an indicator for a geographic area (or a list of areas), page by page.
+    """
+    params = {
+        "indicator": indicator_code,
+        "areaCode": area_code,
+    }
+    return iter_records("Indicator/Data", params, page_size, prefetch)
+
+
+# Function to walk through the data of an indicator as typed observations
+def iter_indicator_observations(indicator_code: str, area_code, page_size: int = DEFAULT_PAGE_SIZE,
+                                prefetch: bool = True):
+    """
+    Yields every record of an indicator for a geographic area as an Observation, parsed once as it arrives.
+    """
+    for record in iter_indicator_data(indicator_code, area_code, page_size, prefetch):
+        yield sdg_records.Observation.from_dict(record)
+
+
+# Series query section
+
+# Function to make a list of a value or a list of values
+def as_list(values):
+    """
+    Returns the values as a list of strings, or None for None.
+    """
+    if values is None:
+        return None
+    return [str(value) for value in (values if isinstance(values, (list, tuple, set)) else [values])]
+
+
+# Function to build the parameters of a Series/Data request
+def build_series_params(series_code, area_code=None, years: tuple = None, dimensions: dict = None):
+    """
+    Returns the parameters of a Series/Data request: the series codes, the areas, the years of the inclusive
+    period 'years' as 'timePeriod' values, and the dimensions as the JSON list of the UN API,
+    e.g. [{"name": "Sex", "values": ["FEMALE"]}].
+    """
+    params = {"seriesCode": as_list(series_code)}
+    if area_code is not None:
+        params["areaCode"] = as_list(area_code)
+    if years is not None:
+        params["timePeriod"] = [str(year) for year in range(years[0], years[1] + 1)]
+    if dimensions:
+        params["dimensions"] = json.dumps([{"name": name, "values": as_list(values)}
+                                           for name, values in dimensions.items()])
+    return params
+
+
+# Function to check whether a record matches the filters of a query
+def matches_query(record: dict, series_codes: list = None, area_codes: list = None, years: tuple = None,
+                  dimensions: dict = None):
+    """
+    Returns True if the record belongs to one of the series and areas, falls in the inclusive period 'years'
+    and has the wanted value (or one of the wanted values) of every dimension.
+    """
+    if series_codes is not None and record.get("series") not in series_codes:
+        return False
+    if area_codes is not None and str(record.get("geoAreaCode")) not in area_codes:
+        return False
+    if years is not None:
+        year = record.get("timePeriodStart")
+        if year is None or not years[0] <= float(year) <= years[1]:
+            return False
+    record_dimensions = record.get("dimensions") or {}
+    for name, values in (dimensions or {}).items():
+        if record_dimensions.get(name) not in as_list(values):
+            return False
+    return True
+
+
+# Function to filter records locally
+def filter_records(records, series_code=None, area_code=None, years: tuple = None, dimensions: dict = None):
+    """
+    Yields the records matching the filters, as they arrive: the records dropped are never kept,
+    parsed or displayed. Used when the UN API ignores a filter, and for the Indicator/Data records.
+    """
+    series_codes = as_list(series_code)
+    area_codes = as_list(area_code)
+    for record in records:
+        if matches_query(record, series_codes, area_codes, years, dimensions):
+            yield record
+
+
+# Function to walk through the data of series
+def iter_series_data(series_code, area_code=None, years: tuple = None, dimensions: dict = None,
+                     page_size: int = DEFAULT_PAGE_SIZE, prefetch: bool = True):
+    """
+    Yields the records of one or several series (e.g. 'SI_POV_DAY1') from the Series/Data endpoint, for some
+    areas, years and dimension values (e.g. years=(2010, 2020), dimensions={"Sex": "FEMALE"}).
+    Unlike Indicator/Data, only the series asked for are downloaded, and the filters are sent to the server;
+    the records are checked again locally, in case the server ignores one of them.
+    """
+    params = build_series_params(series_code, area_code, years, dimensions)
+    records = iter_records("Series/Data", params, page_size, prefetch)
+    return filter_records(records, series_code, area_code, years, dimensions)
+
+
+# Function to walk through the data of series as typed observations
+def iter_series_observations(series_code, area_code=None, years: tuple = None, dimensions: dict = None,
+                             page_size: int = DEFAULT_PAGE_SIZE, prefetch: bool = True):
+    """
+    Yields the records of series as Observations, parsed only once they passed the filters.
+    """
+    for record in iter_series_data(series_code, area_code, years, dimensions, page_size, prefetch):
+        yield sdg_records.Observation.from_dict(record)
@@ -0,0 +1,259 @@
+# Import necessary libraries
+import csv
+import gzip
+import io
+import json
+import os
+import tempfile
+import uuid
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is only needed by the columnar exports
+    pa = None
+
+try:
+    import zstandard
+except ImportError:  # zstandard is only needed by the zstd compressed CSV exports
+    zstandard = None
+
+
+# Columns of the Indicator/Data records that hold numbers or lists of strings
+FLOAT_COLUMNS = ["value", "upperBound", "lowerBound"]
+INTEGER_COLUMNS = ["timePeriodStart", "seriesCount"]
+LIST_COLUMNS = ["goal", "target", "indicator", "footnotes"]
+
+
+# Function to check that pyarrow is installed
+def require_pyarrow():
+    """
+    Raises an ImportError explaining how to install pyarrow if it is missing.
+    """
+    if pa is None:
+        raise ImportError("The columnar exports require pyarrow: pip install pyarrow")
+
+
+# Conversion section
+
+# Function to convert a value of the UN API to a float
+def to_float(value):
+    """
+    Returns the value as a float, or None if it is empty or not a number (e.g. '>95').
+    """
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+# Function to convert a value of the UN API to an integer
+def to_int(value):
+    """
+    Returns the value as an integer, or None if it is empty or not a number.
+    """
+    number = to_float(value)
+    return int(number) if number is not None else None
+
+
+# Function to flatten an Indicator/Data record into typed columns
+def flatten_record(record: dict):
+    """
+    Converts a record of the Indicator/Data endpoint into a flat dictionary:
+    numbers become floats or integers, and each dimension and attribute gets its own column
+    ('dim_Sex', 'attr_Nature', ...). Values that are not numbers are kept in 'value_text'.
+    """
+    row = {}
+    for key, value in record.items():
+        if key == "dimensions" or key == "attributes":
+            prefix = "dim_" if key == "dimensions" else "attr_"
+            for name, item in (value or {}).items():
+                row[prefix + name] = None if item is None else str(item)
+        elif key in FLOAT_COLUMNS:
+            row[key] = to_float(value)
+        elif key in INTEGER_COLUMNS:
+            row[key] = to_int(value)
+        elif key in LIST_COLUMNS:
+            row[key] = [str(item) for item in value] if isinstance(value, list) else None
+        else:
+            row[key] = None if value is None or value == "" else str(value)
+
+    if "value" in record:
+        row["value_text"] = None if row["value"] is not None or record["value"] in (None, "") else str(record["value"])
+    return row
+
+
+# Function to build the type of a column
+def column_type(name: str):
+    """
+    Returns the Arrow type of a column of the flattened records.
+    """
+    if name in FLOAT_COLUMNS:
+        return pa.float64()
+    if name in INTEGER_COLUMNS:
+        return pa.int64()
+    if name in LIST_COLUMNS:
+        return pa.list_(pa.string())
+    return pa.string()
+
+
+# Function to convert records into an Arrow table
+def records_to_table(records):
+    """
+    Builds a typed Arrow table from Indicator/Data records. Records with extra dimensions or attributes
+    add columns, which are empty for the other records.
+    """
+    require_pyarrow()
+    columns = {}
+    count = 0
+    for record in records:
+        for name, value in flatten_record(record).items():
+            if name not in columns:
+                columns[name] = [None] * count
+            columns[name].append(value)
+        count += 1
+        for values in columns.values():
+            if len(values) < count:
+                values.append(None)
+
+    schema = pa.schema([(name, column_type(name)) for name in columns])
+    return pa.Table.from_pydict(columns, schema=schema)
+
+
+# Export section
+
+# Function to export records to a Parquet file
+def export_to_parquet(records, path: str, compression: str = "zstd"):
+    """
+    Writes Indicator/Data records to a typed, compressed Parquet file.
+    """
+    pq.write_table(records_to_table(records), path, compression=compression)
+
+
+# Function to export records to a Feather (Arrow IPC) file
+def export_to_feather(records, path: str, compression: str = "lz4"):
+    """
+    Writes Indicator/Data records to a Feather file, which is the Arrow IPC file format.
+    """
+    feather.write_feather(records_to_table(records), path, compression=compression)
+
+
+# Function to append records to a partitioned dataset
+def export_to_dataset(records, directory: str, partitioning: tuple = ("series", "geoAreaCode"),
+                      file_format: str = "parquet"):
+    """
+    Appends Indicator/Data records to a dataset partitioned by series and area (series=.../geoAreaCode=.../).
+    Each call writes new files, so many area/indicator pulls can be gathered in one dataset.
+    """
+    table = records_to_table(records)
+    if table.num_rows == 0:
+        return
+    os.makedirs(directory, exist_ok=True)
+    ds.write_dataset(
+        table,
+        directory,
+        format=file_format,
+        partitioning=list(partitioning),
+        partitioning_flavor="hive",
+        basename_template=f"part-{uuid.uuid4().hex}-{{i}}.{'parquet' if file_format == 'parquet' else 'arrow'}",
+        existing_data_behavior="overwrite_or_ignore",
+    )
+
+
+# Function to read a partitioned dataset
+def read_dataset(directory: str, file_format: str = "parquet", partitioning: tuple = ("series", "geoAreaCode")):
+    """
+    Reads back a dataset written by export_to_dataset as a single Arrow table. The partition keys stay strings
+    (area codes keep their leading zeros) and the schema is the union of the schemas of every file,
+    so dimensions found only in some pulls are kept.
+    """
+    require_pyarrow()
+    partition_schema = pa.schema([(name, pa.string()) for name in partitioning])
+    hive_partitioning = ds.partitioning(partition_schema, flavor="hive")
+    dataset = ds.dataset(directory, format=file_format, partitioning=hive_partitioning)
+    schema = pa.unify_schemas([fragment.physical_schema for fragment in dataset.get_fragments()] + [partition_schema])
+    return ds.dataset(directory, schema=schema, format=file_format, partitioning=hive_partitioning).to_table()
+
+
+# Streaming CSV export section
+
+# Function to open the output of a CSV export, compressed or not
+def open_csv_output(path: str, compression: str = None):
+    """
+    Opens a text file for writing, compressed with gzip or zstd if asked.
+    """
+    if compression is None:
+        return open(path, "w", newline="", encoding="utf-8")
+    if compression == "gzip":
+        return gzip.open(path, "wt", newline="", encoding="utf-8")
+    if compression == "zstd":
+        if zstandard is None:
+            raise ImportError("The zstd compression requires zstandard: pip install zstandard")
+        binary_file = zstandard.ZstdCompressor().stream_writer(open(path, "wb"), closefd=True)
+        return io.TextIOWrapper(binary_file, newline="", encoding="utf-8")
+    raise ValueError(f"Unknown compression: {compression}")
+
+
+# Function to open a CSV export, compressed or not
+def open_csv_input(path: str):
+    """
+    Opens a CSV export for reading, decompressing it if its name ends with '.gz' or '.zst'.
+    """
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", newline="", encoding="utf-8")
+    if path.endswith(".zst"):
+        if zstandard is None:
+            raise ImportError("The zstd compression requires zstandard: pip install zstandard")
+        binary_file = zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True)
+        return io.TextIOWrapper(binary_file, newline="", encoding="utf-8")
+    return open(path, newline="", encoding="utf-8")
+
+
+# Function to write records as CSV to an open file without holding them in memory
+def write_records_csv(records, file, delimiter: str = ";", spool_directory: str = None):
+    """
+    Writes records as CSV to an open text file in the format of export_to_csv, reading them one at a time.
+    The records are first spooled to a temporary file while the union of their keys is collected,
+    so rows with extra keys keep their values. Returns the number of rows written.
+    """
+    fieldnames = {}
+    count = 0
+
+    with tempfile.TemporaryFile("w+", encoding="utf-8", dir=spool_directory) as spool:
+        for record in records:
+            for key in record:
+                fieldnames.setdefault(key, None)
+            # Lists and dictionaries are written as in export_to_csv, the other values as they are
+            spool.write(json.dumps({k: v if isinstance(v, (str, int, float)) or v is None else str(v)
+                                    for k, v in record.items()}) + "\n")
+            count += 1
+        spool.seek(0)
+
+        writer = csv.DictWriter(file, fieldnames=list(fieldnames), delimiter=delimiter,
+                                lineterminator="\n", restval="")
+        writer.writeheader()
+        for line in spool:
+            writer.writerow(json.loads(line))
+    return count
+
+
+# Function to export records to a CSV file without holding them in memory
+def export_records_to_csv(records, path: str, compression: str = None, delimiter: str = ";"):
+    """
+    Writes records to a CSV file with write_records_csv, reading them one at a time.
+    The file is written under a temporary name then renamed,
+    so an interrupted export never leaves a partial file. Returns the number of rows written.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open_csv_output(temp_path, compression) as file:
+            count = write_records_csv(records, file, delimiter, spool_directory=directory)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    return count
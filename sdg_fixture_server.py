@@ -0,0 +1,267 @@
+# Import necessary libraries
+import argparse
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+
+# Directory of the recorded responses of the UN API
+FIXTURE_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+# Path of the API under the address of the server, as on unstats.un.org
+BASE_PATH = "/v1/sdg"
+
+# Number of records per page when the request does not give 'pageSize', as the UN API does
+DEFAULT_PAGE_SIZE = 25
+
+
+# Fixture loading section
+
+# Function to load the recorded response of an endpoint
+def load_fixture(endpoint: str, directory: str = FIXTURE_DIRECTORY):
+    """
+    Returns the recorded response of an endpoint ('Goal/List' is read from Goal_List.json), or None.
+    """
+    path = os.path.join(directory, endpoint.replace("/", "_") + ".json")
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+# Function to check a record against the dimensions of a Series/Data request
+def matches_dimensions(record: dict, dimensions: list):
+    """
+    Returns True if the record has one of the values of every dimension, given as in the UN API:
+    [{"name": "Sex", "values": ["FEMALE"]}].
+    """
+    record_dimensions = record.get("dimensions") or {}
+    return all(record_dimensions.get(dimension["name"]) in dimension["values"] for dimension in dimensions)
+
+
+# Function to build a page of the Indicator/Data and Series/Data endpoints
+def build_data_page(records: list, query: dict):
+    """
+    Returns the page of the records matching the 'indicator', 'seriesCode', 'areaCode', 'timePeriod'
+    and 'dimensions' parameters, in the paginated format of the UN API.
+    """
+    indicator_codes = set(query.get("indicator", []))
+    series_codes = set(query.get("seriesCode", []))
+    area_codes = set(query.get("areaCode", []))
+    years = {float(year) for year in query.get("timePeriod", [])}
+    dimensions = json.loads(query["dimensions"][0]) if query.get("dimensions") else []
+    matching_records = [record for record in records
+                        if (not indicator_codes or indicator_codes & set(record["indicator"]))
+                        and (not series_codes or record["series"] in series_codes)
+                        and (not area_codes or record["geoAreaCode"] in area_codes)
+                        and (not years or record["timePeriodStart"] in years)
+                        and matches_dimensions(record, dimensions)]
+
+    page = int(query.get("page", ["1"])[0])
+    page_size = int(query.get("pageSize", [str(DEFAULT_PAGE_SIZE)])[0])
+    return {
+        "size": page_size,
+        "totalElements": len(matching_records),
+        "totalPages": -(-len(matching_records) // page_size),
+        "pageNumber": page,
+        "attributes": [],
+        "dimensions": [],
+        "data": matching_records[(page - 1) * page_size:page * page_size],
+    }
+
+
+# Server section
+
+# Handler of the requests sent to the fixture server
+class FixtureRequestHandler(BaseHTTPRequestHandler):
+    """
+    Answers GET requests to the endpoints of the UN API with the recorded responses of the server.
+    """
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        endpoint = url.path[len(BASE_PATH):].strip("/") if url.path.startswith(BASE_PATH) else ""
+        self.server.fixture_server.record(endpoint, self.path)
+
+        if self.server.fixture_server.latency:
+            time.sleep(self.server.fixture_server.latency)
+
+        error = self.server.fixture_server.next_error(endpoint)
+        if error is not None:
+            status, retry_after = error
+            self.send_body(status, {"error": f"Simulated error {status}"},
+                           {"Retry-After": str(retry_after)} if retry_after is not None else None)
+            return
+
+        body = self.server.fixture_server.answer(endpoint, parse_qs(url.query))
+        if body is None:
+            self.send_body(404, {"error": f"No fixture for {endpoint}"})
+            return
+
+        etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_body(200, body, {"ETag": etag})
+
+    # Method to send a JSON response
+    def send_body(self, status: int, body, headers: dict = None):
+        """
+        Sends a JSON body (bytes or an object to serialize) with its status and headers.
+        """
+        if not isinstance(body, bytes):
+            body = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    # Method to silence the log of every request
+    def log_message(self, format, *args):
+        pass
+
+
+# Local stand-in for the UN API
+class FixtureServer:
+    """
+    HTTP server replaying the recorded responses of the UN API (Goal/List, GeoArea/List, Indicator/List,
+    Indicator/Data, Series/Data) on 127.0.0.1, with configurable latency, errors and page size.
+    Point the client at it with sdg_client.configure(base_url=server.url).
+    """
+
+    def __init__(self, directory: str = FIXTURE_DIRECTORY, port: int = 0, latency: float = 0.0,
+                 error_rate: float = 0.0, error_status: int = 503, seed: int = None):
+        self.directory = directory
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.random = random.Random(seed)
+        self.requests = []
+        self.errors = {}
+        self.fixtures = {}
+        self.lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", port), FixtureRequestHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.fixture_server = self
+        self.thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    # Property giving the base URL of the API served
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.httpd.server_address[1]}{BASE_PATH}"
+
+    # Method to start the server in a background thread
+    def start(self):
+        """
+        Starts serving requests in a daemon thread and returns the server.
+        """
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    # Method to stop the server
+    def stop(self):
+        """
+        Stops the server and closes its socket.
+        """
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    # Method to make the next requests to an endpoint fail
+    def fail(self, endpoint: str, status: int = 503, count: int = 1, retry_after: int = None):
+        """
+        Makes the next 'count' requests to the endpoint answer with an error status, and a Retry-After
+        header if given.
+        """
+        with self.lock:
+            self.errors.setdefault(endpoint, []).extend([(status, retry_after)] * count)
+
+    # Method to pick the error of a request, if any
+    def next_error(self, endpoint: str):
+        """
+        Returns the (status, retry_after) of the error to answer with, or None to answer normally.
+        """
+        with self.lock:
+            if self.errors.get(endpoint):
+                return self.errors[endpoint].pop(0)
+            if self.error_rate and self.random.random() < self.error_rate:
+                return self.error_status, None
+        return None
+
+    # Method to keep track of the requests received
+    def record(self, endpoint: str, path: str):
+        with self.lock:
+            self.requests.append((endpoint, path))
+
+    # Method to count the requests received by an endpoint
+    def count(self, endpoint: str = None):
+        """
+        Returns the number of requests received, for one endpoint or in total.
+        """
+        with self.lock:
+            return sum(1 for requested, path in self.requests if endpoint is None or requested == endpoint)
+
+    # Method to build the body of the response to a request
+    def answer(self, endpoint: str, query: dict):
+        """
+        Returns the JSON body answering a request, or None if there is no fixture for the endpoint.
+        """
+        fixture_name = "Indicator/Data" if endpoint == "Series/Data" else endpoint  # Same records, other filters
+        with self.lock:
+            if fixture_name not in self.fixtures:
+                self.fixtures[fixture_name] = load_fixture(fixture_name, self.directory)
+            fixture = self.fixtures[fixture_name]
+        if fixture is None:
+            return None
+
+        if endpoint in ("Indicator/Data", "Series/Data"):
+            fixture = build_data_page(fixture, query)
+        elif endpoint == "Goal/List" and query.get("includechildren", ["false"])[0].lower() != "true":
+            fixture = [{key: value for key, value in goal.items() if key != "targets"} for goal in fixture]
+        return json.dumps(fixture).encode("utf-8")
+
+
+# Main function of the fixture server
+def main():
+    """
+    Serves the fixtures until interrupted: python sdg_fixture_server.py --port 8000 --latency 0.05
+    then run the project with ODD_BASE_URL=http://127.0.0.1:8000/v1/sdg.
+    """
+    parser = argparse.ArgumentParser(description="Local stand-in for the UN SDG API")
+    parser.add_argument("--port", type=int, default=8000, help="port to listen on")
+    parser.add_argument("--directory", default=FIXTURE_DIRECTORY, help="directory of the recorded responses")
+    parser.add_argument("--latency", type=float, default=0.0, help="delay added to every response, in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests answered with an error")
+    parser.add_argument("--error-status", type=int, default=503, help="status of the simulated errors")
+    parser.add_argument("--seed", type=int, help="seed of the simulated errors")
+    arguments = parser.parse_args()
+
+    server = FixtureServer(arguments.directory, arguments.port, arguments.latency, arguments.error_rate,
+                           arguments.error_status, arguments.seed)
+    print(f"Serving {arguments.directory} on {server.url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
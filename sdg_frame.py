@@ -0,0 +1,213 @@
+# Import necessary libraries
+import sdg_bulk
+from sdg_export import FLOAT_COLUMNS, INTEGER_COLUMNS, flatten_record
+
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed by the columnar frames
+    np = None
+
+try:
+    import pandas as pd
+except ImportError:  # pandas is only needed to convert a frame into a DataFrame
+    pd = None
+
+
+# Default keys of the rows of a pivoted frame: one row per area, series and combination of dimensions
+PIVOT_KEYS = ["geoAreaCode", "geoAreaName", "series"]
+
+
+# Function to check that numpy is installed
+def require_numpy():
+    """
+    Raises an ImportError explaining how to install numpy if it is missing.
+    """
+    if np is None:
+        raise ImportError("The columnar frames require numpy: pip install numpy")
+
+
+# Function to give each distinct combination of key values a group number
+def group_rows(columns: list):
+    """
+    Returns the group number of every row for the combination of the key columns, and the index of the
+    first row of each group. Groups are numbered in the sorted order of their keys.
+    """
+    codes = []
+    for column in columns:
+        if column.dtype == object:
+            column = np.array(["" if value is None else str(value) for value in column])
+        codes.append(np.unique(column, return_inverse=True)[1])
+
+    if not codes:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    combined = np.stack(codes, axis=1)
+    _, first_rows, group_ids = np.unique(combined, axis=0, return_index=True, return_inverse=True)
+    return group_ids.reshape(-1), first_rows
+
+
+# Columnar frame of indicator data
+class IndicatorFrame:
+    """
+    Indicator/Data records stored by column in NumPy arrays: numbers as float64 or int64 arrays,
+    texts (series, areas, dimensions as 'dim_Sex', attributes as 'attr_Nature') as object arrays.
+    Filtering, pivoting and aggregating work on whole columns instead of looping over dictionaries.
+    """
+
+    def __init__(self, columns: dict):
+        require_numpy()
+        self.columns = columns
+
+    # Method to build a frame from records of the UN API or observations
+    @classmethod
+    def from_records(cls, records):
+        """
+        Builds a frame from Indicator/Data records (dictionaries or sdg_records.Observation objects).
+        """
+        require_numpy()
+        values = {}
+        count = 0
+        for record in records:
+            if not isinstance(record, dict):
+                record = record.to_dict()
+            for name, value in flatten_record(record).items():
+                if name not in values:
+                    values[name] = [None] * count
+                values[name].append(value)
+            count += 1
+            for column in values.values():
+                if len(column) < count:
+                    column.append(None)
+        return cls({name: cls.to_array(name, column) for name, column in values.items()})
+
+    # Method to convert the values of a column into an array
+    @staticmethod
+    def to_array(name: str, values: list):
+        """
+        Returns a float64 array (missing values as NaN) for the number columns, an int64 array for the
+        integer columns without missing values, and an object array for the others.
+        """
+        if name in FLOAT_COLUMNS or (name in INTEGER_COLUMNS and None in values):
+            return np.array([np.nan if value is None else value for value in values], dtype=np.float64)
+        if name in INTEGER_COLUMNS:
+            return np.array(values, dtype=np.int64)
+        array = np.empty(len(values), dtype=object)
+        for number, value in enumerate(values):  # Item by item, so lists are kept as items
+            array[number] = value
+        return array
+
+    def __len__(self):
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def __getitem__(self, name: str):
+        return self.columns[name]
+
+    # Method to find the column of a name or of a dimension
+    def column_name(self, name: str):
+        """
+        Returns the name of the column, accepting dimension and attribute names ('Sex' for 'dim_Sex').
+        """
+        for candidate in (name, f"dim_{name}", f"attr_{name}"):
+            if candidate in self.columns:
+                return candidate
+        raise KeyError(f"Unknown column: {name}")
+
+    # Method to keep the rows matching conditions
+    def filter(self, years: tuple = None, **conditions):
+        """
+        Returns a frame with the rows matching every condition,
+        e.g. filter(Sex="FEMALE", geoAreaCode=["100", "442"], years=(2010, 2020)).
+        A condition is a value or a list of accepted values; years are inclusive bounds.
+        """
+        mask = np.ones(len(self), dtype=bool)
+        for name, wanted in conditions.items():
+            column = self.columns[self.column_name(name)]
+            wanted = wanted if isinstance(wanted, (list, tuple, set)) else [wanted]
+            mask &= np.isin(column, list(wanted))
+        if years is not None:
+            start, end = years
+            mask &= (self.columns["timePeriodStart"] >= start) & (self.columns["timePeriodStart"] <= end)
+        return IndicatorFrame({name: column[mask] for name, column in self.columns.items()})
+
+    # Method to pivot the years into columns
+    def pivot(self, keys: list = None, value: str = "value", how: str = None):
+        """
+        Returns a wide frame with one row per area, series and combination of dimensions, and one column
+        per year holding the value (NaN where there is none). Keys default to the area, the series and
+        every dimension. Rows without a year are left out. Several values for the same row and year
+        raise a ValueError, unless 'how' combines them ("sum", "mean", "min" or "max", as in aggregate).
+        """
+        keys = keys or PIVOT_KEYS + [name for name in self.columns if name.startswith("dim_")]
+        keys = [self.column_name(key) for key in keys]
+        dated = ~np.isnan(self.columns["timePeriodStart"].astype(np.float64))
+        frame = self if dated.all() else IndicatorFrame({name: column[dated] for name, column in self.columns.items()})
+        if how is not None:
+            return frame.aggregate(keys + ["timePeriodStart"], value, how).pivot(keys, how)
+
+        group_ids, first_rows = group_rows([frame.columns[key] for key in keys])
+        years, year_ids = np.unique(frame.columns["timePeriodStart"], return_inverse=True)
+        cells = group_ids * len(years) + year_ids.reshape(-1)
+        if len(np.unique(cells)) < len(cells):
+            raise ValueError("Several values for the same row and year, choose how to combine them with 'how'")
+
+        table = np.full((len(first_rows), len(years)), np.nan)
+        table[group_ids, year_ids.reshape(-1)] = frame.columns[value]
+
+        columns = {key: frame.columns[key][first_rows] for key in keys}
+        for number, year in enumerate(years):
+            columns[str(int(year))] = table[:, number]
+        return IndicatorFrame(columns)
+
+    # Method to aggregate the values across areas
+    def aggregate(self, by: list = None, value: str = "value", how: str = "mean"):
+        """
+        Returns a frame with one row per group of 'by' (by default series and year, which aggregates
+        across areas), holding the sum, mean, min or max of the values and the number of values.
+        Missing values are ignored.
+        """
+        by = [self.column_name(name) for name in (by or ["series", "timePeriodStart"])]
+        group_ids, first_rows = group_rows([self.columns[name] for name in by])
+        values = self.columns[value]
+        present = ~np.isnan(values)
+        counts = np.bincount(group_ids[present], minlength=len(first_rows))
+
+        if how in ("sum", "mean"):
+            result = np.bincount(group_ids[present], weights=values[present], minlength=len(first_rows))
+            if how == "mean":
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    result = result / counts
+        elif how in ("min", "max"):
+            result = np.full(len(first_rows), np.inf if how == "min" else -np.inf)
+            (np.minimum if how == "min" else np.maximum).at(result, group_ids[present], values[present])
+            result[counts == 0] = np.nan
+        else:
+            raise ValueError(f"Unknown aggregation: {how}")
+
+        columns = {name: self.columns[name][first_rows] for name in by}
+        columns[how] = result
+        columns["count"] = counts
+        return IndicatorFrame(columns)
+
+    # Method to convert the frame into dictionaries
+    def to_records(self):
+        """
+        Returns the rows of the frame as a list of dictionaries, e.g. for tabulate.
+        """
+        names = list(self.columns)
+        return [dict(zip(names, row)) for row in zip(*(self.columns[name].tolist() for name in names))]
+
+    # Method to convert the frame into a pandas DataFrame
+    def to_pandas(self):
+        """
+        Returns the frame as a pandas DataFrame.
+        """
+        if pd is None:
+            raise ImportError("The conversion to a DataFrame requires pandas: pip install pandas")
+        return pd.DataFrame(self.columns)
+
+
+# Function to retrieve the data of indicators as a frame
+def get_indicator_frame(indicator_codes: list, area_codes: list):
+    """
+    Retrieves the data of every indicator for every geographic area and returns it as an IndicatorFrame.
+    """
+    return IndicatorFrame.from_records(sdg_bulk.iter_indicator_data(indicator_codes, area_codes))
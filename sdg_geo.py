@@ -0,0 +1,145 @@
+# Import necessary libraries
+import threading
+import unicodedata
+import sdg_client
+
+
+# Alternative names of geographic areas, mapped to their code in the UN API
+ALIASES = {
+    "Turkey": "792",
+    "USA": "840",
+    "United States": "840",
+    "UK": "826",
+    "United Kingdom": "826",
+    "Great Britain": "826",
+    "Russia": "643",
+    "Iran": "364",
+    "Bolivia": "68",
+    "Venezuela": "862",
+    "Vietnam": "704",
+    "South Korea": "410",
+    "North Korea": "408",
+    "Syria": "760",
+    "Tanzania": "834",
+    "Laos": "418",
+    "Moldova": "498",
+    "Czech Republic": "203",
+    "Ivory Coast": "384",
+    "Cape Verde": "132",
+    "Swaziland": "748",
+    "Macedonia": "807",
+    "Palestine": "275",
+    "Netherlands": "528",
+    "Micronesia": "583",
+}
+
+_index = None
+_index_lock = threading.Lock()
+
+
+# Function to normalize a name for lookups that ignore case and accents
+def fold_name(name: str):
+    """
+    Removes accents, case and repeated spaces from a name, so that 'türkiye ' and 'Türkiye' match.
+    """
+    decomposed = unicodedata.normalize("NFKD", name.replace("’", "'"))
+    without_accents = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(without_accents.casefold().split())
+
+
+# Function to normalize an area code
+def normalize_code(code):
+    """
+    Returns an area code as a string without leading zeros, so that 4, '4' and '004' match.
+    """
+    code = str(code).strip()
+    return str(int(code)) if code.isdigit() else code
+
+
+# Index of the geographic areas
+class GeoAreaIndex:
+    """
+    Resolves geographic area names and codes with dictionary lookups instead of scanning the GeoArea list.
+    """
+
+    def __init__(self, geo_area_list: list):
+        self.areas = geo_area_list
+        self.by_code = {}
+        self.by_name = {}
+        self.by_folded_name = {}
+
+        for geo_area in geo_area_list:
+            code = normalize_code(geo_area["geoAreaCode"])
+            self.by_code[code] = geo_area
+            self.by_name[geo_area["geoAreaName"]] = code
+            self.by_folded_name.setdefault(fold_name(geo_area["geoAreaName"]), code)
+
+        for alias, code in ALIASES.items():
+            if code in self.by_code:
+                self.by_folded_name.setdefault(fold_name(alias), code)
+
+    def __len__(self):
+        return len(self.areas)
+
+    def __contains__(self, name_or_code: str):
+        return self.get_code(name_or_code) is not None
+
+    # Method to find the code of an area from its name, an alias or its code
+    def get_code(self, name_or_code: str):
+        """
+        Returns the code of a geographic area, or None if the name or code is unknown.
+        """
+        name_or_code = str(name_or_code).strip()
+        if name_or_code in self.by_name:
+            return self.by_name[name_or_code]
+
+        code = normalize_code(name_or_code)
+        if code in self.by_code:
+            return code
+
+        return self.by_folded_name.get(fold_name(name_or_code))
+
+    # Method to find the official name of an area
+    def get_name(self, name_or_code: str):
+        """
+        Returns the official name of a geographic area, or None if the name or code is unknown.
+        """
+        code = self.get_code(name_or_code)
+        return self.by_code[code]["geoAreaName"] if code is not None else None
+
+
+# Function to retrieve the geographic area index, loaded once per process
+def get_geo_area_index():
+    """
+    Downloads the GeoArea list on first use and returns the index built from it.
+    """
+    global _index
+    with _index_lock:
+        if _index is None:
+            response = sdg_client.get("GeoArea/List")
+            if response.status_code != 200:
+                print(f"Error {response.status_code} : {response.text}")
+                return None
+            _index = GeoAreaIndex(response.json())
+        return _index
+
+
+# Function to build the index from a GeoArea list already retrieved
+def load_geo_area_index(geo_area_list: list):
+    """
+    Replaces the loaded index with the one of a GeoArea list, e.g. the one preloaded by sdg_prefetch.
+    """
+    global _index
+    index = GeoAreaIndex(geo_area_list)
+    with _index_lock:
+        _index = index
+
+
+# Function to forget the loaded index
+def reset_geo_area_index():
+    """
+    Drops the loaded index, so the next lookup downloads the GeoArea list again.
+    """
+    global _index
+    with _index_lock:
+        _index = None
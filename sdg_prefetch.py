@@ -0,0 +1,152 @@
+# Import necessary libraries
+import json
+import os
+import threading
+import time
+import sdg_cache
+import sdg_catalog
+import sdg_client
+import sdg_geo
+
+
+# Prefetch configuration section
+
+config = {
+    "enabled": os.environ.get("ODD_PREFETCH", "1") != "0",
+    "path": os.environ.get("ODD_WARM_START"),  # Warm-start file, warm_start.json in the cache directory by default
+}
+
+# Catalogs used by the menu, with the parameters of their requests
+CATALOGS = {
+    "GeoArea/List": None,
+    "Goal/List": {"includechildren": "true"},
+    "Indicator/List": None,
+}
+
+_catalogs = {}
+_lock = threading.Lock()
+
+
+# Function to change the prefetch settings
+def configure(enabled: bool = None, path: str = None):
+    """
+    Updates the prefetch settings.
+    """
+    if enabled is not None:
+        config["enabled"] = enabled
+    if path is not None:
+        config["path"] = path
+
+
+# Function to retrieve the path of the warm-start file
+def get_warm_start_path():
+    """
+    Returns the path of the warm-start file.
+    """
+    return config["path"] or os.path.join(sdg_cache.config["directory"], "warm_start.json")
+
+
+# Warm-start section
+
+# Function to read the catalogs saved by a previous run
+def load_warm_start(path: str = None):
+    """
+    Returns the catalogs of the warm-start file by endpoint, or an empty dictionary if there is none
+    or if it was saved for another server than the configured one.
+    """
+    try:
+        with open(path or get_warm_start_path(), encoding="utf-8") as file:
+            warm_start = json.load(file)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(warm_start, dict) or warm_start.get("base_url") != sdg_client.config["base_url"]:
+        return {}
+    return {endpoint: data for endpoint, data in warm_start.get("catalogs", {}).items() if endpoint in CATALOGS}
+
+
+# Function to save the catalogs for the next run
+def save_warm_start(catalogs: dict, path: str = None):
+    """
+    Writes the catalogs to the warm-start file, through a temporary file so a reader never sees a partial file.
+    """
+    path = path or get_warm_start_path()
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as file:
+        json.dump({"base_url": sdg_client.config["base_url"], "saved_at": time.time(), "catalogs": catalogs}, file)
+    os.replace(temp_path, path)
+
+
+# Prefetch section
+
+# Function to keep a catalog and the index built from it
+def set_catalog(endpoint: str, data):
+    """
+    Keeps the data of a catalog; the GeoArea list also becomes the geographic area index and the Indicator list
+    the indicator catalog, so area names and indicator codes are checked without waiting for a download.
+    """
+    with _lock:
+        _catalogs[endpoint] = data
+    if endpoint == "GeoArea/List":
+        sdg_geo.load_geo_area_index(data)
+    elif endpoint == "Indicator/List":
+        sdg_catalog.load_indicator_catalog(data)
+
+
+# Function to download a catalog in the background
+def fetch_catalog(endpoint: str):
+    """
+    Downloads a catalog and keeps it. Errors are ignored: the catalog of the warm-start file, if any, stays in use
+    and the menu asks again when the user chooses the option.
+    """
+    try:
+        response = sdg_client.get(endpoint, params=CATALOGS[endpoint])
+        if response.status_code == 200:
+            set_catalog(endpoint, response.json())
+    except (sdg_client.SDGAPIError, ValueError):
+        return
+
+
+# Function to save the catalogs once downloaded
+def save_catalogs(threads: list):
+    """
+    Waits for the downloads, then saves the catalogs retrieved to the warm-start file.
+    """
+    for thread in threads:
+        thread.join()
+    with _lock:
+        catalogs = dict(_catalogs)
+    if catalogs:
+        try:
+            save_warm_start(catalogs)
+        except OSError:
+            pass  # Without a warm-start file, the next run only starts cold
+
+
+# Function to start preloading the catalogs
+def start():
+    """
+    Loads the catalogs of the warm-start file at once, then downloads fresh ones concurrently in the background
+    while the menu waits for the user, and saves them for the next run. The threads are daemons, so leaving
+    the menu never waits for them. Returns the thread saving the catalogs, or None if prefetching is disabled.
+    """
+    if not config["enabled"]:
+        return None
+    for endpoint, data in load_warm_start().items():
+        set_catalog(endpoint, data)
+
+    threads = [threading.Thread(target=fetch_catalog, args=(endpoint,), daemon=True) for endpoint in CATALOGS]
+    for thread in threads:
+        thread.start()
+    thread = threading.Thread(target=save_catalogs, args=(threads,), daemon=True)
+    thread.start()
+    return thread
+
+
+# Function to forget the preloaded catalogs
+def reset():
+    """
+    Drops the preloaded catalogs.
+    """
+    with _lock:
+        _catalogs.clear()
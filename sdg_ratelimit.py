@@ -0,0 +1,157 @@
+# Import necessary libraries
+import os
+import re
+import tempfile
+import threading
+import time
+from urllib.parse import urlsplit
+
+try:
+    import fcntl
+except ImportError:  # Without fcntl (Windows), the limit is only shared by the threads of a process
+    fcntl = None
+
+
+# Rate limiter configuration section
+
+config = {
+    "rate": float(os.environ.get("ODD_RATE_LIMIT", 10)),  # Requests per second to one host, 0 disables the limit
+    "burst": int(os.environ.get("ODD_RATE_BURST", 10)),  # Requests that can be sent at once after a quiet period
+    "directory": os.environ.get("ODD_RATE_LIMIT_DIR", tempfile.gettempdir()),  # Where processes share the buckets
+}
+
+_buckets = {}
+_buckets_lock = threading.Lock()
+
+
+# Function to change the rate limiter settings
+def configure(rate: float = None, burst: int = None, directory: str = None):
+    """
+    Updates the rate limiter settings. The buckets are created again on the next request.
+    """
+    if rate is not None:
+        config["rate"] = rate
+    if burst is not None:
+        config["burst"] = burst
+    if directory is not None:
+        config["directory"] = directory
+    with _buckets_lock:
+        _buckets.clear()
+
+
+# Token bucket section
+
+# Token bucket shared by the threads and processes of one host
+class TokenBucket:
+    """
+    Token bucket refilled with 'rate' tokens per second, holding at most 'burst' tokens.
+    Its state is kept in a small file locked with fcntl, so every process of the host draws from the same bucket.
+    If the file cannot be used, the bucket falls back to a state kept in memory, shared by the threads only.
+    """
+
+    def __init__(self, rate: float, burst: int, path: str = None):
+        self.rate = rate
+        self.burst = burst
+        self.path = path if fcntl is not None else None
+        self.tokens = float(burst)
+        self.updated_at = time.time()
+        self.lock = threading.Lock()
+        if self.path is not None:
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), mode=0o700, exist_ok=True)
+            except OSError:
+                pass  # Reported by the first reserve, which then keeps the state in memory
+
+    # Method to take a token
+    def reserve(self):
+        """
+        Takes a token and returns the number of seconds to wait before sending the request.
+        When the bucket is empty the token is borrowed from the future, so concurrent callers queue up
+        one after the other instead of all retrying at the same moment.
+        """
+        with self.lock:
+            if self.path is not None:
+                try:
+                    return self.reserve_shared()
+                except OSError:
+                    self.path = None  # Missing or forbidden state file: the limit is kept for this process only
+            self.tokens, self.updated_at, delay = self.take(self.tokens, self.updated_at)
+            return delay
+
+    # Method to take a token from the bucket shared through the state file
+    def reserve_shared(self):
+        """
+        Takes a token from the state file, under an exclusive lock, and returns the delay to wait.
+        """
+        with open(self.path, "a+", encoding="ascii") as file:
+            fcntl.flock(file, fcntl.LOCK_EX)
+            try:
+                file.seek(0)
+                tokens, updated_at = self.parse_state(file.read())
+                tokens, updated_at, delay = self.take(tokens, updated_at)
+                file.seek(0)
+                file.truncate()
+                file.write(f"{tokens!r} {updated_at!r}\n")
+                file.flush()
+            finally:
+                fcntl.flock(file, fcntl.LOCK_UN)
+        return delay
+
+    # Method to refill the bucket and take a token from it
+    def take(self, tokens: float, updated_at: float):
+        """
+        Returns the new (tokens, updated_at) of the bucket after taking a token, and the delay to wait.
+        """
+        now = time.time()
+        tokens = min(float(self.burst), tokens + max(now - updated_at, 0) * self.rate) - 1
+        delay = -tokens / self.rate if tokens < 0 else 0.0
+        return tokens, now, delay
+
+    # Method to read the state written by another process
+    def parse_state(self, text: str):
+        """
+        Returns the (tokens, updated_at) saved in the state file, or a full bucket if the file is new.
+        """
+        try:
+            tokens, updated_at = text.split()
+            return float(tokens), float(updated_at)
+        except ValueError:
+            return float(self.burst), time.time()
+
+
+# Function to find the directory of the state files of the current user
+def get_state_directory():
+    """
+    Returns the directory of the state files of the current user in the configured directory,
+    so users sharing a host (and its temporary directory) never open the files of one another.
+    """
+    user = os.getuid() if hasattr(os, "getuid") else os.environ.get("USERNAME", "user")
+    return os.path.join(config["directory"], f"odd-ratelimit-{user}")
+
+
+# Function to retrieve the bucket of a host
+def get_bucket(url: str):
+    """
+    Returns the token bucket of the host of a URL, or None if the rate is not limited.
+    """
+    if config["rate"] <= 0:
+        return None
+    host = urlsplit(url).netloc
+    with _buckets_lock:
+        if host not in _buckets:
+            name = re.sub(r"[^A-Za-z0-9.-]", "_", host)
+            path = os.path.join(get_state_directory(), f"odd-ratelimit-{name}.state")
+            _buckets[host] = TokenBucket(config["rate"], config["burst"], path)
+        return _buckets[host]
+
+
+# Function to wait for the right to send a request
+def acquire(url: str):
+    """
+    Blocks until a request can be sent to the host of a URL without going over the configured rate.
+    """
+    bucket = get_bucket(url)
+    if bucket is not None:
+        delay = bucket.reserve()
+        if delay > 0:
+            time.sleep(delay)
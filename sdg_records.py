@@ -0,0 +1,174 @@
+# Import necessary libraries
+import dataclasses
+import functools
+import sys
+from sdg_export import to_float, to_int
+
+
+# Keys of an Indicator/Data record, in the order of the UN API
+RECORD_KEYS = ["goal", "target", "indicator", "series", "seriesDescription", "seriesCount", "geoAreaCode",
+               "geoAreaName", "timePeriodStart", "value", "valueType", "time_detail", "timeCoverage", "upperBound",
+               "lowerBound", "basePeriod", "source", "geoInfoUrl", "footnotes", "attributes", "dimensions"]
+
+# Number of distinct tuples kept shared; the least recently used ones are forgotten beyond it
+SHARED_VALUES_SIZE = 65536
+
+
+# Sharing section
+
+# Function to share a text between every observation
+def share_text(value):
+    """
+    Returns the interned text, so the same series, area or source is stored once in memory.
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+# Function to find the copy of a tuple already in use
+@functools.lru_cache(maxsize=SHARED_VALUES_SIZE)
+def shared_value(items: tuple):
+    """
+    Returns the first tuple seen equal to 'items'. The cache is bounded, so the tuples of data loaded
+    long ago are not kept alive for the life of the process.
+    """
+    return items
+
+
+# Function to share a tuple between every observation
+def share_tuple(items):
+    """
+    Returns a tuple of interned texts (or of interned (name, value) pairs), stored once in memory.
+    """
+    if items is None:
+        return None
+    if isinstance(items, dict):
+        items = tuple((share_text(name), share_text(value)) for name, value in items.items())
+    else:
+        items = tuple(share_text(item) for item in items)
+    return shared_value(items)
+
+
+# Function to write a number as the UN API does
+def format_number(value: float):
+    """
+    Returns the number as text, without a trailing '.0' (2.0 is written '2').
+    """
+    text = repr(value)
+    return text[:-2] if text.endswith(".0") else text
+
+
+# Observation of an indicator
+@dataclasses.dataclass(slots=True)
+class Observation:
+    """
+    Typed observation of the Indicator/Data endpoint. Numbers are parsed once (value, bounds, year, area code),
+    repeated texts and lists are interned, and the slots leave out the per-record dictionary.
+    """
+    series: str
+    geoAreaCode: int
+    timePeriodStart: int
+    value: float
+    value_text: str = None  # Value as received when it is not a number, e.g. '>95'
+    goal: tuple = ()
+    target: tuple = ()
+    indicator: tuple = ()
+    seriesDescription: str = None
+    seriesCount: int = None
+    geoAreaName: str = None
+    valueType: str = None
+    time_detail: str = None
+    timeCoverage: str = None
+    upperBound: float = None
+    lowerBound: float = None
+    basePeriod: str = None
+    source: str = None
+    geoInfoUrl: str = None
+    footnotes: tuple = ()
+    attributes: tuple = ()
+    dimensions: tuple = ()
+    extra: dict = None  # Keys the UN API may add, kept as they are
+
+    # Method to build an observation from a record of the UN API
+    @classmethod
+    def from_dict(cls, record: dict):
+        """
+        Parses a record of the Indicator/Data endpoint into an observation.
+        """
+        value = to_float(record.get("value"))
+        extra = {key: item for key, item in record.items() if key not in RECORD_KEYS}
+        return cls(
+            series=share_text(record.get("series")),
+            geoAreaCode=to_int(record.get("geoAreaCode")),
+            timePeriodStart=to_int(record.get("timePeriodStart")),
+            value=value,
+            value_text=record.get("value") if value is None else None,
+            goal=share_tuple(record.get("goal")),
+            target=share_tuple(record.get("target")),
+            indicator=share_tuple(record.get("indicator")),
+            seriesDescription=share_text(record.get("seriesDescription")),
+            seriesCount=to_int(record.get("seriesCount")),
+            geoAreaName=share_text(record.get("geoAreaName")),
+            valueType=share_text(record.get("valueType")),
+            time_detail=share_text(record.get("time_detail")),
+            timeCoverage=share_text(record.get("timeCoverage")),
+            upperBound=to_float(record.get("upperBound")),
+            lowerBound=to_float(record.get("lowerBound")),
+            basePeriod=share_text(record.get("basePeriod")),
+            source=share_text(record.get("source")),
+            geoInfoUrl=share_text(record.get("geoInfoUrl")),
+            footnotes=share_tuple(record.get("footnotes")),
+            attributes=share_tuple(record.get("attributes")),
+            dimensions=share_tuple(record.get("dimensions")),
+            extra=extra or None,
+        )
+
+    # Method to convert the observation back into a record of the UN API
+    def to_dict(self):
+        """
+        Returns the observation as a dictionary in the form of the UN API, for tabulate and the CSV exports.
+        """
+        record = {
+            "goal": list(self.goal) if self.goal is not None else None,
+            "target": list(self.target) if self.target is not None else None,
+            "indicator": list(self.indicator) if self.indicator is not None else None,
+            "series": self.series,
+            "seriesDescription": self.seriesDescription,
+            "seriesCount": str(self.seriesCount) if self.seriesCount is not None else None,
+            "geoAreaCode": str(self.geoAreaCode) if self.geoAreaCode is not None else None,
+            "geoAreaName": self.geoAreaName,
+            "timePeriodStart": float(self.timePeriodStart) if self.timePeriodStart is not None else None,
+            "value": format_number(self.value) if self.value is not None else self.value_text,
+            "valueType": self.valueType,
+            "time_detail": self.time_detail,
+            "timeCoverage": self.timeCoverage,
+            "upperBound": format_number(self.upperBound) if self.upperBound is not None else None,
+            "lowerBound": format_number(self.lowerBound) if self.lowerBound is not None else None,
+            "basePeriod": self.basePeriod,
+            "source": self.source,
+            "geoInfoUrl": self.geoInfoUrl,
+            "footnotes": list(self.footnotes) if self.footnotes is not None else None,
+            "attributes": dict(self.attributes) if self.attributes is not None else None,
+            "dimensions": dict(self.dimensions) if self.dimensions is not None else None,
+        }
+        if self.extra:
+            record.update(self.extra)
+        return record
+
+
+# Conversion section
+
+# Function to parse records of the UN API into observations
+def from_records(records):
+    """
+    Returns the observations of an iterable of Indicator/Data records, parsed one at a time.
+    """
+    return [Observation.from_dict(record) for record in records]
+
+
+# Function to convert observations back into records of the UN API
+def to_records(observations):
+    """
+    Yields the observations as dictionaries in the form of the UN API.
+    """
+    for observation in observations:
+        yield observation.to_dict()
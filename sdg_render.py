@@ -0,0 +1,189 @@
+# Import necessary libraries
+import functools
+import itertools
+import sys
+import textwrap
+from tabulate import tabulate
+
+
+# Number of rows per page when a table is displayed in a terminal
+PAGE_SIZE = 20
+
+
+# Text wrapping section
+
+# Function to add line breaks to a long text
+@functools.lru_cache(maxsize=65536)
+def wrap_text(text: str, width: int):
+    """
+    Returns the text with a line break every 'width' characters at most.
+    The result is cached per (text, width), since the same titles come back in every table.
+    """
+    return '\n'.join(textwrap.wrap(text, width=width))
+
+
+# Function to add line breaks to some columns of a table
+def wrap_columns(rows, widths: dict):
+    """
+    Returns copies of the rows in which each column of 'widths' is wrapped to its width.
+    The rows themselves are left untouched.
+    """
+    if rows is None:
+        return None
+    wrapped_rows = []
+    for row in rows:
+        wrapped_row = dict(row)
+        for column, width in widths.items():
+            if isinstance(wrapped_row.get(column), str):
+                wrapped_row[column] = wrap_text(wrapped_row[column], width)
+        wrapped_rows.append(wrapped_row)
+    return wrapped_rows
+
+
+# Function to format indicator data for display
+def wrap_indicator_data(records: list):
+    """
+    Returns copies of the Indicator/Data records formatted for a table:
+    descriptions, sources, footnotes and dimensions are wrapped for better readability.
+    """
+    display_data = []
+    for record in records:
+        d = dict(record)
+        d['seriesDescription'] = wrap_text(d['seriesDescription'], 22)
+        d['source'] = wrap_text(d['source'], 15)
+        d['footnotes'] = wrap_text(' '.join(d['footnotes']), 20)
+
+        # Formats and limits dimensions to 15 characters per line for better readability
+        tab_of_dimensions = [f'{element}: {value}' for element, value in d['dimensions'].items()]
+        d['dimensions'] = wrap_text(' '.join(tab_of_dimensions), 15)
+        display_data.append(d)
+    return display_data
+
+
+# Table rendering section
+
+# Function to check whether a row matches some column filters
+def matches_filters(row: dict, filters: dict):
+    """
+    Returns True if, for every filtered column, the wanted value is the value of the row
+    or one of its comma-separated values (e.g. goal '1' in '1, 10').
+    """
+    for column, wanted in filters.items():
+        values = [value.strip() for value in str(row.get(column, "")).split(",")]
+        if str(wanted).strip() not in values:
+            return False
+    return True
+
+
+# Function to select the rows to display
+def select_rows(rows, filters: dict = None, limit: int = None, offset: int = 0):
+    """
+    Lazily yields the rows matching the filters, skipping the first 'offset' ones and stopping after 'limit'.
+    """
+    filters = {column: value for column, value in (filters or {}).items() if value is not None}
+    if filters:
+        rows = (row for row in rows if matches_filters(row, filters))
+    stop = None if limit is None else offset + limit
+    return itertools.islice(rows, offset, stop)
+
+
+# Function to convert a cell to the lines displayed in a table
+def cell_lines(value, width: int = None):
+    """
+    Returns the lines of a cell; lines longer than 'width' are wrapped again.
+    """
+    text = "" if value is None else str(value)
+    lines = text.split("\n")
+    if width is None:
+        return lines
+    return [part for line in lines for part in (textwrap.wrap(line, width) or [""])]
+
+
+# Function to display rows as a table, page by page
+def stream_table(rows, page_size: int = None, sample_size: int = 100, max_width: int = 60, output=None):
+    """
+    Prints rows as a grid table without building the whole table first.
+    Column widths come from the first 'sample_size' rows; longer cells in later rows are wrapped to fit,
+    and keys first seen in later rows add columns, announced by a new header line.
+    With a page size, the output pauses after each page when it is a terminal (Enter: next page, q: quit).
+    Returns the number of rows printed.
+    """
+    output = output or sys.stdout
+    rows = iter(rows)
+    sample = list(itertools.islice(rows, sample_size))
+    if not sample:
+        return 0
+
+    headers = []
+    numeric = {}
+    widths = {}
+
+    def add_columns(new_headers, sample_rows):
+        for header in new_headers:
+            headers.append(header)
+            numeric[header] = all(isinstance(row.get(header), (int, float)) or row.get(header) in (None, "")
+                                  for row in sample_rows)
+            widths[header] = min(max_width, max([len(header)] + [len(line) for row in sample_rows
+                                                                 for line in cell_lines(row.get(header))]))
+
+    def border(char):
+        return "+" + "+".join(char * (widths[header] + 2) for header in headers) + "+\n"
+
+    def row_text(cells):
+        columns = [cell_lines(cells.get(header), widths[header]) for header in headers]
+        text = ""
+        for number in range(max(len(lines) for lines in columns)):
+            parts = []
+            for header, lines in zip(headers, columns):
+                line = lines[number] if number < len(lines) else ""
+                parts.append(line.rjust(widths[header]) if numeric[header] else line.ljust(widths[header]))
+            text += "| " + " | ".join(parts) + " |\n"
+        return text
+
+    def header_text():
+        return border("-") + row_text({header: header for header in headers}) + border("=")
+
+    add_columns(dict.fromkeys(key for row in sample for key in row), sample)
+    output.write(header_text())
+    pause = page_size is not None and output.isatty()
+    count = 0
+    for row in itertools.chain(sample, rows):
+        if pause and count and count % page_size == 0:
+            output.flush()
+            if input("-- More (Enter: next page, q: quit) --").strip().lower()[:1] == "q":
+                break
+        new_headers = [key for key in row if key not in widths]
+        if new_headers:
+            add_columns(new_headers, [row])
+            output.write(header_text())
+        output.write(row_text(row) + border("-"))
+        count += 1
+    output.flush()
+    return count
+
+
+# Function to display a table, whole or page by page
+def print_table(rows, widths: dict = None, filters: dict = None, limit: int = None, offset: int = 0,
+                page_size: int = None):
+    """
+    Displays rows as a grid table after wrapping the columns of 'widths'.
+    Without filters, limit, offset or page size, the whole table is printed at once with tabulate;
+    otherwise the selected rows are streamed page by page, so the first screen appears immediately.
+    """
+    widths = widths or {}
+    streamed = page_size is not None or limit is not None or offset or any(
+        value is not None for value in (filters or {}).values())
+    if not streamed:
+        print(tabulate(wrap_columns(rows, widths), headers="keys", tablefmt="grid"))
+        return
+
+    selected_rows = select_rows(rows or [], filters, limit, offset)
+    stream_table((wrap_columns([row], widths)[0] for row in selected_rows), page_size)
+
+
+# Function to retrieve the page size to use in the current terminal
+def terminal_page_size():
+    """
+    Returns PAGE_SIZE if the standard output is a terminal, None otherwise (no pause in pipes and files).
+    """
+    return PAGE_SIZE if sys.stdout.isatty() else None
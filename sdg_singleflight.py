@@ -0,0 +1,76 @@
+# Import necessary libraries
+import functools
+import threading
+
+
+# Call in flight, shared by every caller asking for the same key
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+# Group of calls deduplicated by key
+class SingleFlight:
+    """
+    Runs a function once per key at a time: callers asking for a key already in flight wait for that call
+    and receive its result (or its exception) instead of running the function again.
+    Once the call is over, the next caller for the key runs the function again, so nothing is cached.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls = {}
+        self.shared = 0  # Number of calls answered by the call of another caller
+
+    # Method to run a function, or join the call already in flight for its key
+    def do(self, key, function, *args, **kwargs):
+        """
+        Returns the result of function(*args, **kwargs), shared with the concurrent callers of the same key.
+        """
+        with self.lock:
+            call = self.calls.get(key)
+            leader = call is None
+            if leader:
+                call = self.calls[key] = _Call()
+            else:
+                self.shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = function(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self.lock:
+                del self.calls[key]
+            call.done.set()
+
+
+# Decorator deduplicating the concurrent calls of a function with the same arguments
+def single_flight(function):
+    """
+    Wraps a function so that concurrent calls with the same arguments share one call and its result.
+    Calls with arguments that cannot be hashed (lists, dictionaries) are not deduplicated.
+    """
+    group = SingleFlight()
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        key = (args, tuple(sorted(kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:
+            return function(*args, **kwargs)
+        return group.do(key, function, *args, **kwargs)
+
+    wrapper.group = group
+    return wrapper
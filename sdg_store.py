@@ -0,0 +1,361 @@
+# Import necessary libraries
+import argparse
+import json
+import os
+import sqlite3
+import threading
+import time
+import requests
+from requests.structures import CaseInsensitiveDict
+import sdg_client
+import sdg_data
+
+
+# Snapshot configuration section
+
+config = {
+    "offline": os.environ.get("ODD_OFFLINE", "0") == "1",  # Read the UN API endpoints from the snapshot
+    "path": os.environ.get("ODD_SNAPSHOT", "sdg_snapshot.sqlite"),
+}
+
+# Catalogs downloaded by a sync, with the query parameters they are stored under
+CATALOGS = {
+    "Goal/List": {"includechildren": "true"},
+    "GeoArea/List": None,
+    "Indicator/List": None,
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS catalogs (
+    endpoint TEXT PRIMARY KEY,
+    body TEXT NOT NULL,
+    synced_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS indicator_series (
+    indicator TEXT NOT NULL,
+    series TEXT NOT NULL,
+    PRIMARY KEY (indicator, series)
+);
+CREATE TABLE IF NOT EXISTS observations (
+    series TEXT NOT NULL,
+    geoAreaCode TEXT NOT NULL,
+    timePeriodStart REAL,
+    dimensions TEXT NOT NULL,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS observations_series_area_period
+    ON observations (series, geoAreaCode, timePeriodStart);
+CREATE TABLE IF NOT EXISTS synced_indicators (
+    indicator TEXT PRIMARY KEY,
+    area_codes TEXT
+);
+CREATE TABLE IF NOT EXISTS series_releases (
+    series TEXT PRIMARY KEY,
+    release TEXT NOT NULL
+);
+"""
+
+# Key of an observation; records without a year share the key '' instead of NULL, which is never equal to itself
+OBSERVATION_KEY = "series, geoAreaCode, IFNULL(timePeriodStart, ''), dimensions"
+
+_local = threading.local()
+
+
+# Function to change the snapshot settings
+def configure(offline: bool = None, path: str = None):
+    """
+    Updates the snapshot settings.
+    """
+    if offline is not None:
+        config["offline"] = offline
+    if path is not None:
+        config["path"] = path
+
+
+# Database section
+
+# Function to open a connection to the snapshot
+def connect(path: str = None):
+    """
+    Opens the SQLite snapshot and creates its tables if needed.
+    """
+    connection = sqlite3.connect(path or config["path"])
+    connection.executescript(SCHEMA)
+    if connection.execute("SELECT 1 FROM sqlite_master WHERE name = 'observations_key'").fetchone() is None:
+        with connection:  # Older snapshots may hold several copies of the records without a year
+            connection.execute(f"""DELETE FROM observations WHERE rowid NOT IN (
+                                       SELECT MAX(rowid) FROM observations GROUP BY {OBSERVATION_KEY})""")
+            connection.execute(f"CREATE UNIQUE INDEX observations_key ON observations ({OBSERVATION_KEY})")
+    return connection
+
+
+# Function to retrieve the connection of the current thread
+def get_connection():
+    """
+    Returns a connection to the configured snapshot, kept open for the current thread.
+    """
+    connection = getattr(_local, "connection", None)
+    if connection is None or _local.path != config["path"]:
+        if connection is not None:
+            connection.close()
+        _local.connection = connection = connect()
+        _local.path = config["path"]
+    return connection
+
+
+# Function to store a catalog in the snapshot
+def save_catalog(connection: sqlite3.Connection, endpoint: str, catalog: list):
+    """
+    Stores the response of a catalog endpoint (Goal/List, GeoArea/List, Indicator/List).
+    The Indicator/List catalog also fills the table linking indicators to their series.
+    """
+    connection.execute("INSERT OR REPLACE INTO catalogs VALUES (?, ?, ?)",
+                       (endpoint, json.dumps(catalog), time.time()))
+
+    if endpoint == "Indicator/List":
+        connection.executemany(
+            "INSERT OR IGNORE INTO indicator_series VALUES (?, ?)",
+            [(indicator_code, series["code"])
+             for indicator in catalog
+             for series in indicator["series"]
+             for indicator_code in series["indicator"]])
+
+
+# Function to store indicator data in the snapshot
+def save_observations(connection: sqlite3.Connection, records):
+    """
+    Inserts or updates the records of the Indicator/Data endpoint and returns their number.
+    A record is identified by its series, area, period and dimensions.
+    """
+    rows = ((record["series"], str(record["geoAreaCode"]), record.get("timePeriodStart"),
+             json.dumps(record.get("dimensions") or {}, sort_keys=True), json.dumps(record))
+            for record in records)
+    before = connection.total_changes
+    connection.executemany(
+        f"""INSERT INTO observations VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT ({OBSERVATION_KEY}) DO UPDATE SET record = excluded.record""",
+        rows)
+    return connection.total_changes - before
+
+
+# Function to retrieve the release of every series of the Indicator/List catalog
+def get_series_releases(catalog: list):
+    """
+    Returns a dictionary mapping each series code of an Indicator/List catalog to its release.
+    """
+    return {series["code"]: series["release"] for indicator in catalog for series in indicator["series"]}
+
+
+# Function to retrieve the series of the indicators kept up to date by the snapshot
+def get_synced_series(connection: sqlite3.Connection):
+    """
+    Returns a dictionary mapping each series of the synced indicators to the area codes it was synced for
+    (None meaning every area).
+    """
+    synced_series = {}
+    rows = connection.execute(
+        """SELECT indicator_series.series, synced_indicators.area_codes
+           FROM synced_indicators JOIN indicator_series USING (indicator)""")
+    for series, area_codes in rows:
+        area_codes = json.loads(area_codes) if area_codes else None
+        if series in synced_series and (synced_series[series] is None or area_codes is None):
+            synced_series[series] = None
+        elif series in synced_series:
+            synced_series[series] = sorted(set(synced_series[series]) | set(area_codes))
+        else:
+            synced_series[series] = area_codes
+    return synced_series
+
+
+# Function to record the releases of the series stored in the snapshot
+def save_series_releases(connection: sqlite3.Connection, releases: dict, series_codes):
+    """
+    Stores the release of the given series, as found in the Indicator/List catalog.
+    """
+    connection.executemany("INSERT OR REPLACE INTO series_releases VALUES (?, ?)",
+                           [(code, releases[code]) for code in series_codes if code in releases])
+
+
+# Synchronization section
+
+# Function to download the catalogs and indicator data into the snapshot
+def sync(indicator_codes: list, area_codes: list = None, path: str = None):
+    """
+    Downloads the Goal, GeoArea and Indicator catalogs and the data of the given indicators
+    (for the given areas, or every area) into the snapshot. Returns the number of stored records.
+    A sync always reads the UN API, even in offline mode, and never the disk cache for the data.
+    """
+    connection = connect(path)
+    stored = 0
+    try:
+        releases = {}
+        for endpoint, params in CATALOGS.items():
+            response = sdg_client.get(endpoint, params=params, offline=False)
+            if response.status_code == 200:
+                save_catalog(connection, endpoint, response.json())
+                if endpoint == "Indicator/List":
+                    releases = get_series_releases(response.json())
+            else:
+                print(f"Error {response.status_code} : {response.text}")
+        connection.commit()
+
+        for indicator_code in indicator_codes:
+            params = {"indicator": indicator_code}
+            if area_codes:
+                params["areaCode"] = [str(area_code) for area_code in area_codes]
+            records = sdg_data.iter_records("Indicator/Data", params, offline=False, use_cache=False)
+            stored += save_observations(connection, records)
+            connection.execute("INSERT OR REPLACE INTO synced_indicators VALUES (?, ?)",
+                               (indicator_code, json.dumps(params["areaCode"]) if area_codes else None))
+            series_codes = [series for series, in connection.execute(
+                "SELECT series FROM indicator_series WHERE indicator = ?", (indicator_code,))]
+            save_series_releases(connection, releases, series_codes)
+            connection.commit()
+    finally:
+        connection.close()
+    return stored
+
+
+# Function to update the snapshot with the series changed since the last sync
+def refresh(path: str = None):
+    """
+    Compares the releases stored in the snapshot with the live Indicator/List catalog and downloads again,
+    with the Series/Data endpoint, only the series of the synced indicators whose release changed.
+    The new records are upserted. Returns a dictionary mapping each refreshed series to its number of records.
+    A refresh always reads the UN API, even in offline mode, and never the disk cache.
+    """
+    connection = connect(path)
+    refreshed = {}
+    try:
+        response = sdg_client.get("Indicator/List", use_cache=False, offline=False)
+        if response.status_code != 200:
+            print(f"Error {response.status_code} : {response.text}")
+            return refreshed
+
+        catalog = response.json()
+        live_releases = get_series_releases(catalog)
+        save_catalog(connection, "Indicator/List", catalog)
+        stored_releases = dict(connection.execute("SELECT series, release FROM series_releases"))
+
+        for series, area_codes in get_synced_series(connection).items():
+            if series not in live_releases or live_releases[series] == stored_releases.get(series):
+                continue
+            params = {"seriesCode": series}
+            if area_codes:
+                params["areaCode"] = area_codes
+            records = sdg_data.iter_records("Series/Data", params, offline=False, use_cache=False)
+            refreshed[series] = save_observations(connection, records)
+            save_series_releases(connection, live_releases, [series])
+            connection.commit()  # Each series is committed on its own, so an interrupted refresh keeps its progress
+        connection.commit()
+    finally:
+        connection.close()
+    return refreshed
+
+
+# Offline reading section
+
+# Function to build a response as the UN API would send it
+def build_response(endpoint: str, status_code: int, body):
+    """
+    Returns a requests Response holding a JSON body, so callers cannot tell it from a network response.
+    """
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = sdg_client.build_url(endpoint)
+    response.encoding = "utf-8"
+    response.headers = CaseInsensitiveDict({"Content-Type": "application/json"})
+    response._content = (body if isinstance(body, str) else json.dumps(body)).encode("utf-8")
+    return response
+
+
+# Function to read the indicator data from the snapshot
+def query_observations(connection: sqlite3.Connection, params: dict):
+    """
+    Returns the Indicator/Data or Series/Data page matching the query parameters (indicator, seriesCode,
+    areaCode, timePeriod, dimensions, page, pageSize). Every filter runs in SQLite, before the page is cut.
+    """
+    conditions = []
+    values = []
+
+    def add_condition(condition: str, items, convert=str):
+        items = items if isinstance(items, (list, tuple)) else [items]
+        conditions.append(condition.format(", ".join("?" * len(items))))
+        values.extend(convert(item) for item in items)
+
+    if params.get("indicator"):
+        add_condition("series IN (SELECT series FROM indicator_series WHERE indicator IN ({}))", params["indicator"])
+    if params.get("seriesCode"):
+        add_condition("series IN ({})", params["seriesCode"])
+    if params.get("areaCode"):
+        add_condition("geoAreaCode IN ({})", params["areaCode"])
+    if params.get("timePeriod"):
+        add_condition("timePeriodStart IN ({})", params["timePeriod"], float)
+    for dimension in json.loads(params["dimensions"]) if params.get("dimensions") else []:
+        values.append(f'$."{dimension["name"]}"')  # Path of the dimension in the JSON of the dimensions column
+        add_condition("json_extract(dimensions, ?) IN ({})", dimension["values"])
+
+    where = " AND ".join(conditions) or "1"
+    total = connection.execute(f"SELECT COUNT(*) FROM observations WHERE {where}", values).fetchone()[0]
+    page = int(params.get("page", 1))
+    page_size = int(params.get("pageSize", total or 1))
+    rows = connection.execute(
+        f"""SELECT record FROM observations WHERE {where}
+            ORDER BY series, geoAreaCode, timePeriodStart LIMIT ? OFFSET ?""",
+        values + [page_size, (page - 1) * page_size])
+
+    return {
+        "size": page_size,
+        "totalElements": total,
+        "totalPages": -(-total // page_size),
+        "pageNumber": page,
+        "attributes": [],
+        "dimensions": [],
+        "data": [json.loads(record) for record, in rows],
+    }
+
+
+# Function to answer a request to the UN API from the snapshot
+def get(endpoint: str, params: dict = None):
+    """
+    Answers a GET request to an endpoint of the UN API with the content of the snapshot.
+    """
+    connection = get_connection()
+
+    if endpoint in ("Indicator/Data", "Series/Data"):
+        return build_response(endpoint, 200, query_observations(connection, params or {}))
+
+    row = connection.execute("SELECT body FROM catalogs WHERE endpoint = ?", (endpoint,)).fetchone()
+    if row is None:
+        return build_response(endpoint, 404, {"message": f"{endpoint} is not in the offline snapshot"})
+    return build_response(endpoint, 200, row[0])
+
+
+# Function to read the command line of the sync command
+def main():
+    """
+    Runs the sync command: python sdg_store.py sync --indicators 1.1.1 3.1.1 [--areas 100 442] [--db FILE]
+    or the refresh command: python sdg_store.py refresh [--db FILE]
+    """
+    parser = argparse.ArgumentParser(description="Offline snapshot of the UN SDG API")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    sync_parser = subparsers.add_parser("sync", help="download the catalogs and indicator data")
+    sync_parser.add_argument("--indicators", nargs="+", default=[], help="indicator codes, e.g. 1.1.1")
+    sync_parser.add_argument("--areas", nargs="*", help="area codes (every area if omitted)")
+    sync_parser.add_argument("--db", default=config["path"], help="path of the SQLite snapshot")
+    refresh_parser = subparsers.add_parser("refresh", help="download again the series whose release changed")
+    refresh_parser.add_argument("--db", default=config["path"], help="path of the SQLite snapshot")
+    arguments = parser.parse_args()
+
+    if arguments.command == "sync":
+        stored = sync(arguments.indicators, arguments.areas, arguments.db)
+        print(f"{stored} records stored in {arguments.db}")
+    elif arguments.command == "refresh":
+        refreshed = refresh(arguments.db)
+        for series, count in refreshed.items():
+            print(f"{series}: {count} records updated")
+        print(f"{len(refreshed)} series refreshed in {arguments.db}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+# Fetchers of the tables displayed by the menu and the command line, and the rows built from the responses
+# of the UN API. This module never prompts the user, so the asynchronous client and the command line can use it
+# without importing the interactive menu of project.py.
+
+# Import necessary libraries
+import sdg_client
+import sdg_data
+import sdg_geo
+
+
+# Table building section
+
+# Function to build the rows of the SDG goals and targets table
+def build_goals_and_targets(data: list):
+    """
+    Builds the numbered goal/target rows from the response of the Goal/List endpoint.
+    """
+    goals_targets_list = []
+    number = 0
+
+    for goal in data:
+        for target in goal["targets"]:
+            goal_target = {}
+            number += 1
+            goal_target["No."] = number
+            goal_target["Goal Code"] = goal["code"]
+            goal_target["Goal Title"] = goal["title"]
+            goal_target["Target Code"] = target["code"]
+            goal_target["Target Title"] = target["title"]
+            goals_targets_list.append(goal_target)
+    return tuple(goals_targets_list)
+
+
+# Function to build the rows of the SDG series table
+def build_sdg_series(indicators_list: list):
+    """
+    Builds the numbered series rows from the response of the Indicator/List endpoint.
+    """
+    sdg_series_list = []
+    number = 0
+
+    for indicator in indicators_list:
+        for series in indicator["series"]:
+            number += 1
+            serie = {}
+            serie["Number"] = number
+            serie["Series Code"] = series["code"]
+            serie["Description"] = series["description"]
+            serie["Goal"] = ", ".join(series["goal"])
+            serie["Targets"] = ", ".join(series["target"])
+            serie["Indicators"] = ", ".join(series["indicator"])
+            serie["Version"] = series["release"]
+            sdg_series_list.append(serie)
+    return sdg_series_list
+
+
+# Data retrieval functions section
+
+# Function to retrieve and display SDG goals and targets
+def get_sdg_goals_and_targets():
+    """
+    Retrieves and returns the list of SDG goals and targets via the UN API.
+    The titles are returned as they are, line breaks are added by the display functions.
+    """
+    response = sdg_client.get("Goal/List", params={"includechildren": "true"})
+
+    if response.status_code == 200:
+        data = response.json()
+
+        if data:
+            return build_goals_and_targets(data)
+
+    else:
+        print(f"Error {response.status_code}: {response.text}")
+        return None
+
+
+# Function to retrieve the list of geographic areas
+def get_geographic_areas():
+    """
+    Retrieves the list of geographic areas via the UN API, with their names as they are.
+    """
+    response = sdg_client.get("GeoArea/List")
+
+    if response.status_code == 200:
+        return response.json()
+    else:
+        print(f"Error {response.status_code} : {response.text}")
+        return None
+
+
+# Function to retrieve the geographic area code based on the country name
+def get_geographic_area_code(country_name: str):
+    """
+    Retrieves the geographic area code for a given country name, an alias or a code
+    through the geographic area index, which downloads the GeoArea list once per process.
+    Raises SDGAPIError if the GeoArea list cannot be retrieved.
+    """
+    geo_area_index = sdg_geo.get_geo_area_index()
+
+    if geo_area_index is not None:
+        area_code = geo_area_index.get_code(country_name)
+        if area_code is not None:
+            return area_code
+
+        print("Invalid country name")
+    else:
+        raise sdg_client.SDGAPIError("GeoArea/List", None, "the list of geographic areas could not be retrieved")
+
+
+# Function to retrieve indicator data for a given geographic area
+def get_indicator_data(indicator_code: str, area_code: str):
+    """
+    Retrieves specific indicator data for a given geographic area via the UN API.
+    Every page of the answer is retrieved, so 'data' holds all the records and not only the first page.
+    """
+    params = {
+        "indicator": indicator_code,
+        "areaCode": area_code,
+    }
+
+    response = sdg_client.get("Indicator/Data", params=params)
+
+    if response.status_code == 200:
+        data = sdg_data.collect_pages("Indicator/Data", params, response.json())
+        return data
+    else:
+        print(f"Error {response.status_code} : {response.text}")
+        return None
+
+
+# Function to retrieve the list of SDG series
+def get_sdg_series():
+    """
+    Retrieves and returns the list of SDG indicator series via the UN API.
+    """
+    response = sdg_client.get("Indicator/List")
+
+    if response.status_code == 200:
+        return build_sdg_series(response.json())
+    else:
+        print(f"Error {response.status_code} : {response.text}")
+        return None
+
+
+# Formatting section
+
+# Function to remove unnecessary columns
+def remove_unnecessary_columns(dict_list: list):
+    """
+    Removes unnecessary items (column in tabulate) from a list of dictionaries.
+    """
+    new_list = []
+    keys_to_remove = ['goal', 'target', 'geoAreaCode', 'geoAreaName', 'valueType', 'time_detail', 'upperBound',
+                      'lowerBound', 'geoInfoUrl']
+    for element_dict in dict_list:
+        new_dict = {k: v for k, v in element_dict.items() if k not in keys_to_remove}
+        new_list.append(new_dict)
+    return new_list
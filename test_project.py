@@ -1,9 +1,14 @@
 # Importing all functions and variables from the module 'odd'
-# and the libraries 'requests', 'textwrap'
+# and the libraries 'requests', 'sdg_client', 'sdg_render'
 
 from project import *
+import builtins
+import csv
 import requests
-import textwrap
+import sdg_cache
+import sdg_fixture_server
+import sdg_client
+import sdg_render
 import io
 import sys
 from tabulate import tabulate
@@ -12,7 +17,7 @@ from tabulate import tabulate
 # Test of the function get_sdg_goals_and_targets
 def test_get_sdg_goals_and_targets():
     # Direct API Call to Retrieve the Raw Response
-    response = requests.get("https://unstats.un.org/sdgs/UNSDGAPIV5/v1/sdg/Goal/List?includechildren=true")
+    response = requests.get(sdg_client.build_url("Goal/List") + "?includechildren=true")
     list_goals_targets = []
 
     if response.status_code == 200:
@@ -26,10 +31,9 @@ def test_get_sdg_goals_and_targets():
                     numerous += 1
                     goal_target["No."] = numerous
                     goal_target["Goal Code"] = goal["code"]
-                    goal_target["Goal Title"] = '\n'.join(
-                        textwrap.wrap(goal["title"], width=20))  # Line break every 20 characters.
+                    goal_target["Goal Title"] = goal["title"]  # Titles are returned without line breaks
                     goal_target["Target Code"] = target["code"]
-                    goal_target["Target Title"] = '\n'.join(textwrap.wrap(target["title"], width=20))
+                    goal_target["Target Title"] = target["title"]
                     list_goals_targets.append(goal_target)
 
             # Compare the results of the function with those processed locally
@@ -45,16 +49,12 @@ def test_get_sdg_goals_and_targets():
 # Test of the function get_geographic_areas
 def test_get_geographic_areas():
     # Direct API Call to Retrieve the Raw Response
-    reponse = requests.get('https://unstats.un.org/sdgs/UNSDGAPIV5/v1/sdg/GeoArea/List')
+    reponse = requests.get(sdg_client.build_url("GeoArea/List"))
 
     if reponse.status_code == 200:
         list_geo_area_api = reponse.json()
 
-        # We perform the same processing on the raw response as the function get_geographic_areas
-        for dico_area in list_geo_area_api:
-            dico_area['geoAreaName'] = '\n'.join(textwrap.wrap(dico_area['geoAreaName'], width=30))
-
-        # Check that the function returns the same data after processing
+        # Check that the function returns the raw data, names without line breaks
         assert get_geographic_areas() == list_geo_area_api
     else:
         # If the API does not respond correctly, we fail the test
@@ -81,7 +81,7 @@ def test_get_geographic_area_code():
 # Test of the function get_sdg_series
 def test_get_sdg_series():
     # Direct API call to retrieve the raw response
-    response = requests.get("https://unstats.un.org/sdgs/UNSDGAPIV5/v1/sdg/Indicator/List")
+    response = requests.get(sdg_client.build_url("Indicator/List"))
     list_indi_series = []
     nmerous = 0
 
@@ -93,7 +93,7 @@ def test_get_sdg_series():
             for series in indicator["series"]:
                 nmerous += 1
                 serie = {"Number": nmerous, "Series Code": series["code"],
-                         "Description": '\n'.join(textwrap.wrap(series["description"], 50)),
+                         "Description": series["description"],
                          "Goal": ", ".join(series["goal"]), "Targets": ", ".join(series["target"]),
                          "Indicators": ", ".join(series["indicator"]), "Version": series["release"]}
                 list_indi_series.append(serie)
@@ -110,15 +110,15 @@ def test_get_indicator_data():
     # We verify that the function fetch_indicator_data returns the same data as the API request for various
     # indicators and area codes.
     assert get_indicator_data('1.1.1', '204') == requests.get(
-        'https://unstats.un.org/sdgs/UNSDGAPIV5/v1/sdg/Indicator/Data?indicator=1.1.1&areaCode=204').json()
+        sdg_client.build_url("Indicator/Data") + "?indicator=1.1.1&areaCode=204").json()
     assert get_indicator_data('11.a.1', '732') == requests.get(
-        f'https://unstats.un.org/sdgs/UNSDGAPIV5/v1/sdg/Indicator/Data?indicator=11.a.1&areaCode=732').json()
+        sdg_client.build_url("Indicator/Data") + "?indicator=11.a.1&areaCode=732").json()
     assert get_indicator_data('3.2.1', '840') == requests.get(
-        f'https://unstats.un.org/sdgs/UNSDGAPIV5/v1/sdg/Indicator/Data?indicator=3.2.1&areaCode=840').json()
+        sdg_client.build_url("Indicator/Data") + "?indicator=3.2.1&areaCode=840").json()
     assert get_indicator_data('6.1.1', '340') == requests.get(
-        f'https://unstats.un.org/sdgs/UNSDGAPIV5/v1/sdg/Indicator/Data?indicator=6.1.1&areaCode=340').json()
+        sdg_client.build_url("Indicator/Data") + "?indicator=6.1.1&areaCode=340").json()
     assert get_indicator_data('15.2.1', '162') == requests.get(
-        f'https://unstats.un.org/sdgs/UNSDGAPIV5/v1/sdg/Indicator/Data?indicator=15.2.1&areaCode=162').json()
+        sdg_client.build_url("Indicator/Data") + "?indicator=15.2.1&areaCode=162").json()
 
 
 # Test of the function display_goals_and_targets
@@ -135,6 +135,8 @@ def test_display_goals_and_targets():
 
     if expected_data:
         # Create the expected output in table form using tabulate
+        # Titles get a line break every 20 characters only when displayed
+        expected_data = sdg_render.wrap_columns(expected_data, {"Goal Title": 20, "Target Title": 20})
         expected_output = "\nList of SDG Goals and Targets\n" + tabulate(expected_data, headers="keys",
                                                                              tablefmt="grid") + "\n"
 
@@ -161,6 +163,7 @@ def test_display_sdg_series():
 
     if expected_data:
         # Create the expected output in table form using tabulate
+        expected_data = sdg_render.wrap_columns(expected_data, {"Description": 50})
         expected_output = "\nList of SDG Series\n" + tabulate(expected_data, headers="keys", tablefmt="grid") + "\n"
 
         # Compare the captured output with the expected output
@@ -186,6 +189,7 @@ def test_display_geographic_areas():
 
     if expected_data:
         # Create the expected output in table form using tabulate
+        expected_data = sdg_render.wrap_columns(expected_data, {"geoAreaName": 30})
         expected_output = "\nList of SDG Geographic Areas\n" + tabulate(expected_data, headers="keys",
                                                                              tablefmt="grid") + "\n"
 
@@ -198,6 +202,23 @@ def test_display_geographic_areas():
     sys.stdout = sys.__stdout__
 
 
+# Test of the retrieval of every page of the data, through the menu and the CSV export
+def test_find_country_indicator_value_pages(monkeypatch, tmp_path, capsys):
+    monkeypatch.setattr(sdg_fixture_server, "DEFAULT_PAGE_SIZE", 10)  # 25 records on 3 pages
+    monkeypatch.setitem(sdg_cache.config, "enabled", False)
+    monkeypatch.chdir(tmp_path)
+    answers = iter(["Bulgaria", "1.1.1", "y", "n"])
+    monkeypatch.setattr(builtins, "input", lambda prompt="": next(answers))
+
+    data = get_indicator_data("1.1.1", "100")
+    assert len(data["data"]) == data["totalElements"] == 25
+
+    find_country_indicator_value()
+    assert capsys.readouterr().out.count("SI_POV_DAY1") >= 25
+    with open(tmp_path / "Bulgaria_1.1.1.csv", newline="", encoding="utf-8") as file:
+        assert len(list(csv.DictReader(file, delimiter=";"))) == 25
+
+
 if __name__ == '__main__':
     test_get_geographic_areas()
     test_get_indicator_data()
@@ -207,4 +228,3 @@ if __name__ == '__main__':
     test_display_sdg_series()
     test_display_geographic_areas()
     test_display_goals_and_targets()
-
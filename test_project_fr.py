@@ -1,8 +1,13 @@
 # Importation de toutes les fonctions et variables du module 'odd'
-# et de la bibliothèque 'requests', 'textwrap
+# et des bibliothèques 'requests', 'sdg_client', 'sdg_render'
 from project_fr import *
+import builtins
+import csv
 import requests
-import textwrap
+import sdg_cache
+import sdg_fixture_server
+import sdg_client
+import sdg_render
 import io
 import sys
 from tabulate import tabulate
@@ -11,7 +16,7 @@ from tabulate import tabulate
 # Test de la fonction recuperer_objectifs_et_cibles
 def test_recuperer_objectifs_et_cibles():
     # Appel direct à l'API pour récupérer la réponse brute
-    response = requests.get("https://unstats.un.org/sdgs/UNSDGAPIV5/v1/sdg/Goal/List?includechildren=true")
+    response = requests.get(sdg_client.build_url("Goal/List") + "?includechildren=true")
     list_goals_targets = []
 
     if response.status_code == 200:
@@ -25,10 +30,9 @@ def test_recuperer_objectifs_et_cibles():
                     numero += 1
                     dict["N°"] = numero
                     dict["Code objectif"] = goal["code"]
-                    dict["Titre objectif"] = '\n'.join(
-                        textwrap.wrap(goal["title"], width=20))  # Retour à la ligne tous les 20 caractères
+                    dict["Titre objectif"] = goal["title"]  # Les titres sont renvoyés sans retour à la ligne
                     dict["Code cible"] = target["code"]
-                    dict["Titre cible"] = '\n'.join(textwrap.wrap(target["title"], width=20))
+                    dict["Titre cible"] = target["title"]
                     list_goals_targets.append(dict)
 
             # Comparer les résultats de la fonction avec ceux traités localement
@@ -44,16 +48,12 @@ def test_recuperer_objectifs_et_cibles():
 # Test de la fonction recuperer_zones_geographiques
 def test_recuperer_zones_geographiques():
     # Appel direct à l'API pour récupérer la réponse brute
-    reponse = requests.get('https://unstats.un.org/sdgs/UNSDGAPIV5/v1/sdg/GeoArea/List')
+    reponse = requests.get(sdg_client.build_url("GeoArea/List"))
 
     if reponse.status_code == 200:
         list_geo_area_api = reponse.json()
 
-        # On effectue le même traitement sur la réponse brute que celui de la fonction 'recuperer_zones_geographiques'
-        for dico_area in list_geo_area_api:
-            dico_area['geoAreaName'] = '\n'.join(textwrap.wrap(dico_area['geoAreaName'], width=30))
-
-        # Vérification que la fonction retourne bien les mêmes données après traitement
+        # Vérification que la fonction retourne bien les données brutes, noms sans retour à la ligne
         assert recuperer_zones_geographiques() == list_geo_area_api
     else:
         # Si l'API ne répond pas correctement, on échoue le test
@@ -79,7 +79,7 @@ def test_recuperer_code_zone_geographique():
 # Test de la fonction recuperer_donnees_series_odd
 def test_recuperer_series_odd():
     # Appel direct à l'API pour récupérer la réponse brute
-    response = requests.get("https://unstats.un.org/sdgs/UNSDGAPIV5/v1/sdg/Indicator/List")
+    response = requests.get(sdg_client.build_url("Indicator/List"))
     list_indi_series = []
     numero = 0
 
@@ -111,15 +111,15 @@ def test_recuperer_series_odd():
 def test_recuperer_donnees_indicateur():
     # On vérifie que la fonction fetch_indicator_data renvoie les mêmes données que la requête API pour divers indicateurs et codes de zones.
     assert get_indicator_data('1.1.1', '204') == requests.get(
-        'https://unstats.un.org/sdgs/UNSDGAPIV5/v1/sdg/Indicator/Data?indicator=1.1.1&areaCode=204').json()
+        sdg_client.build_url("Indicator/Data") + "?indicator=1.1.1&areaCode=204").json()
     assert get_indicator_data('11.a.1', '732') == requests.get(
-        f'https://unstats.un.org/sdgs/UNSDGAPIV5/v1/sdg/Indicator/Data?indicator=11.a.1&areaCode=732').json()
+        sdg_client.build_url("Indicator/Data") + "?indicator=11.a.1&areaCode=732").json()
     assert get_indicator_data('3.2.1', '840') == requests.get(
-        f'https://unstats.un.org/sdgs/UNSDGAPIV5/v1/sdg/Indicator/Data?indicator=3.2.1&areaCode=840').json()
+        sdg_client.build_url("Indicator/Data") + "?indicator=3.2.1&areaCode=840").json()
     assert get_indicator_data('6.1.1', '340') == requests.get(
-        f'https://unstats.un.org/sdgs/UNSDGAPIV5/v1/sdg/Indicator/Data?indicator=6.1.1&areaCode=340').json()
+        sdg_client.build_url("Indicator/Data") + "?indicator=6.1.1&areaCode=340").json()
     assert get_indicator_data('15.2.1', '162') == requests.get(
-        f'https://unstats.un.org/sdgs/UNSDGAPIV5/v1/sdg/Indicator/Data?indicator=15.2.1&areaCode=162').json()
+        sdg_client.build_url("Indicator/Data") + "?indicator=15.2.1&areaCode=162").json()
 
 
 # Test de la fonction afficher_objectifs_et_cibles
@@ -136,6 +136,8 @@ def test_afficher_objectifs_et_cibles():
 
     if expected_data:
         # Créer la sortie attendue sous forme de tableau avec tabulate
+        # Les titres ont un retour à la ligne tous les 20 caractères uniquement à l'affichage
+        expected_data = sdg_render.wrap_columns(expected_data, {"Titre objectif": 20, "Titre cible": 20})
         expected_output = "\nListe des objectifs et cibles ODD\n" + tabulate(expected_data, headers="keys",
                                                                              tablefmt="grid") + "\n"
 
@@ -187,6 +189,7 @@ def test_afficher_zones_geographiques():
 
     if expected_data:
         # Créer la sortie attendue sous forme de tableau avec tabulate
+        expected_data = sdg_render.wrap_columns(expected_data, {"geoAreaName": 30})
         expected_output = "\nListe des zones géographiques ODD\n" + tabulate(expected_data, headers="keys",
                                                                              tablefmt="grid") + "\n"
 
@@ -199,6 +202,23 @@ def test_afficher_zones_geographiques():
     sys.stdout = sys.__stdout__
 
 
+# Test de la récupération de toutes les pages des données, par le menu et l'export CSV
+def test_trouver_valeur_indicateur_pays_pages(monkeypatch, tmp_path, capsys):
+    monkeypatch.setattr(sdg_fixture_server, "DEFAULT_PAGE_SIZE", 10)  # 25 enregistrements sur 3 pages
+    monkeypatch.setitem(sdg_cache.config, "enabled", False)
+    monkeypatch.chdir(tmp_path)
+    reponses = iter(["Bulgaria", "1.1.1", "y", "n"])
+    monkeypatch.setattr(builtins, "input", lambda prompt="": next(reponses))
+
+    donnees = get_indicator_data("1.1.1", "100")
+    assert len(donnees["data"]) == donnees["totalElements"] == 25
+
+    trouver_valeur_indicateur_pays()
+    assert capsys.readouterr().out.count("SI_POV_DAY1") >= 25
+    with open(tmp_path / "Bulgaria_1.1.1.csv", newline="", encoding="utf-8") as fichier:
+        assert len(list(csv.DictReader(fichier, delimiter=";"))) == 25
+
+
 if __name__ == '__main__':
     test_recuperer_zones_geographiques()
     test_recuperer_donnees_indicateur()
@@ -208,4 +228,3 @@ if __name__ == '__main__':
     test_afficher_series_odd()
     test_afficher_zones_geographiques()
     test_afficher_objectifs_et_cibles()
-
@@ -0,0 +1,118 @@
+# Importing the archive index and the CSV export
+import os
+import sdg_archive
+from sdg_export import export_records_to_csv
+
+
+# Records of two exports, with texts wrapped on several lines as in the first exports
+RECORDS = [{"goal": ["1"], "series": "SI_POV_DAY1", "seriesDescription": "Proportion of\npopulation",
+            "geoAreaCode": area_code, "timePeriodStart": float(year), "value": str(year - 2000),
+            "dimensions": {"Sex": "FEMALE"}}
+           for area_code in ["100", "442"] for year in range(2010, 2021)]
+OTHER_RECORDS = [{"series": "SH_STA_MORT", "geoAreaCode": "442", "timePeriodStart": 2015.0, "value": "6.4"}]
+
+
+# Function to write the exports of a test archive
+def make_archive(tmp_path):
+    export_records_to_csv(RECORDS, str(tmp_path / "Bulgaria_1.1.1.csv"))
+    os.makedirs(tmp_path / "old")
+    export_records_to_csv(OTHER_RECORDS, str(tmp_path / "old" / "Luxembourg_3.1.1.csv"))
+    (tmp_path / "notes.txt").write_text("not an export")
+
+
+# Test of the query of a series over years
+def test_query(tmp_path):
+    make_archive(tmp_path)
+    assert sdg_archive.update_index(str(tmp_path)) == {"indexed": 2, "unchanged": 0, "removed": 0,
+                                                        "rows": len(RECORDS) + 1}
+
+    rows = list(sdg_archive.query(str(tmp_path), series="SI_POV_DAY1", years=(2015, 2020)))
+    assert len(rows) == 12
+    assert rows[0]["seriesDescription"] == "Proportion of\npopulation"
+    assert rows[0]["dimensions"] == "{'Sex': 'FEMALE'}"
+    assert {row["timePeriodStart"] for row in rows} == {str(float(year)) for year in range(2015, 2021)}
+
+    rows = list(sdg_archive.query(str(tmp_path), area_codes=["442"], years=(2015, 2015)))
+    assert [row["series"] for row in rows] == ["SI_POV_DAY1", "SH_STA_MORT"]
+    assert list(sdg_archive.query(str(tmp_path), series="UNKNOWN")) == []
+
+
+# Test of the incremental update of the index
+def test_update_index(tmp_path):
+    make_archive(tmp_path)
+    sdg_archive.update_index(str(tmp_path))
+    assert sdg_archive.update_index(str(tmp_path))["unchanged"] == 2
+
+    # A modified file is indexed again and a deleted one is dropped
+    export_records_to_csv(RECORDS[:3], str(tmp_path / "Bulgaria_1.1.1.csv"))
+    os.remove(tmp_path / "old" / "Luxembourg_3.1.1.csv")
+    assert sdg_archive.update_index(str(tmp_path)) == {"indexed": 1, "unchanged": 0, "removed": 1, "rows": 3}
+    assert len(list(sdg_archive.query(str(tmp_path)))) == 3
+
+
+# Test of a query on files modified since they were indexed
+def test_query_modified_files(tmp_path):
+    make_archive(tmp_path)
+    sdg_archive.update_index(str(tmp_path))
+
+    # The stored offsets no longer match the new contents: the files are indexed again before being read
+    export_records_to_csv([dict(record, value="changed") for record in RECORDS[11:14]],
+                          str(tmp_path / "Bulgaria_1.1.1.csv"))
+    os.remove(tmp_path / "old" / "Luxembourg_3.1.1.csv")
+    rows = list(sdg_archive.query(str(tmp_path), area_codes=["442"]))
+    assert [(row["timePeriodStart"], row["value"]) for row in rows] == [("2010.0", "changed"), ("2011.0", "changed"),
+                                                                        ("2012.0", "changed")]
+    assert sdg_archive.update_index(str(tmp_path))["unchanged"] == 1
+
+
+# Test of the command line
+def test_main(tmp_path, capsys):
+    make_archive(tmp_path)
+    assert sdg_archive.main(["index", str(tmp_path)]) == 0
+    assert "2 files indexed" in capsys.readouterr().out
+    assert sdg_archive.main(["query", str(tmp_path), "--series", "SH_STA_MORT", "--format", "jsonl"]) == 0
+    assert '"value": "6.4"' in capsys.readouterr().out
+
+
+# Test of the function read_export
+def test_read_export(tmp_path):
+    records = [dict(record, seriesCount="10284", footnotes=["Estimate", "World Bank"], attributes={"Nature": "G"})
+               for record in RECORDS]
+    export_records_to_csv(records, str(tmp_path / "export.csv.gz"), compression="gzip")
+    assert list(sdg_archive.read_export(str(tmp_path / "export.csv.gz"))) == records
+
+    # Reprs are read as literals, never evaluated
+    assert sdg_archive.parse_literal("[__import__('os').getcwd()]") is None
+
+
+# Test of the cells holding lists and dictionaries
+def test_parse_collection():
+    # Names and values with spaces are kept whole in the exports written as they were displayed
+    assert sdg_archive.parse_collection("dimensions", "Reporting Type: G Age: 15\nto 24") == {
+        "Reporting Type": "G", "Age": "15 to 24"}
+    assert sdg_archive.parse_collection("dimensions", "Unknown name: x Sex: FEMALE") == {
+        "Unknown name": "x", "Sex": "FEMALE"}
+    assert sdg_archive.parse_collection("attributes", '{"Nature": null}') == {"Nature": None}
+
+    # Empty cells give the empty lists and dictionaries returned by the UN API
+    record = sdg_archive.parse_row({"series": "SI_POV_DAY1", "footnotes": "", "dimensions": "", "value": ""})
+    assert record == {"series": "SI_POV_DAY1", "footnotes": [], "dimensions": {}, "value": None}
+
+
+# Test of the exports written as they were displayed
+def test_read_export_displayed():
+    record = next(sdg_archive.read_export(os.path.join(os.path.dirname(__file__), "Bulgaria_1.1.1.csv")))
+    assert record["goal"] == ["1"] and record["timePeriodStart"] == 2006.0
+    assert record["dimensions"] == {"Age": "ALLAGE", "Location": "ALLAREA"}
+    assert record["attributes"] == {"Nature": "G"}
+    assert record["upperBound"] is None
+
+
+# Test of the function load_exports
+def test_load_exports(tmp_path):
+    make_archive(tmp_path)
+    observations = sdg_archive.load_exports([str(tmp_path)], processes=2)
+    assert observations == sdg_archive.load_exports([str(tmp_path)], processes=1)
+    assert len(observations) == len(RECORDS) + 1
+    assert observations[0].value == 10.0 and observations[0].geoAreaCode == 100
+    assert observations[-1].series == "SH_STA_MORT" and observations[-1].timePeriodStart == 2015
@@ -0,0 +1,141 @@
+# Importing the asynchronous client, the table builders of 'sdg_tables' and the libraries 'asyncio', 'pytest'
+import asyncio
+import threading
+import pytest
+import sdg_cache
+import sdg_client
+import sdg_fixture_server
+import sdg_store
+import sdg_tables
+
+httpx = pytest.importorskip("httpx")
+import sdg_async
+
+
+# Responses of a fake UN API
+GOALS = [{"code": "1", "title": "End poverty in all its forms everywhere",
+          "targets": [{"code": "1.1", "title": "By 2030, eradicate extreme poverty for all people everywhere"}]}]
+GEO_AREAS = [{"geoAreaCode": "204", "geoAreaName": "Benin"}, {"geoAreaCode": "792", "geoAreaName": "Türkiye"}]
+INDICATORS = [{"code": "1.1.1", "series": [{"code": "SI_POV_DAY1", "description": "Proportion of population",
+                                            "goal": ["1"], "target": ["1.1"], "indicator": ["1.1.1"],
+                                            "release": "2024.Q2.G.03"}]}]
+
+
+# Function answering the requests sent to the fake UN API
+def fake_api(request):
+    path = request.url.path
+    if path.endswith("Goal/List"):
+        return httpx.Response(200, json=GOALS)
+    if path.endswith("GeoArea/List"):
+        return httpx.Response(200, json=GEO_AREAS)
+    if path.endswith("Indicator/List"):
+        return httpx.Response(200, json=INDICATORS)
+    if path.endswith("Indicator/Data"):
+        return httpx.Response(200, json={"data": [{"indicator": [request.url.params["indicator"]],
+                                                   "geoAreaCode": request.url.params["areaCode"]}]})
+    return httpx.Response(404, text="Not found")
+
+
+# Test of the methods of AsyncSDGClient
+def test_async_client():
+    sdg_cache.configure(enabled=False)
+
+    async def run():
+        async with sdg_async.AsyncSDGClient(transport=httpx.MockTransport(fake_api)) as client:
+            # The asynchronous client returns the same shapes as the synchronous functions
+            assert await client.get_sdg_goals_and_targets() == sdg_tables.build_goals_and_targets(GOALS)
+            assert await client.get_sdg_series() == sdg_tables.build_sdg_series(INDICATORS)
+            assert await client.get_geographic_area_code("Turkey") == "792"
+            assert await client.get_geographic_area_code("Atlantis") is None
+
+            results = await client.get_many_indicator_data([("1.1.1", "204"), ("3.1.1", "792")])
+            assert [r["data"][0]["geoAreaCode"] for r in results] == ["204", "792"]
+
+    asyncio.run(run())
+    sdg_cache.configure(enabled=True)
+
+
+# Test of the disk cache of AsyncSDGClient, read and written outside of the event loop
+def test_async_client_cache(monkeypatch, tmp_path):
+    monkeypatch.setitem(sdg_cache.config, "enabled", True)
+    monkeypatch.setitem(sdg_cache.config, "directory", str(tmp_path / "cache"))
+    threads = []
+    for name in ["load", "store"]:
+        function = getattr(sdg_cache, name)
+        monkeypatch.setattr(sdg_cache, name, lambda *args, function=function: threads.append(
+            threading.current_thread()) or function(*args))
+
+    async def run():
+        async with sdg_async.AsyncSDGClient(transport=httpx.MockTransport(fake_api)) as client:
+            assert (await client.get("GeoArea/List")).json() == GEO_AREAS
+            assert (await client.get("GeoArea/List")).json() == GEO_AREAS
+
+    asyncio.run(run())
+    assert len(threads) == 3 and threading.main_thread() not in threads
+
+
+# Test of the offline mode of AsyncSDGClient
+def test_async_client_offline(monkeypatch, tmp_path):
+    monkeypatch.setitem(sdg_store.config, "path", str(tmp_path / "snapshot.sqlite"))
+    connection = sdg_store.connect()
+    sdg_store.save_catalog(connection, "GeoArea/List", GEO_AREAS)
+    sdg_store.save_catalog(connection, "Indicator/List", INDICATORS)
+    sdg_store.save_observations(connection, [{"indicator": ["1.1.1"], "series": "SI_POV_DAY1", "geoAreaCode": "204",
+                                              "timePeriodStart": 2015, "value": "12.5", "dimensions": {}}])
+    connection.commit()
+    connection.close()
+    monkeypatch.setitem(sdg_store.config, "offline", True)
+
+    # No request reaches the network: every answer comes from the snapshot
+    def no_network(request):
+        raise AssertionError(f"unexpected request to {request.url}")
+
+    async def run():
+        async with sdg_async.AsyncSDGClient(transport=httpx.MockTransport(no_network)) as client:
+            assert await client.get_geographic_area_code("Benin") == "204"
+            data = await client.get_indicator_data("1.1.1", "204")
+            assert [record["value"] for record in data["data"]] == ["12.5"]
+
+    asyncio.run(run())
+
+
+# Test of a trial request cancelled while the circuit is half-open
+def test_async_client_cancelled_trial(monkeypatch):
+    monkeypatch.setitem(sdg_cache.config, "enabled", False)
+    breaker = sdg_client.CircuitBreaker("GeoArea/List", threshold=1, reset=0)
+    breaker.record_failure()
+    monkeypatch.setitem(sdg_client._breakers, "GeoArea/List", breaker)
+
+    # The first request never gets an answer and is cancelled, as get_many_indicator_data cancels its siblings
+    async def answer_later(request):
+        await asyncio.Event().wait()
+
+    async def run():
+        async with sdg_async.AsyncSDGClient(transport=httpx.MockTransport(answer_later)) as client:
+            task = asyncio.ensure_future(client.get("GeoArea/List"))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+        assert not breaker.trial
+
+        # The next trial is let through instead of failing with CircuitOpenError forever
+        async with sdg_async.AsyncSDGClient(transport=httpx.MockTransport(fake_api)) as client:
+            assert (await client.get("GeoArea/List")).json() == GEO_AREAS
+
+    asyncio.run(run())
+
+
+# Test of the indicator data of several pages, against the fixture server
+def test_async_client_pages(monkeypatch):
+    monkeypatch.setattr(sdg_fixture_server, "DEFAULT_PAGE_SIZE", 10)  # 25 records on 3 pages
+    monkeypatch.setitem(sdg_cache.config, "enabled", False)
+
+    async def run():
+        async with sdg_async.AsyncSDGClient() as client:
+            return await client.get_indicator_data("1.1.1", "100")
+
+    # The asynchronous client returns every page, as the synchronous function does
+    data = asyncio.run(run())
+    assert len(data["data"]) == data["totalElements"] == 25
+    assert data == sdg_tables.get_indicator_data("1.1.1", "100")
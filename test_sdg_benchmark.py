@@ -0,0 +1,24 @@
+# Importing the benchmark module
+import sdg_benchmark
+
+
+# Test of the function make_records
+def test_make_records():
+    records = sdg_benchmark.make_records(120)
+    assert len(records) == 120
+    assert len({(record["geoAreaCode"], record["timePeriodStart"]) for record in records}) == 120
+
+
+# Test of the function main
+def test_main(tmp_path, capsys):
+    path = str(tmp_path / "results.jsonl")
+    arguments = ["--rows", "100", "--repeat", "1", "--stages", "parse", "export", "--results", path]
+    assert sdg_benchmark.main(arguments) == 0
+    assert sdg_benchmark.main(arguments) == 0
+
+    # Each run is appended to the results, and compared with the previous one
+    runs = sdg_benchmark.load_results(path)
+    assert len(runs) == 2
+    assert set(runs[1]["results"]["synthetic-100"]) == {"parse", "export"}
+    assert runs[1]["results"]["fixtures"]["export"]["peak_bytes"] > 0
+    assert "%" in capsys.readouterr().out
@@ -0,0 +1,36 @@
+# Importing the bulk module and the library 'requests'
+import sdg_bulk
+import sdg_client
+import requests
+
+
+# Test of the function split_in_chunks
+def test_split_in_chunks():
+    assert sdg_bulk.split_in_chunks([1, 2, 3, 4, 5], 2) == [[1, 2], [3, 4], [5]]
+    assert sdg_bulk.split_in_chunks([], 2) == []
+
+
+# Test of the query sent for several geographic areas
+def test_multiple_area_codes_query():
+    # The list of area codes is sent as repeated 'areaCode' parameters
+    request = requests.Request("GET", sdg_client.build_url("Indicator/Data"),
+                               params={"indicator": "1.1.1", "areaCode": ["100", "442"]}).prepare()
+    assert request.url.endswith("Indicator/Data?indicator=1.1.1&areaCode=100&areaCode=442")
+
+
+# Test of the function iter_indicator_data
+def test_iter_indicator_data(monkeypatch):
+    requested = []
+
+    def fake_get_indicator_data_for_areas(indicator_code, area_codes):
+        requested.append((indicator_code, tuple(area_codes)))
+        return [{"indicator": [indicator_code], "geoAreaCode": area_code} for area_code in area_codes]
+
+    monkeypatch.setattr(sdg_bulk, "get_indicator_data_for_areas", fake_get_indicator_data_for_areas)
+    records = sdg_bulk.get_indicator_panel(["1.1.1", "3.1.1"], ["4", "100", "204", "442", "840"],
+                                           max_workers=2, areas_per_request=2)
+
+    # 2 indicators x 3 groups of areas, every record comes back exactly once
+    assert len(requested) == 6
+    assert sorted((r["indicator"][0], r["geoAreaCode"]) for r in records) == sorted(
+        (indicator, area) for indicator in ["1.1.1", "3.1.1"] for area in ["4", "100", "204", "442", "840"])
@@ -0,0 +1,134 @@
+# Importing the cache and client modules and the library 'requests'
+import sdg_cache
+import sdg_client
+import os
+import time
+import requests
+
+
+# Function to point the cache at a temporary directory for the duration of a test
+def use_cache_directory(monkeypatch, directory, **settings):
+    monkeypatch.setitem(sdg_cache.config, "directory", str(directory))
+    for name, value in settings.items():
+        monkeypatch.setitem(sdg_cache.config, name, value)
+    monkeypatch.setattr(sdg_cache, "_size", None)
+    monkeypatch.setattr(sdg_cache, "_counted_at", 0.0)
+
+
+# Function to build a response as the UN API would send it
+def make_response(url: str, body: bytes, etag: str = None):
+    response = requests.Response()
+    response.status_code = 200
+    response.url = url
+    response._content = body
+    response.encoding = "utf-8"
+    response.headers["Content-Type"] = "application/json"
+    if etag:
+        response.headers["ETag"] = etag
+    return response
+
+
+# Test of the function make_key
+def test_make_key():
+    # The order of the parameters does not change the key, their values do
+    key = sdg_cache.make_key("http://api/Indicator/Data", {"indicator": "1.1.1", "areaCode": "204"})
+    assert key == sdg_cache.make_key("http://api/Indicator/Data", {"areaCode": "204", "indicator": "1.1.1"})
+    assert key != sdg_cache.make_key("http://api/Indicator/Data", {"indicator": "1.1.1", "areaCode": "840"})
+
+
+# Test of the functions store, load, is_fresh and conditional_headers
+def test_store_and_load(tmp_path, monkeypatch):
+    use_cache_directory(monkeypatch, tmp_path, ttl=60)
+    key = sdg_cache.make_key("http://api/GeoArea/List")
+    sdg_cache.store(key, make_response("http://api/GeoArea/List", b'[{"geoAreaCode": "4"}]', etag='"v1"'))
+
+    entry = sdg_cache.load(key)
+    assert entry["body"] == b'[{"geoAreaCode": "4"}]'
+    assert sdg_cache.is_fresh(entry)
+    assert sdg_cache.conditional_headers(entry) == {"If-None-Match": '"v1"'}
+    assert sdg_cache.build_response(entry).json() == [{"geoAreaCode": "4"}]
+
+    # Once the TTL is over, the entry must be revalidated
+    entry["stored_at"] = time.time() - 120
+    assert not sdg_cache.is_fresh(entry)
+    assert sdg_cache.load("missing") is None
+
+
+# Test of the function evict
+def test_evict(tmp_path, monkeypatch):
+    use_cache_directory(monkeypatch, tmp_path, max_size=10 ** 9)
+    for number in range(3):
+        key = sdg_cache.make_key(f"http://api/{number}")
+        sdg_cache.store(key, make_response(f"http://api/{number}", b"x" * 1000))
+        os.utime(sdg_cache.entry_path(key), (number, number))
+
+    # Only the most recently used entry fits in the new size
+    sdg_cache.configure(max_size=1500)
+    sdg_cache.evict()
+    assert sdg_cache.load(sdg_cache.make_key("http://api/0")) is None
+    assert sdg_cache.load(sdg_cache.make_key("http://api/1")) is None
+    assert sdg_cache.load(sdg_cache.make_key("http://api/2")) is not None
+
+
+# Test of the running size of the cache, which spares a listing of the cache on each write
+def test_running_size(tmp_path, monkeypatch):
+    use_cache_directory(monkeypatch, tmp_path, max_size=10 ** 9)
+    evictions = []
+    evict = sdg_cache.evict
+    monkeypatch.setattr(sdg_cache, "evict", lambda: evictions.append(1) or evict())
+
+    # Only the first write counts the cache on disk, the next ones add their size
+    for number in range(20):
+        sdg_cache.store(sdg_cache.make_key(f"http://api/{number}"), make_response(f"http://api/{number}", b"x" * 100))
+    assert len(evictions) == 1
+
+    # A write going over the limit evicts the oldest entries
+    sdg_cache.configure(max_size=sdg_cache._size + 50)
+    sdg_cache.store(sdg_cache.make_key("http://api/last"), make_response("http://api/last", b"x" * 100))
+    assert len(evictions) == 2
+    assert sdg_cache._size <= sdg_cache.config["max_size"]
+
+    # The entries written by another process are seen once the running size is old enough to be counted again
+    sdg_cache.configure(max_size=sdg_cache._size + 500)
+    with open(tmp_path / "other.cache", "wb") as file:
+        file.write(b"x" * 1000)
+    sdg_cache.store(sdg_cache.make_key("http://api/next"), make_response("http://api/next", b"x" * 100))
+    assert len(evictions) == 2
+    monkeypatch.setattr(sdg_cache, "_counted_at", time.time() - sdg_cache.RECOUNT_INTERVAL - 1)
+    sdg_cache.store(sdg_cache.make_key("http://api/again"), make_response("http://api/again", b"x" * 100))
+    assert len(evictions) == 3
+    assert sdg_cache._size <= sdg_cache.config["max_size"]
+
+
+# Test of the cache used by the function sdg_client.get
+def test_client_uses_cache(tmp_path, monkeypatch):
+    use_cache_directory(monkeypatch, tmp_path, ttl=60)
+    monkeypatch.setitem(sdg_client.config, "base_url", "http://127.0.0.1:9")  # Nothing listens on this port
+    url = sdg_client.build_url("Goal/List")
+    sdg_cache.store(sdg_cache.make_key(url, {"includechildren": "true"}), make_response(url, b'[{"code": "1"}]'))
+
+    # A fresh entry is returned without touching the network
+    response = sdg_client.get("Goal/List", params={"includechildren": "true"})
+    assert response.status_code == 200
+    assert response.json() == [{"code": "1"}]
+
+
+# Test of the revalidation of a stale entry by sdg_client.get with the ETag of the fixture server
+def test_client_revalidates(tmp_path, monkeypatch, fixture_server):
+    use_cache_directory(monkeypatch, tmp_path, ttl=60)
+    params = {"includechildren": "true"}
+    key = sdg_cache.make_key(sdg_client.build_url("Goal/List"), params)
+    body = sdg_client.get("Goal/List", params=params).content
+
+    # The entry is made stale and its body replaced, so only a 304 answer can return the replaced body
+    entry = sdg_cache.load(key)
+    assert entry["etag"]
+    entry["stored_at"] = 0
+    sdg_cache.write_entry(key, entry, b'[{"code": "cached"}]')
+    count = fixture_server.count("Goal/List")
+
+    response = sdg_client.get("Goal/List", params=params)
+    assert fixture_server.count("Goal/List") == count + 1
+    assert response.status_code == 200
+    assert response.json() == [{"code": "cached"}] and response.content != body
+    assert sdg_cache.is_fresh(sdg_cache.load(key))
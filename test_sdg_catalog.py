@@ -0,0 +1,76 @@
+# Importing the catalog module, the module 'project' and the libraries 'builtins', 'pytest'
+import builtins
+import pytest
+import project
+import sdg_cache
+import sdg_catalog
+import sdg_client
+
+
+# Indicators of the Indicator/List endpoint, with codes the former regular expression rejected
+INDICATORS = [{"code": code, "series": [{"code": f"SERIES_{number}", "description": f"Series {number}"}]}
+              for number, code in enumerate(["1.1.1", "1.a.1", "17.1.1", "17.1.2", "17.10.1", "17.19.2", "11.a.1"])]
+INDICATORS[0]["series"].append({"code": "SI_POV_EMP1", "description": "Employed population below the poverty line"})
+
+
+# Test of the prefix tree
+def test_code_trie():
+    trie = sdg_catalog.CodeTrie()
+    trie.insert("1.1.1", "1.1.1")
+    trie.insert("1.10.1", "1.10.1")
+    assert trie.get("1.1.1") == "1.1.1"
+    assert trie.get("1.1") is None and trie.get("2.1.1") is None
+    assert sorted(trie.complete("1.1")) == ["1.1.1", "1.10.1"]
+    assert trie.complete("3") == []
+
+
+# Test of the indicator catalog
+def test_indicator_catalog():
+    catalog = sdg_catalog.IndicatorCatalog(INDICATORS)
+    assert len(catalog) == 7
+    assert "17.19.2" in catalog and "17.19.3" not in catalog
+    assert catalog.get_code(" 1.A.1") == "1.a.1"
+    assert catalog.complete("17.1") == ["17.1.1", "17.1.2", "17.10.1", "17.19.2"]
+    assert catalog.complete("1.", limit=2) == ["1.1.1", "1.a.1"]
+    assert [series["code"] for series in catalog.get_series("1.1.1")] == ["SERIES_0", "SI_POV_EMP1"]
+    assert catalog.get_series("9.9.9") is None
+    assert catalog.get_series_code("si_pov_emp1") == "SI_POV_EMP1"
+    assert catalog.complete_series("SERIES_1") == ["SERIES_1"]
+
+
+# Test of the catalog downloaded from the Indicator list
+def test_get_indicator_catalog():
+    sdg_catalog.reset_indicator_catalog()
+    catalog = sdg_catalog.get_indicator_catalog()
+    assert "1.1.1" in catalog and "11.a.1" in catalog
+    assert sdg_catalog.get_indicator_catalog() is catalog
+
+
+# Test of the catalog when the Indicator list cannot be retrieved
+def test_get_indicator_catalog_error(fixture_server, monkeypatch):
+    monkeypatch.setitem(sdg_cache.config, "enabled", False)
+    monkeypatch.setitem(sdg_client.config, "retries", 0)
+    fixture_server.fail("Indicator/List", status=503, count=1)
+    sdg_catalog.reset_indicator_catalog()
+
+    # The error reaches the caller, and the next call downloads the list again
+    with pytest.raises(sdg_client.SDGAPIError) as error:
+        sdg_catalog.get_indicator_catalog()
+    assert error.value.status_code == 503
+    assert "1.1.1" in sdg_catalog.get_indicator_catalog()
+
+
+# Test of the validation of the codes typed in the menu
+def test_find_country_indicator_value(monkeypatch, capsys):
+    sdg_catalog.load_indicator_catalog(INDICATORS)
+    answers = iter(["Bulgaria", "1.1", "1.1.1", "n", "n"])
+    monkeypatch.setattr(builtins, "input", lambda prompt="": next(answers))
+    try:
+        project.find_country_indicator_value()
+    finally:
+        sdg_catalog.reset_indicator_catalog()
+
+    output = capsys.readouterr().out
+    assert "Unknown indicator code, did you mean: 1.1.1?" in output
+    assert "Series of indicator 1.1.1: SERIES_0, SI_POV_EMP1" in output
+    assert "Indicator No. 1.1.1 for Bulgaria (100)" in output
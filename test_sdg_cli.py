@@ -0,0 +1,112 @@
+# Importing the command-line module and the libraries 'csv', 'json'
+import csv
+import io
+import json
+import os
+import subprocess
+import sys
+import sdg_bulk
+import sdg_cli
+import sdg_geo
+import sdg_tables
+
+
+# Catalogs and records returned by the fetchers
+GOALS_TARGETS = ({"No.": 1, "Goal Code": "1", "Goal Title": "No poverty", "Target Code": "1.1", "Target Title": "A"},
+                 {"No.": 2, "Goal Code": "1", "Goal Title": "No poverty", "Target Code": "1.2", "Target Title": "B"},
+                 {"No.": 3, "Goal Code": "2", "Goal Title": "Zero hunger", "Target Code": "2.1", "Target Title": "C"})
+GEO_AREAS = [{"geoAreaCode": "100", "geoAreaName": "Bulgaria"}, {"geoAreaCode": "442", "geoAreaName": "Luxembourg"}]
+RECORDS = [{"series": "SI_POV_DAY1", "geoAreaCode": "100", "timePeriodStart": 2006.0, "value": "5.8",
+            "dimensions": {"Age": "ALLAGE"}},
+           {"series": "SI_POV_DAY1", "geoAreaCode": "442", "timePeriodStart": 2006.0, "value": "0.2",
+            "dimensions": {"Age": "ALLAGE"}}]
+
+
+# Function to replace the fetchers by the literal data above
+def use_literal_data(monkeypatch):
+    requests = []
+
+    def iter_indicator_data(indicator_codes, area_codes):
+        requests.append((indicator_codes, area_codes))
+        return iter(RECORDS)
+
+    monkeypatch.setattr(sdg_tables, "get_sdg_goals_and_targets", lambda: GOALS_TARGETS)
+    monkeypatch.setattr(sdg_geo, "get_geo_area_index", lambda: sdg_geo.GeoAreaIndex(GEO_AREAS))
+    monkeypatch.setattr(sdg_bulk, "iter_indicator_data", iter_indicator_data)
+    return requests
+
+
+# Test of the command goals
+def test_goals(monkeypatch, capsys):
+    use_literal_data(monkeypatch)
+    assert sdg_cli.main(["goals", "--goal", "1", "--format", "jsonl", "--offset", "1"]) == 0
+    rows = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [row["Target Code"] for row in rows] == ["1.2"]
+
+
+# Test of the command data
+def test_data(monkeypatch, capsys):
+    requests = use_literal_data(monkeypatch)
+
+    # Areas are given by code or by name, separated by commas
+    assert sdg_cli.main(["data", "--indicator", "1.1.1", "--area", "100,Luxembourg", "--format", "csv"]) == 0
+    rows = list(csv.DictReader(capsys.readouterr().out.splitlines(), delimiter=";"))
+    assert requests == [(["1.1.1"], ["100", "442"])]
+    assert [row["value"] for row in rows] == ["5.8", "0.2"]
+    assert rows[0]["dimensions"] == "{'Age': 'ALLAGE'}"
+
+    # An unknown area stops the command with an error status
+    assert sdg_cli.main(["data", "--indicator", "1.1.1", "--area", "Atlantis"]) == 2
+    assert "Atlantis" in capsys.readouterr().err
+
+    # So does an indicator missing from the Indicator list, with the codes it may have been meant as
+    assert sdg_cli.main(["data", "--indicator", "1.1", "--area", "100"]) == 2
+    assert "Unknown indicators: 1.1 (did you mean: 1.1.1?)" in capsys.readouterr().err
+
+    # A GeoArea list that cannot be retrieved is an error of the UN API, not of the arguments
+    monkeypatch.setattr(sdg_geo, "get_geo_area_index", lambda: None)
+    assert sdg_cli.main(["data", "--indicator", "1.1.1", "--area", "100"]) == 1
+    assert "GeoArea/List" in capsys.readouterr().err
+
+
+# Test of the CSV output of rows with different keys
+def test_write_csv():
+    rows = ({"a": i} if i % 2 else {"a": i, "b": [i]} for i in range(4))
+    output = io.StringIO()
+    assert sdg_cli.write_csv(rows, output) == 4
+    assert output.getvalue().splitlines() == ["a;b", "0;[0]", "1;", "2;[2]", "3;"]
+
+
+# Test of the command data for a series, years and dimensions
+def test_data_series(capsys):
+    arguments = ["data", "--series", "sh_sta_mort", "--area", "Luxembourg", "--years", "2019", "2020",
+                 "--dimension", "Sex=FEMALE", "--format", "jsonl"]
+    assert sdg_cli.main(arguments) == 0
+    rows = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [(row["series"], row["timePeriodStart"]) for row in rows] == [("SH_STA_MORT", 2019.0),
+                                                                         ("SH_STA_MORT", 2020.0)]
+
+    # The same filters apply to the data of an indicator
+    assert sdg_cli.main(["data", "--indicator", "3.1.1", "--area", "442", "--years", "2020", "2020",
+                         "--format", "jsonl"]) == 0
+    assert len(capsys.readouterr().out.splitlines()) == 1
+
+    assert sdg_cli.main(["data", "--series", "SH_STA_MORT", "--area", "442", "--dimension", "Sex"]) == 2
+    assert "Invalid dimension filter: Sex" in capsys.readouterr().err
+
+
+# Test of the command export
+def test_export(monkeypatch, tmp_path):
+    use_literal_data(monkeypatch)
+    path = str(tmp_path / "data.csv")
+    assert sdg_cli.main(["export", "--indicator", "1.1.1", "--area", "100", "442", "--output", path]) == 0
+
+    with open(path, newline="", encoding="utf-8") as file:
+        assert len(list(csv.DictReader(file, delimiter=";"))) == 2
+
+
+# Test that the command line does not import the interactive menu
+def test_no_menu_import():
+    # Running 'python project.py <command>' must not load project.py a second time as the module 'project'
+    code = "import sys, sdg_cli; sys.exit('project' in sys.modules)"
+    assert subprocess.run([sys.executable, "-c", code], cwd=os.path.dirname(os.path.abspath(sdg_cli.__file__))).returncode == 0
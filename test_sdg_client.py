@@ -0,0 +1,107 @@
+# Importing the client module and the libraries 'pytest', 'requests'
+import pytest
+import requests
+import sdg_cache
+import sdg_client
+
+
+# Test of the function build_url
+def test_build_url():
+    base_url = sdg_client.config["base_url"]
+    sdg_client.configure(base_url="http://localhost:8000/sdg/")
+    assert sdg_client.build_url("GeoArea/List") == "http://localhost:8000/sdg/GeoArea/List"
+    assert sdg_client.build_url("/Indicator/Data") == "http://localhost:8000/sdg/Indicator/Data"
+    sdg_client.configure(base_url=base_url)
+
+
+# Test of the function get_timeout
+def test_get_timeout():
+    # Each endpoint has its own timeout, unknown endpoints fall back to the default one
+    assert sdg_client.get_timeout("Indicator/Data") == sdg_client.DEFAULT_TIMEOUTS["Indicator/Data"]
+    assert sdg_client.get_timeout("Unknown/Endpoint") == sdg_client.config["default_timeout"]
+
+
+# Test of the function get_session
+def test_get_session():
+    # The same keep-alive session is returned on every call
+    session = sdg_client.get_session()
+    assert isinstance(session, requests.Session)
+    assert sdg_client.get_session() is session
+    assert "gzip" in session.headers["Accept-Encoding"]
+
+    # Changing the pool size rebuilds the session with a new adapter
+    sdg_client.configure(pool_maxsize=32)
+    new_session = sdg_client.get_session()
+    assert new_session is not session
+    assert new_session.get_adapter("https://unstats.un.org")._pool_maxsize == 32
+    sdg_client.configure(pool_maxsize=16)
+
+
+# Test of the function get_retry_delay
+def test_get_retry_delay():
+    # The Retry-After of the server is followed, up to the longest delay
+    assert sdg_client.get_retry_delay(0, "2") == 2
+    assert sdg_client.get_retry_delay(0, "3600") == sdg_client.config["backoff_max"]
+
+    # Otherwise the delay grows with the attempts, with jitter
+    for attempt in range(4):
+        assert 0 <= sdg_client.get_retry_delay(attempt) <= sdg_client.config["backoff_factor"] * 2 ** attempt
+
+
+# Test of the retries of the function send
+def test_retries(fixture_server, monkeypatch):
+    monkeypatch.setitem(sdg_cache.config, "enabled", False)
+    fixture_server.fail("Indicator/List", status=503, count=2, retry_after=0)
+    count = fixture_server.count("Indicator/List")
+
+    # Two errors then a success: the caller only sees the success
+    assert sdg_client.get("Indicator/List").status_code == 200
+    assert fixture_server.count("Indicator/List") == count + 3
+
+
+# Test of the circuit breaker
+def test_circuit_breaker(fixture_server, monkeypatch):
+    monkeypatch.setitem(sdg_cache.config, "enabled", False)
+    sdg_client.configure(retries=0, breaker_threshold=2, breaker_reset=60)
+    fixture_server.fail("Goal/List", status=503, count=2)
+
+    try:
+        for _ in range(2):
+            with pytest.raises(sdg_client.SDGAPIError) as error:
+                sdg_client.get("Goal/List")
+            assert error.value.status_code == 503
+
+        # After two failures the endpoint is no longer called, other endpoints still are
+        count = fixture_server.count("Goal/List")
+        with pytest.raises(sdg_client.CircuitOpenError):
+            sdg_client.get("Goal/List")
+        assert fixture_server.count("Goal/List") == count
+        assert sdg_client.get("GeoArea/List").status_code == 200
+    finally:
+        sdg_client.configure(retries=3, breaker_threshold=5, breaker_reset=30)
+
+
+# Test of a trial request failing with another request error than a network error
+def test_circuit_breaker_trial_error(monkeypatch):
+    breaker = sdg_client.CircuitBreaker("Indicator/List", threshold=1, reset=0)
+    breaker.record_failure()
+    monkeypatch.setitem(sdg_client._breakers, "Indicator/List", breaker)
+    monkeypatch.setitem(sdg_client.config, "retries", 0)
+
+    session = sdg_client.get_session()
+    session_get = session.get
+    calls = []
+
+    # The first response is cut in the middle of its body, the next ones are answered normally
+    def get_once_broken(*args, **kwargs):
+        calls.append(args)
+        if len(calls) == 1:
+            raise requests.exceptions.ChunkedEncodingError("Connection broken")
+        return session_get(*args, **kwargs)
+
+    # The failed trial is recorded, so the circuit lets the next trial through instead of staying stuck
+    monkeypatch.setattr(session, "get", get_once_broken)
+    with pytest.raises(sdg_client.SDGAPIError):
+        sdg_client.send("Indicator/List", sdg_client.build_url("Indicator/List"))
+    assert not breaker.trial
+    assert sdg_client.send("Indicator/List", sdg_client.build_url("Indicator/List")).status_code == 200
@@ -0,0 +1,105 @@
+# Importing the data module, the fixture server and the libraries 'json', 'pytest', 'time'
+import json
+import pytest
+import sdg_cache
+import sdg_client
+import sdg_data
+import sdg_fixture_server
+import time
+
+
+# Function to build a fake paginated endpoint of 'total' records
+def make_fake_get_page(total: int, requested: list):
+    def fake_get_page(endpoint, params, page, page_size=sdg_data.DEFAULT_PAGE_SIZE, offline=None,
+                      use_cache=True):
+        requested.append(page)
+        start = (page - 1) * page_size
+        return {
+            "totalElements": total,
+            "totalPages": -(-total // page_size),
+            "pageNumber": page,
+            "data": [{"value": str(n)} for n in range(start, min(start + page_size, total))],
+        }
+    return fake_get_page
+
+
+# Test of the function iter_records
+def test_iter_records(monkeypatch):
+    requested = []
+    monkeypatch.setattr(sdg_data, "get_page", make_fake_get_page(25, requested))
+
+    # Every page is read, with or without prefetch, and records keep their order
+    records = list(sdg_data.iter_records("Indicator/Data", {"indicator": "1.1.1"}, page_size=10))
+    assert [record["value"] for record in records] == [str(n) for n in range(25)]
+    assert requested == [1, 2, 3]
+
+    requested.clear()
+    records = list(sdg_data.iter_records("Indicator/Data", {"indicator": "1.1.1"}, page_size=10, prefetch=False))
+    assert len(records) == 25 and requested == [1, 2, 3]
+
+
+# Test of a page failing in the middle of the walk
+def test_iter_pages_error(fixture_server, monkeypatch):
+    monkeypatch.setattr(sdg_fixture_server, "DEFAULT_PAGE_SIZE", 10)
+    monkeypatch.setitem(sdg_cache.config, "enabled", False)
+    monkeypatch.setitem(sdg_client.config, "retries", 0)
+
+    # A later page is refused: the error reaches the caller instead of ending the walk as if it were complete
+    for prefetch in (False, True):
+        pages = sdg_data.iter_pages("Indicator/Data", {"indicator": "1.1.1", "areaCode": "100"}, page_size=10,
+                                    prefetch=prefetch)
+        assert len(next(pages)["data"]) == 10
+        fixture_server.fail("Indicator/Data", status=400, count=1)
+        with pytest.raises(sdg_client.SDGAPIError) as error:
+            list(pages)
+        assert error.value.status_code == 400
+
+
+# Test of the prefetch of the next page
+def test_iter_pages_prefetch(monkeypatch):
+    requested = []
+    monkeypatch.setattr(sdg_data, "get_page", make_fake_get_page(100, requested))
+
+    # The next page is requested before the caller asks for it
+    pages = sdg_data.iter_pages("Indicator/Data", {"indicator": "1.1.1"}, page_size=10)
+    first_page = next(pages)
+    assert first_page["pageNumber"] == 1
+    deadline = time.time() + 5
+    while 2 not in requested and time.time() < deadline:
+        time.sleep(0.01)
+    pages.close()
+    assert 2 in requested
+    assert len(requested) < 10
+
+
+# Test of the function build_series_params
+def test_build_series_params():
+    params = sdg_data.build_series_params("SI_POV_DAY1", ["100", "442"], (2018, 2020), {"Sex": "FEMALE"})
+    assert params["seriesCode"] == ["SI_POV_DAY1"] and params["areaCode"] == ["100", "442"]
+    assert params["timePeriod"] == ["2018", "2019", "2020"]
+    assert json.loads(params["dimensions"]) == [{"name": "Sex", "values": ["FEMALE"]}]
+    params = sdg_data.build_series_params(["SI_POV_DAY1", "SI_POV_EMP1"])
+    assert params == {"seriesCode": ["SI_POV_DAY1", "SI_POV_EMP1"]}
+
+
+# Test of the function iter_series_data
+def test_iter_series_data(fixture_server):
+    records = list(sdg_data.iter_series_data("SH_STA_MORT", "442", (2010, 2015), {"Sex": "FEMALE"}))
+    assert [record["timePeriodStart"] for record in records] == [float(year) for year in range(2010, 2016)]
+    assert {record["series"] for record in records} == {"SH_STA_MORT"}
+    assert "Series/Data?seriesCode=SH_STA_MORT" in fixture_server.requests[-1][1]
+
+    # Typed observations are built only for the records kept
+    observations = list(sdg_data.iter_series_observations("SH_STA_MORT", "442", dimensions={"Sex": "MALE"}))
+    assert observations == []
+
+
+# Test of the local filtering of the records a server did not filter
+def test_iter_series_data_local_filters(monkeypatch):
+    records = [{"series": series, "geoAreaCode": "100", "timePeriodStart": float(year), "dimensions": {"Sex": sex}}
+               for series in ["SI_POV_DAY1", "SI_POV_EMP1"] for year in range(2008, 2013) for sex in ["FEMALE", "MALE"]]
+    monkeypatch.setattr(sdg_data, "iter_records", lambda endpoint, params, page_size, prefetch: iter(records))
+
+    kept = list(sdg_data.iter_series_data("SI_POV_DAY1", "100", (2010, 2020), {"Sex": ["FEMALE"]}))
+    assert [(record["series"], record["timePeriodStart"], record["dimensions"]["Sex"]) for record in kept] == \
+        [("SI_POV_DAY1", float(year), "FEMALE") for year in range(2010, 2013)]
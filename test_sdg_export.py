@@ -0,0 +1,87 @@
+# Importing the export module and the libraries 'pytest', 'csv', 'gzip', 'os'
+import csv
+import gzip
+import os
+import pytest
+import sdg_export
+
+
+# Records as returned by the Indicator/Data endpoint
+RECORDS = [
+    {"goal": ["1"], "target": ["1.1"], "indicator": ["1.1.1"], "series": "SI_POV_DAY1", "geoAreaCode": "100",
+     "geoAreaName": "Bulgaria", "timePeriodStart": 2006.0, "value": "5.8", "upperBound": "", "footnotes": [],
+     "attributes": {"Nature": "G"}, "dimensions": {"Age": "ALLAGE", "Location": "ALLAREA"}},
+    {"goal": ["3"], "target": ["3.1"], "indicator": ["3.1.1"], "series": "SH_STA_MORT", "geoAreaCode": "442",
+     "geoAreaName": "Luxembourg", "timePeriodStart": 2000.0, "value": ">95", "upperBound": "13.26756",
+     "footnotes": ["Estimates"], "attributes": {"Nature": "E"}, "dimensions": {"Sex": "FEMALE"}},
+]
+
+
+# Test of the function flatten_record
+def test_flatten_record():
+    row = sdg_export.flatten_record(RECORDS[0])
+    assert row["value"] == 5.8 and row["value_text"] is None
+    assert row["timePeriodStart"] == 2006
+    assert row["upperBound"] is None
+    assert row["goal"] == ["1"]
+    assert row["dim_Age"] == "ALLAGE" and row["attr_Nature"] == "G"
+    assert "dimensions" not in row
+
+    # Values that are not numbers are kept as text
+    row = sdg_export.flatten_record(RECORDS[1])
+    assert row["value"] is None and row["value_text"] == ">95"
+
+
+# Test of the function export_to_parquet
+def test_export_to_parquet(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    sdg_export.export_to_parquet(RECORDS, str(tmp_path / "data.parquet"))
+    table = pq.read_table(str(tmp_path / "data.parquet"))
+
+    # The union of the dimensions gives the columns, missing values are empty
+    assert table.num_rows == 2
+    assert str(table.schema.field("value").type) == "double"
+    assert table.column("dim_Sex").to_pylist() == [None, "FEMALE"]
+    assert table.column("dim_Age").to_pylist() == ["ALLAGE", None]
+
+
+# Test of the function export_to_dataset
+def test_export_to_dataset(tmp_path):
+    pytest.importorskip("pyarrow")
+    directory = str(tmp_path / "dataset")
+
+    # Two pulls appended to the same dataset are read back together
+    sdg_export.export_to_dataset(RECORDS[:1], directory)
+    sdg_export.export_to_dataset(RECORDS[1:], directory)
+    table = sdg_export.read_dataset(directory)
+    assert sorted(table.column("series").to_pylist()) == ["SH_STA_MORT", "SI_POV_DAY1"]
+
+    # The dimensions of both pulls are kept and the area codes stay strings with their leading zeros
+    sdg_export.export_to_dataset([dict(RECORDS[0], geoAreaCode="008", geoAreaName="Albania")], directory)
+    table = sdg_export.read_dataset(directory).sort_by("timePeriodStart")
+    assert str(table.schema.field("geoAreaCode").type) == "string"
+    assert sorted(table.column("geoAreaCode").to_pylist()) == ["008", "100", "442"]
+    assert table.column("dim_Sex").to_pylist() == ["FEMALE", None, None]
+    assert table.column("dim_Age").to_pylist() == [None, "ALLAGE", "ALLAGE"]
+
+
+# Test of the function export_records_to_csv
+def test_export_records_to_csv(tmp_path):
+    path = str(tmp_path / "Benin_1.1.1.csv")
+    records = (dict(record) for record in RECORDS)  # Any iterator of records can be exported
+    assert sdg_export.export_records_to_csv(records, path) == 2
+
+    with open(path, newline="", encoding="utf-8") as file:
+        rows = list(csv.DictReader(file, delimiter=";"))
+
+    # The columns are the union of the keys, values are written as they are
+    assert rows[0]["value"] == "5.8"
+    assert rows[1]["footnotes"] == "['Estimates']"
+    assert rows[1]["dimensions"] == "{'Sex': 'FEMALE'}"
+    assert os.listdir(str(tmp_path)) == ["Benin_1.1.1.csv"]
+
+    # Records with keys missing from the first one keep their values
+    sdg_export.export_records_to_csv([{"series": "A"}, {"series": "B", "extra": "x"}], path, compression="gzip")
+    with gzip.open(path, "rt", newline="", encoding="utf-8") as file:
+        rows = list(csv.DictReader(file, delimiter=";"))
+    assert rows == [{"series": "A", "extra": ""}, {"series": "B", "extra": "x"}]
@@ -0,0 +1,62 @@
+# Importing the fixture server and the libraries 'requests', 'time'
+import requests
+import sdg_data
+import sdg_fixture_server
+import time
+
+
+# Test of the pagination of the Indicator/Data endpoint
+def test_pagination(fixture_server):
+    url = fixture_server.url + "/Indicator/Data"
+
+    # Without pageSize, the server answers 25 records per page like the UN API
+    page = requests.get(url, params={"indicator": "1.1.1", "areaCode": "100"}).json()
+    assert page["totalElements"] == 25 and page["totalPages"] == 1 and len(page["data"]) == 25
+
+    # The client follows the pages of the server
+    count = fixture_server.count("Indicator/Data")
+    records = list(sdg_data.iter_indicator_data("3.1.1", "442", page_size=10))
+    assert [record["timePeriodStart"] for record in records] == [float(year) for year in range(2000, 2021)]
+    assert fixture_server.count("Indicator/Data") == count + 3
+
+
+# Test of the filters of the Series/Data endpoint
+def test_series_data(fixture_server):
+    url = fixture_server.url + "/Series/Data"
+    params = {"seriesCode": "SH_STA_MORT", "timePeriod": ["2019", "2020"],
+              "dimensions": '[{"name": "Sex", "values": ["FEMALE"]}]'}
+    page = requests.get(url, params=params).json()
+    assert [record["timePeriodStart"] for record in page["data"]] == [2019.0, 2020.0]
+
+    params["dimensions"] = '[{"name": "Sex", "values": ["MALE"]}]'
+    assert requests.get(url, params=params).json()["totalElements"] == 0
+
+
+# Test of the catalogs and of the conditional requests
+def test_catalogs(fixture_server):
+    response = requests.get(fixture_server.url + "/Goal/List", params={"includechildren": "true"})
+    assert len(response.json()) == 17 and "targets" in response.json()[0]
+    assert "targets" not in requests.get(fixture_server.url + "/Goal/List").json()[0]
+
+    # An unchanged response is answered with 304 Not Modified
+    again = requests.get(fixture_server.url + "/Goal/List", params={"includechildren": "true"},
+                         headers={"If-None-Match": response.headers["ETag"]})
+    assert again.status_code == 304
+    assert requests.get(fixture_server.url + "/Series/Unknown").status_code == 404
+
+
+# Test of the simulated errors and latency
+def test_errors_and_latency():
+    with sdg_fixture_server.FixtureServer(latency=0.05) as server:
+        server.fail("GeoArea/List", status=429, count=2, retry_after=1)
+        responses = [requests.get(server.url + "/GeoArea/List") for _ in range(3)]
+        assert [response.status_code for response in responses] == [429, 429, 200]
+        assert responses[0].headers["Retry-After"] == "1"
+
+        start = time.perf_counter()
+        requests.get(server.url + "/GeoArea/List")
+        assert time.perf_counter() - start >= 0.05
+
+    # With an error rate of 1, every request fails
+    with sdg_fixture_server.FixtureServer(error_rate=1.0, seed=0) as server:
+        assert requests.get(server.url + "/Indicator/List").status_code == 503
@@ -0,0 +1,67 @@
+# Importing the frame module and the libraries 'pytest', 'math'
+import math
+import pytest
+import sdg_fixture_server
+import sdg_frame
+
+np = pytest.importorskip("numpy")
+
+
+# Records of two areas for the same series, and a series split by sex
+RECORDS = ([{"series": "SI_POV_DAY1", "geoAreaCode": code, "geoAreaName": name, "timePeriodStart": float(year),
+             "value": str(value), "dimensions": {"Age": "ALLAGE"}}
+            for code, name, values in [("100", "Bulgaria", [5.8, 1.8]), ("442", "Luxembourg", [0.2, 0.4])]
+            for year, value in zip([2006, 2007], values)]
+           + [{"series": "SH_STA_MORT", "geoAreaCode": "442", "geoAreaName": "Luxembourg", "timePeriodStart": 2000.0,
+               "value": ">95", "dimensions": {"Sex": sex}} for sex in ["FEMALE", "MALE"]])
+
+
+# Test of the method IndicatorFrame.from_records
+def test_from_records():
+    frame = sdg_frame.IndicatorFrame.from_records(sdg_fixture_server.load_fixture("Indicator/Data"))
+    assert len(frame) == 46
+    assert frame["value"].dtype == np.float64 and frame["timePeriodStart"].dtype == np.int64
+    assert frame["dim_Sex"][-1] == "FEMALE" and frame["dim_Sex"][0] is None
+
+
+# Test of the methods filter and pivot
+def test_filter_and_pivot():
+    frame = sdg_frame.IndicatorFrame.from_records(RECORDS)
+    assert len(frame.filter(Sex="FEMALE")) == 1
+    assert len(frame.filter(geoAreaCode=["100", "442"], years=(2007, 2010))) == 2
+
+    # One row per area and series, one column per year
+    wide = frame.filter(series="SI_POV_DAY1").pivot()
+    assert wide.to_records()[0]["geoAreaName"] == "Bulgaria"
+    assert wide["2006"].tolist() == [5.8, 0.2] and wide["2007"].tolist() == [1.8, 0.4]
+
+
+# Test of the method pivot with several values per cell and rows without a year
+def test_pivot_duplicates():
+    records = RECORDS[:4] + [dict(RECORDS[0], value="7.8"), dict(RECORDS[1], timePeriodStart=None)]
+    frame = sdg_frame.IndicatorFrame.from_records(records)
+
+    # Two values of Bulgaria in 2006: the caller chooses how to combine them
+    with pytest.raises(ValueError):
+        frame.pivot()
+    wide = frame.pivot(how="mean")
+    assert list(wide.columns) == ["geoAreaCode", "geoAreaName", "series", "dim_Age", "2006", "2007"]
+    assert wide["2006"].tolist() == [pytest.approx(6.8), 0.2] and wide["2007"].tolist() == [1.8, 0.4]
+    assert frame.pivot(how="max")["2006"].tolist() == [7.8, 0.2]
+
+    # The row without a year is left out
+    wide = sdg_frame.IndicatorFrame.from_records(records[:4] + records[5:]).pivot()
+    assert wide["2007"].tolist() == [1.8, 0.4] and len(wide.columns) == 6
+
+
+# Test of the method aggregate
+def test_aggregate():
+    frame = sdg_frame.IndicatorFrame.from_records(RECORDS)
+    rows = frame.aggregate(how="mean").to_records()
+
+    # Values are aggregated across areas, values that are not numbers are left out
+    assert rows[0]["series"] == "SH_STA_MORT" and rows[0]["count"] == 0 and math.isnan(rows[0]["mean"])
+    assert rows[1]["timePeriodStart"] == 2006 and rows[1]["mean"] == pytest.approx(3.0)
+    assert frame.aggregate(how="max")["max"].tolist()[1:] == [5.8, 1.8]
+    with pytest.raises(ValueError):
+        frame.aggregate(how="median")
@@ -0,0 +1,45 @@
+# Importing the geographic area index module
+import sdg_geo
+
+
+# Small extract of the GeoArea list returned by the UN API
+GEO_AREAS = [
+    {"geoAreaCode": "4", "geoAreaName": "Afghanistan"},
+    {"geoAreaCode": "204", "geoAreaName": "Benin"},
+    {"geoAreaCode": "384", "geoAreaName": "Côte d'Ivoire"},
+    {"geoAreaCode": "792", "geoAreaName": "Türkiye"},
+    {"geoAreaCode": "840", "geoAreaName": "United States of America"},
+]
+
+
+# Test of the function fold_name
+def test_fold_name():
+    assert sdg_geo.fold_name("  Côte   d’Ivoire ") == "cote d'ivoire"
+    assert sdg_geo.fold_name("TÜRKIYE") == sdg_geo.fold_name("turkiye")
+
+
+# Test of the method GeoAreaIndex.get_code
+def test_get_code():
+    index = sdg_geo.GeoAreaIndex(GEO_AREAS)
+
+    # Exact names, names in any case or without accents, codes and aliases are all resolved
+    assert index.get_code("Benin") == "204"
+    assert index.get_code("  united states OF america ") == "840"
+    assert index.get_code("Cote d'Ivoire") == "384"
+    assert index.get_code("Turkey") == "792"
+    assert index.get_code("Türkiye") == "792"
+    assert index.get_code("004") == "4"
+    assert index.get_code(840) == "840"
+
+    # Unknown names, and aliases of areas missing from the list, are not resolved
+    assert index.get_code("Atlantis") is None
+    assert index.get_code("Russia") is None
+    assert "Benin" in index and "Atlantis" not in index
+
+
+# Test of the method GeoAreaIndex.get_name
+def test_get_name():
+    index = sdg_geo.GeoAreaIndex(GEO_AREAS)
+    assert index.get_name("USA") == "United States of America"
+    assert index.get_name("204") == "Benin"
+    assert index.get_name("Atlantis") is None
@@ -0,0 +1,63 @@
+# Importing the prefetch module, the client modules and the libraries 'json', 'pytest'
+import json
+import pytest
+import sdg_cache
+import sdg_catalog
+import sdg_client
+import sdg_geo
+import sdg_prefetch
+
+
+# Fixture enabling the prefetching with a warm-start file of the test, and forgetting the catalogs it loads
+@pytest.fixture
+def warm_start_path(tmp_path, monkeypatch):
+    path = str(tmp_path / "warm_start.json")
+    monkeypatch.setitem(sdg_prefetch.config, "enabled", True)
+    monkeypatch.setitem(sdg_prefetch.config, "path", path)
+    sdg_prefetch.reset()
+    sdg_geo.reset_geo_area_index()
+    sdg_catalog.reset_indicator_catalog()
+    yield path
+    sdg_prefetch.reset()
+    sdg_geo.reset_geo_area_index()
+    sdg_catalog.reset_indicator_catalog()
+
+
+# Test of the preloading of the catalogs and of the warm-start file
+def test_start(warm_start_path):
+    sdg_prefetch.start().join()
+    assert "1.1.1" in sdg_catalog.get_indicator_catalog()
+    assert sdg_geo.get_geo_area_index().get_code("Bulgaria") == "100"
+
+    with open(warm_start_path, encoding="utf-8") as file:
+        catalogs = json.load(file)["catalogs"]
+    assert set(catalogs) == set(sdg_prefetch.CATALOGS)
+    assert catalogs["Goal/List"][0]["code"] == "1"
+
+
+# Test of the warm start, which answers before the downloads end
+def test_load_warm_start(tmp_path, monkeypatch):
+    path = str(tmp_path / "warm_start.json")
+    sdg_prefetch.save_warm_start({"GeoArea/List": [{"geoAreaCode": "100", "geoAreaName": "Bulgaria"}],
+                                  "Indicator/List": [{"code": "1.1.1", "series": []}]}, path)
+    assert set(sdg_prefetch.load_warm_start(path)) == {"GeoArea/List", "Indicator/List"}
+
+    # A file saved for another server is ignored
+    monkeypatch.setitem(sdg_client.config, "base_url", "http://localhost:1/v1/sdg")
+    assert sdg_prefetch.load_warm_start(path) == {}
+
+    # A missing or broken file is ignored
+    (tmp_path / "broken.json").write_text("{")
+    assert sdg_prefetch.load_warm_start(str(tmp_path / "broken.json")) == {}
+    assert sdg_prefetch.load_warm_start(str(tmp_path / "missing.json")) == {}
+
+
+# Test of the prefetching when the UN API is down
+def test_start_unavailable(warm_start_path, fixture_server, monkeypatch):
+    sdg_prefetch.save_warm_start({"GeoArea/List": [{"geoAreaCode": "999", "geoAreaName": "Warm Land"}]},
+                                 warm_start_path)
+    monkeypatch.setitem(sdg_cache.config, "enabled", False)
+    monkeypatch.setitem(sdg_client.config, "retries", 0)
+    fixture_server.fail("GeoArea/List", count=1)
+    sdg_prefetch.start().join()
+    assert sdg_geo.get_geo_area_index().get_code("Warm Land") == "999"
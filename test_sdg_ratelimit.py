@@ -0,0 +1,64 @@
+# Importing the rate limiter module and the libraries 'multiprocessing', 'os'
+import multiprocessing
+import os
+import sdg_ratelimit
+
+
+# Function run in another process to take tokens from a bucket
+def reserve_tokens(path: str, count: int):
+    bucket = sdg_ratelimit.TokenBucket(rate=1, burst=4, path=path)
+    for _ in range(count):
+        bucket.reserve()
+
+
+# Test of the method TokenBucket.reserve
+def test_reserve(tmp_path):
+    bucket = sdg_ratelimit.TokenBucket(rate=1, burst=2, path=str(tmp_path / "bucket.state"))
+
+    # The burst goes through at once, then each request waits for its own token
+    assert [bucket.reserve() for _ in range(2)] == [0.0, 0.0]
+    delays = [bucket.reserve() for _ in range(2)]
+    assert 0.5 < delays[0] <= 1 and 1.5 < delays[1] <= 2
+
+
+# Test of the bucket shared by several processes
+def test_shared_bucket(tmp_path):
+    path = str(tmp_path / "bucket.state")
+    process = multiprocessing.get_context("spawn").Process(target=reserve_tokens, args=(path, 3))
+    process.start()
+    process.join()
+
+    # Another process took 3 of the 4 tokens, so only one is left here
+    bucket = sdg_ratelimit.TokenBucket(rate=1, burst=4, path=path)
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() > 0.5
+
+
+# Test of the function get_bucket
+def test_get_bucket(tmp_path):
+    rate, directory = sdg_ratelimit.config["rate"], sdg_ratelimit.config["directory"]
+    sdg_ratelimit.configure(rate=10, directory=str(tmp_path))
+    try:
+        assert sdg_ratelimit.get_bucket("http://127.0.0.1:8000/v1/sdg") is sdg_ratelimit.get_bucket("http://127.0.0.1:8000/x")
+        sdg_ratelimit.configure(rate=0)
+        assert sdg_ratelimit.get_bucket("http://127.0.0.1:8000/v1/sdg") is None
+    finally:
+        sdg_ratelimit.configure(rate=rate, directory=directory)
+
+
+# Test of the state files kept in a directory that does not exist yet or cannot be written
+def test_state_directory(tmp_path, monkeypatch):
+    monkeypatch.setitem(sdg_ratelimit.config, "directory", str(tmp_path / "missing"))
+    monkeypatch.setattr(sdg_ratelimit, "_buckets", {})
+
+    # The per-user directory is created with the first bucket
+    bucket = sdg_ratelimit.get_bucket("http://127.0.0.1:8000/v1/sdg")
+    assert bucket.reserve() == 0.0
+    assert os.path.dirname(bucket.path) == sdg_ratelimit.get_state_directory()
+    assert os.path.exists(bucket.path)
+
+    # A state file that cannot be opened leaves the limit to the bucket of the process
+    (tmp_path / "file").write_text("not a directory")
+    bucket = sdg_ratelimit.TokenBucket(rate=1, burst=1, path=str(tmp_path / "file" / "bucket.state"))
+    assert bucket.reserve() == 0.0 and bucket.path is None
+    assert bucket.reserve() > 0.5
@@ -0,0 +1,45 @@
+# Importing the record model and the fixture server
+import sdg_fixture_server
+import sdg_data
+import sdg_records
+
+
+# Test of the methods Observation.from_dict and Observation.to_dict
+def test_round_trip():
+    records = sdg_fixture_server.load_fixture("Indicator/Data")
+    observations = sdg_records.from_records(records)
+
+    # Numbers are parsed once, and the dictionaries of the UN API can be rebuilt as they were
+    assert observations[0].value == 5.8 and observations[0].timePeriodStart == 2006
+    assert observations[0].geoAreaCode == 100
+    assert list(sdg_records.to_records(observations)) == records
+
+    # Repeated texts and lists are stored once
+    assert observations[0].source is observations[1].source
+    assert observations[0].dimensions is observations[1].dimensions
+
+
+# Test of the bound of the shared tuples
+def test_share_tuple():
+    assert sdg_records.share_tuple(["1.1", "1.2"]) is sdg_records.share_tuple(("1.1", "1.2"))
+
+    # Loading many distinct values never keeps more than SHARED_VALUES_SIZE tuples
+    for number in range(sdg_records.SHARED_VALUES_SIZE + 10):
+        sdg_records.share_tuple({"Age": str(number)})
+    assert sdg_records.shared_value.cache_info().currsize == sdg_records.SHARED_VALUES_SIZE
+
+
+# Test of the values that are not numbers
+def test_value_text():
+    observation = sdg_records.Observation.from_dict({"series": "SH_STA_MORT", "geoAreaCode": "442",
+                                                     "timePeriodStart": 2000.0, "value": ">95", "newKey": 1})
+    assert observation.value is None and observation.value_text == ">95"
+    assert observation.to_dict()["value"] == ">95" and observation.to_dict()["newKey"] == 1
+    assert not hasattr(observation, "__dict__")
+
+
+# Test of the function sdg_data.iter_indicator_observations
+def test_iter_indicator_observations():
+    observations = list(sdg_data.iter_indicator_observations("3.1.1", "442"))
+    assert len(observations) == 21
+    assert observations[0].upperBound == 13.26756
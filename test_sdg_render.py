@@ -0,0 +1,73 @@
+# Importing the render module and the libraries 'io', 'textwrap'
+import io
+import sdg_render
+import textwrap
+
+
+# Test of the function wrap_text
+def test_wrap_text():
+    title = "End poverty in all its forms everywhere"
+    assert sdg_render.wrap_text(title, 20) == '\n'.join(textwrap.wrap(title, width=20))
+
+    # The second call with the same text and width comes from the cache
+    hits = sdg_render.wrap_text.cache_info().hits
+    sdg_render.wrap_text(title, 20)
+    assert sdg_render.wrap_text.cache_info().hits == hits + 1
+
+
+# Test of the function wrap_columns
+def test_wrap_columns():
+    rows = [{"Goal Code": "1", "Goal Title": "End poverty in all its forms everywhere"}]
+    wrapped_rows = sdg_render.wrap_columns(rows, {"Goal Title": 20})
+
+    # Only the display copy gets line breaks, the data keeps its raw values
+    assert wrapped_rows[0]["Goal Title"] == "End poverty in all\nits forms everywhere"
+    assert rows[0]["Goal Title"] == "End poverty in all its forms everywhere"
+    assert sdg_render.wrap_columns(None, {"Goal Title": 20}) is None
+
+
+# Test of the function wrap_indicator_data
+def test_wrap_indicator_data():
+    record = {"seriesDescription": "Proportion of population below international poverty line (%)",
+              "source": "Poverty and Inequality Portal, World Bank", "footnotes": ["Accessed March 26, 2024."],
+              "dimensions": {"Age": "ALLAGE", "Location": "ALLAREA"}}
+    display_record = sdg_render.wrap_indicator_data([record])[0]
+    assert display_record["dimensions"] == "Age: ALLAGE\nLocation:\nALLAREA"
+    assert display_record["footnotes"] == "Accessed March 26,\n2024."
+    assert record["dimensions"] == {"Age": "ALLAGE", "Location": "ALLAREA"}
+
+
+# Test of the function select_rows
+def test_select_rows():
+    rows = [{"Goal": "1", "Targets": "1.1, 1.2"}, {"Goal": "1, 10", "Targets": "10.1"}, {"Goal": "2", "Targets": "2.1"}]
+
+    # A goal matches one of the comma-separated values, not a prefix ('1' does not match '10')
+    assert list(sdg_render.select_rows(rows, {"Goal": "1"})) == rows[:2]
+    assert list(sdg_render.select_rows(rows, {"Goal": "10", "Targets": None})) == rows[1:2]
+    assert list(sdg_render.select_rows(rows, {"Targets": "1.2"})) == rows[:1]
+    assert list(sdg_render.select_rows(rows, limit=1, offset=1)) == rows[1:2]
+
+
+# Test of the function stream_table
+def test_stream_table():
+    rows = [{"Code": "1", "Title": "End poverty in all its forms everywhere"}, {"Code": "2", "Title": "Zero hunger"}]
+    output = io.StringIO()
+
+    # Without a terminal, the table is written whole, without pauses
+    assert sdg_render.stream_table(iter(rows), page_size=1, max_width=20, output=output) == 2
+    lines = output.getvalue().splitlines()
+    assert lines[0] == "+------+----------------------+"
+    assert lines[1] == "| Code | Title                |"
+    assert lines[3] == "| 1    | End poverty in all   |"
+    assert lines[4] == "|      | its forms everywhere |"
+    assert lines[-2] == "| 2    | Zero hunger          |"
+    assert sdg_render.stream_table([], output=output) == 0
+
+    # A key missing from the sample adds a column from the row where it appears
+    output = io.StringIO()
+    rows.append({"Code": "3", "Title": "Good health", "Note": "new"})
+    assert sdg_render.stream_table(iter(rows), sample_size=2, max_width=20, output=output) == 3
+    lines = output.getvalue().splitlines()
+    assert lines[-5:] == ["+------+----------------------+------+", "| Code | Title                | Note |",
+                          "+======+======================+======+", "| 3    | Good health          | new  |",
+                          "+------+----------------------+------+"]
@@ -0,0 +1,58 @@
+# Importing the single flight module and the libraries 'threading', 'time'
+import threading
+import time
+import project
+import sdg_cache
+import sdg_singleflight
+
+
+# Function running a function from several threads at the same time
+def run_concurrently(function, count: int):
+    results = [None] * count
+    start = threading.Barrier(count)
+
+    def run(number):
+        start.wait()
+        results[number] = function()
+
+    threads = [threading.Thread(target=run, args=(number,)) for number in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+# Test of the method SingleFlight.do
+def test_do():
+    group = sdg_singleflight.SingleFlight()
+    calls = []
+
+    def slow_call():
+        calls.append(1)
+        time.sleep(0.2)
+        return {"code": "1"}
+
+    # Concurrent callers of the same key share one call and its result
+    results = run_concurrently(lambda: group.do("key", slow_call), 5)
+    assert len(calls) == 1 and group.shared == 4
+    assert all(result is results[0] for result in results)
+
+    # Once the call is over, the function runs again
+    group.do("key", slow_call)
+    assert len(calls) == 2
+
+
+# Test of the deduplication of the requests of the fetchers
+def test_fetchers_share_requests(fixture_server, monkeypatch):
+    monkeypatch.setitem(sdg_cache.config, "enabled", False)
+    monkeypatch.setattr(fixture_server, "latency", 0.2)
+    count = fixture_server.count("GeoArea/List")
+
+    results = run_concurrently(project.get_geographic_areas, 8)
+    assert fixture_server.count("GeoArea/List") == count + 1
+    assert all(result == results[0] for result in results) and len(results[0]) > 0
+
+    # The request is shared by sdg_client.get, but every caller parses its own copy of the answer
+    results[0].clear()
+    assert all(len(result) > 0 for result in results[1:])
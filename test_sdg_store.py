@@ -0,0 +1,143 @@
+# Importing the snapshot module and the functions of 'project'
+import sdg_store
+import sdg_data
+import sdg_geo
+from project import get_indicator_data, get_geographic_area_code, get_sdg_series
+
+
+# Catalogs and records of a small snapshot
+GEO_AREAS = [{"geoAreaCode": "100", "geoAreaName": "Bulgaria"}, {"geoAreaCode": "442", "geoAreaName": "Luxembourg"}]
+INDICATORS = [{"code": "1.1.1", "series": [{"code": "SI_POV_DAY1", "description": "Proportion of population",
+                                            "goal": ["1"], "target": ["1.1"], "indicator": ["1.1.1"],
+                                            "release": "2024.Q2.G.03"}]}]
+RECORDS = [{"indicator": ["1.1.1"], "series": "SI_POV_DAY1", "geoAreaCode": area_code, "timePeriodStart": year,
+            "value": str(year - 2000), "dimensions": {"Age": "ALLAGE", "Location": "ALLAREA"}}
+           for area_code in ["100", "442"] for year in range(2006, 2021)]
+
+
+# Function to fill a snapshot in a temporary directory and switch to offline mode
+def make_snapshot(tmp_path):
+    sdg_store.configure(offline=True, path=str(tmp_path / "snapshot.sqlite"))
+    connection = sdg_store.connect()
+    sdg_store.save_catalog(connection, "GeoArea/List", GEO_AREAS)
+    sdg_store.save_catalog(connection, "Indicator/List", INDICATORS)
+    sdg_store.save_observations(connection, RECORDS)
+    connection.commit()
+    connection.close()
+    sdg_geo.reset_geo_area_index()
+
+
+# Test of the function save_observations
+def test_save_observations(tmp_path):
+    connection = sdg_store.connect(str(tmp_path / "snapshot.sqlite"))
+    assert sdg_store.save_observations(connection, RECORDS) == len(RECORDS)
+
+    # Saving the same records again updates them instead of adding duplicates, records without a year included
+    undated = [dict(RECORDS[0], timePeriodStart=None)]
+    sdg_store.save_observations(connection, RECORDS + undated)
+    sdg_store.save_observations(connection, RECORDS + undated)
+    assert connection.execute("SELECT COUNT(*) FROM observations").fetchone()[0] == len(RECORDS) + 1
+
+
+# Test of the opening of a snapshot made before records without a year had a key
+def test_connect_old_snapshot(tmp_path):
+    path = str(tmp_path / "snapshot.sqlite")
+    connection = sdg_store.sqlite3.connect(path)
+    connection.execute("""CREATE TABLE observations (series TEXT NOT NULL, geoAreaCode TEXT NOT NULL,
+                          timePeriodStart REAL, dimensions TEXT NOT NULL, record TEXT NOT NULL,
+                          UNIQUE (series, geoAreaCode, timePeriodStart, dimensions))""")
+    connection.executemany("INSERT INTO observations VALUES ('SI_POV_DAY1', '100', NULL, '{}', ?)", [("1",), ("2",)])
+    connection.commit()
+    connection.close()
+
+    # The copies are dropped, keeping the last one, and the records are upserted from then on
+    connection = sdg_store.connect(path)
+    assert connection.execute("SELECT record FROM observations").fetchall() == [("2",)]
+    sdg_store.save_observations(connection, [{"series": "SI_POV_DAY1", "geoAreaCode": "100"}])
+    assert connection.execute("SELECT COUNT(*) FROM observations").fetchone()[0] == 1
+    connection.close()
+
+
+# Test of the offline mode of the fetchers
+def test_offline_mode(tmp_path):
+    make_snapshot(tmp_path)
+    try:
+        assert get_geographic_area_code("Luxembourg") == "442"
+        assert get_sdg_series()[0]["Series Code"] == "SI_POV_DAY1"
+
+        data = get_indicator_data("1.1.1", "442")
+        assert data["totalElements"] == 15
+        assert [record["timePeriodStart"] for record in data["data"]] == list(range(2006, 2021))
+
+        # Pages and multi-area queries are served as the UN API would
+        records = list(sdg_data.iter_indicator_data("1.1.1", ["100", "442"], page_size=4))
+        assert len(records) == 30
+        assert get_indicator_data("3.1.1", "442")["data"] == []
+
+        # Series queries are filtered in the snapshot as well
+        records = list(sdg_data.iter_series_data("SI_POV_DAY1", "100", (2015, 2016), {"Age": "ALLAGE"}))
+        assert [record["value"] for record in records] == ["15", "16"]
+        assert list(sdg_data.iter_series_data("SI_POV_DAY1", "100", dimensions={"Age": "Y15T24"})) == []
+    finally:
+        sdg_store.configure(offline=False)
+        sdg_geo.reset_geo_area_index()
+
+
+# Test of the function sync
+def test_sync(tmp_path, monkeypatch):
+    requests = []
+    get = sdg_store.sdg_client.get
+
+    def recording_get(endpoint, params=None, use_cache=True, offline=None):
+        requests.append((endpoint, use_cache))
+        return get(endpoint, params, use_cache, offline)
+
+    # The data pages are always downloaded again, never taken from the disk cache
+    monkeypatch.setattr(sdg_store.sdg_client, "get", recording_get)
+    assert sdg_store.sync(["1.1.1"], ["100"], str(tmp_path / "snapshot.sqlite")) == 25
+    assert ("Indicator/Data", False) in requests and ("Indicator/Data", True) not in requests
+
+
+# Test of the function refresh
+def test_refresh(tmp_path, monkeypatch):
+    path = str(tmp_path / "snapshot.sqlite")
+    catalog = [{"code": "1.1.1", "series": [
+        {"code": "SI_POV_DAY1", "indicator": ["1.1.1"], "release": "2024.Q1.G.01"},
+        {"code": "SI_POV_EMP1", "indicator": ["1.1.1"], "release": "2024.Q1.G.01"}]}]
+    connection = sdg_store.connect(path)
+    sdg_store.save_catalog(connection, "Indicator/List", catalog)
+    sdg_store.save_observations(connection, RECORDS)
+    connection.execute("INSERT INTO synced_indicators VALUES ('1.1.1', '[\"100\", \"442\"]')")
+    sdg_store.save_series_releases(connection, sdg_store.get_series_releases(catalog), ["SI_POV_DAY1", "SI_POV_EMP1"])
+    connection.commit()
+    connection.close()
+
+    # Only SI_POV_DAY1 has a new release in the live catalog
+    catalog[0]["series"][0]["release"] = "2024.Q2.G.03"
+    requested = []
+
+    # The refresh asks the UN API for each request, without switching the whole process out of offline mode
+    monkeypatch.setitem(sdg_store.config, "offline", True)
+
+    def fake_get(endpoint, params=None, use_cache=True, offline=None):
+        assert offline is False and sdg_store.config["offline"]
+        return sdg_store.build_response(endpoint, 200, catalog)
+
+    def fake_iter_records(endpoint, params, page_size=sdg_data.DEFAULT_PAGE_SIZE, prefetch=True, offline=None,
+                          use_cache=True):
+        assert offline is False and use_cache is False and sdg_store.config["offline"]
+        requested.append((endpoint, params))
+        return [dict(RECORDS[0], value="99")]
+
+    monkeypatch.setattr(sdg_store.sdg_client, "get", fake_get)
+
+    monkeypatch.setattr(sdg_store.sdg_data, "iter_records", fake_iter_records)
+    assert sdg_store.refresh(path) == {"SI_POV_DAY1": 1}
+    assert requested == [("Series/Data", {"seriesCode": "SI_POV_DAY1", "areaCode": ["100", "442"]})]
+
+    # The changed record is updated in place and the new release is recorded
+    connection = sdg_store.connect(path)
+    assert connection.execute("SELECT COUNT(*) FROM observations").fetchone()[0] == len(RECORDS)
+    assert connection.execute("SELECT release FROM series_releases WHERE series = 'SI_POV_DAY1'").fetchone()[0] \
+        == "2024.Q2.G.03"
+    assert sdg_store.refresh(path) == {}